@@ -0,0 +1,90 @@
+"""This file is part of DING0, the DIstribution Network GeneratOr.
+DING0 is a tool to generate synthetic medium and low voltage power
+distribution grids based on open data.
+
+It is developed in the project open_eGo: https://openegoproject.wordpress.com
+
+DING0 lives at github: https://github.com/openego/ding0/
+The documentation is available on RTD: http://ding0.readthedocs.io
+
+Benchmark of :func:`~.grid.lv_grid.graph_processing.build_graph_from_ways`
+on a synthetic street grid of about 100k segments. Ways are exploded into
+segments which are added in both directions at once, this is compared to
+adding every segment to an undirected graph and converting it by
+:meth:`networkx.MultiGraph.to_directed`.
+
+Run with::
+
+    python benchmarks/bench_build_graph_from_ways.py
+"""
+
+__copyright__  = "Reiner Lemoine Institut gGmbH"
+__license__    = "GNU Affero General Public License Version 3 (AGPL-3.0)"
+__url__        = "https://github.com/openego/ding0/blob/master/LICENSE"
+__author__     = "nesnoj, gplssm"
+
+
+import time
+
+import networkx as nx
+import numpy as np
+import pandas as pd
+
+from ding0.config.config_lv_grids_osm import get_config_osm
+from ding0.grid.lv_grid.graph_processing import build_graph_from_ways
+
+
+def street_grid_ways(n=224, spacing=50.):
+    """Returns ways along rows and columns of a grid of `n` x `n` nodes,
+    neighboring ways of 2 * n * (n - 1) segments in total share nodes at
+    crossings"""
+    rows = []
+    for i in range(n):
+        for way in (i * n + np.arange(n), i + n * np.arange(n)):
+            coords = np.column_stack([way // n, way % n]) * spacing
+            rows.append((len(rows), way.tolist(), coords, 'residential',
+                         [spacing] * (n - 1)))
+    return pd.DataFrame(rows, columns=['osm_id', 'nodes', 'geometry',
+                                       'highway', 'length_segments'])
+
+
+def build_graph_per_edge(ways_df):
+    """Builds graph as before adding every segment on its own"""
+    graph = nx.MultiGraph()
+    graph.graph["crs"] = 'epsg:' + str(get_config_osm('srid'))
+    graph.graph["source"] = 'osm'
+    for _, osm_id, nodes, geometry, highway, length_segments \
+            in ways_df.itertuples():
+        for ix in range(len(nodes) - 1):
+            graph.add_edge(nodes[ix], nodes[ix + 1],
+                           length=length_segments[ix], osmid=osm_id,
+                           highway=highway)
+        for node, (x, y) in zip(nodes, geometry):
+            graph.nodes[node]['x'] = x
+            graph.nodes[node]['y'] = y
+            graph.nodes[node]['node_type'] = 'non_synthetic'
+    return graph.to_directed()
+
+
+def main(number=3):
+    ways_df = street_grid_ways()
+    print('{} ways, {} segments'.format(
+        len(ways_df), ways_df.length_segments.map(len).sum()))
+
+    graphs = []
+    for func in (build_graph_per_edge, build_graph_from_ways):
+        durations = []
+        for _ in range(number):
+            start = time.perf_counter()
+            graph = func(ways_df)
+            durations.append(time.perf_counter() - start)
+        graphs.append(graph)
+        print('{:<24} {:6.2f} s'.format(func.__name__, min(durations)))
+
+    assert list(graphs[0].nodes(data=True)) == list(graphs[1].nodes(data=True))
+    assert list(graphs[0].edges(keys=True, data=True)) == \
+        list(graphs[1].edges(keys=True, data=True))
+
+
+if __name__ == '__main__':
+    main()
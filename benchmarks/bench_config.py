@@ -0,0 +1,75 @@
+"""This file is part of DING0, the DIstribution Network GeneratOr.
+DING0 is a tool to generate synthetic medium and low voltage power
+distribution grids based on open data.
+
+It is developed in the project open_eGo: https://openegoproject.wordpress.com
+
+DING0 lives at github: https://github.com/openego/ding0/
+The documentation is available on RTD: http://ding0.readthedocs.io
+
+Micro-benchmark of config access: parsing via :func:`get` compared to the
+typed config snapshot used in the hot paths (e.g.
+:meth:`~.grid.mv_grid.models.models.Route.tech_constraints_satisfied`).
+
+Run with::
+
+    python benchmarks/bench_config.py
+"""
+
+__copyright__  = "Reiner Lemoine Institut gGmbH"
+__license__    = "GNU Affero General Public License Version 3 (AGPL-3.0)"
+__url__        = "https://github.com/openego/ding0/blob/master/LICENSE"
+__author__     = "nesnoj, gplssm"
+
+
+import timeit
+
+from ding0.tools import config as cfg_ding0
+
+# options read by Route.tech_constraints_satisfied() per call
+OPTIONS = [
+    ('mv_routing', 'load_area_count_per_ring'),
+    ('mv_routing', 'max_half_ring_length'),
+    ('assumptions', 'load_factor_mv_cable_lc_normal'),
+    ('assumptions', 'load_factor_mv_cable_lc_malfunc'),
+    ('mv_routing_tech_constraints', 'mv_max_v_level_lc_diff_normal'),
+    ('mv_routing_tech_constraints', 'mv_max_v_level_lc_diff_malfunc'),
+    ('assumptions', 'cos_phi_load'),
+    ('assumptions', 'cos_phi_load_mode'),
+]
+
+
+def parse_options():
+    """Reads all options by parsing the raw config, as done before the
+    snapshot existed"""
+    return [cfg_ding0._cast(section, key) for section, key in OPTIONS]
+
+
+def get_options():
+    return [cfg_ding0.get(section, key) for section, key in OPTIONS]
+
+
+def snapshot_options():
+    cfg = cfg_ding0.snapshot()
+    return [cfg.mv_routing.load_area_count_per_ring,
+            cfg.mv_routing.max_half_ring_length,
+            cfg.assumptions.load_factor_mv_cable_lc_normal,
+            cfg.assumptions.load_factor_mv_cable_lc_malfunc,
+            cfg.mv_routing_tech_constraints.mv_max_v_level_lc_diff_normal,
+            cfg.mv_routing_tech_constraints.mv_max_v_level_lc_diff_malfunc,
+            cfg.assumptions.cos_phi_load,
+            cfg.assumptions.cos_phi_load_mode]
+
+
+def main(number=100000):
+    cfg_ding0.load_config('config_calc.cfg')
+    assert parse_options() == get_options() == snapshot_options()
+
+    for func in (parse_options, get_options, snapshot_options):
+        duration = min(timeit.repeat(func, number=number, repeat=3))
+        print('{:<18} {:8.3f} us per call'.format(
+            func.__name__, duration / number * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""This file is part of DING0, the DIstribution Network GeneratOr.
+DING0 is a tool to generate synthetic medium and low voltage power
+distribution grids based on open data.
+
+It is developed in the project open_eGo: https://openegoproject.wordpress.com
+
+DING0 lives at github: https://github.com/openego/ding0/
+The documentation is available on RTD: http://ding0.readthedocs.io
+
+Micro-benchmark of memory and attribute access of the node and branch
+classes created in large numbers by
+:func:`~.grid.lv_grid.graph_processing.transform_graph_to_ding0_graph`.
+Attributes of these classes are stored in `__slots__`, they are compared to
+objects holding the same attributes in their `__dict__`.
+
+Run with::
+
+    python benchmarks/bench_object_memory.py
+"""
+
+__copyright__  = "Reiner Lemoine Institut gGmbH"
+__license__    = "GNU Affero General Public License Version 3 (AGPL-3.0)"
+__url__        = "https://github.com/openego/ding0/blob/master/LICENSE"
+__author__     = "nesnoj, gplssm"
+
+
+import timeit
+import tracemalloc
+
+from shapely.geometry import Point
+
+from ding0.core.network import BranchDing0, GeneratorDing0
+from ding0.core.network.cable_distributors import LVCableDistributorDing0
+from ding0.core.network.loads import LVLoadDing0
+from ding0.core.network.stations import LVStationDing0
+
+CLASSES = [
+    (BranchDing0, dict(length=100., kind='cable', num_parallel=1)),
+    (LVLoadDing0, dict(peak_load=10., string_id=1, load_no=1)),
+    (LVCableDistributorDing0, dict(string_id=1, load_no=1)),
+    (GeneratorDing0, dict(capacity=10., type='solar', v_level=7)),
+    (LVStationDing0, dict(osm_id_node=1)),
+]
+
+
+class DictObject:
+    """Object holding all attributes in its `__dict__`"""
+
+
+def slots(cls):
+    return [name for base in cls.__mro__
+            for name in base.__dict__.get('__slots__', ())
+            if name != '__dict__']
+
+
+def traced_memory(func, number):
+    """Returns objects created by `func` and memory per object in bytes"""
+    tracemalloc.start()
+    objects = [func(i) for i in range(number)]
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return objects, memory / number
+
+
+def as_dict_object(obj):
+    dict_object = DictObject()
+    for name in slots(type(obj)):
+        if hasattr(obj, name):
+            setattr(dict_object, name, getattr(obj, name))
+    return dict_object
+
+
+def main(number=20000):
+    geo_data = Point(0, 0)
+    for cls, kwargs in CLASSES:
+        attribute = next(iter(kwargs))
+        template = cls(id_db=0, geo_data=geo_data, **kwargs)
+
+        results = []
+        for func in (lambda i: as_dict_object(template),
+                     lambda i: cls(id_db=0, geo_data=geo_data, **kwargs)):
+            objects, memory = traced_memory(func, number)
+            duration = min(timeit.repeat(
+                lambda: [getattr(o, attribute) for o in objects],
+                number=10, repeat=3))
+            results.append((memory, duration / 10 / number * 1e9))
+
+        print('{:<24} {:4.0f} -> {:4.0f} bytes, {:5.1f} -> {:5.1f} ns '
+              'per attribute access'.format(
+            cls.__name__, results[0][0], results[1][0],
+            results[0][1], results[1][1]))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+"""This file is part of DING0, the DIstribution Network GeneratOr.
+DING0 is a tool to generate synthetic medium and low voltage power
+distribution grids based on open data.
+
+It is developed in the project open_eGo: https://openegoproject.wordpress.com
+
+DING0 lives at github: https://github.com/openego/ding0/
+The documentation is available on RTD: http://ding0.readthedocs.io
+
+Benchmark of MV power flow calculated per grid district compared to batches
+of grid districts solved as one problem, see
+:func:`~.ding0.tools.pypsa_io.run_powerflow_batch`.
+
+Grid districts are taken from pickled networks as written by
+:func:`~.ding0.tools.results.save_nd_to_pickle`. Run with::
+
+    python benchmarks/bench_powerflow_batch.py ding0_grids_*.pkl --districts 100
+"""
+
+__copyright__  = "Reiner Lemoine Institut gGmbH"
+__license__    = "GNU Affero General Public License Version 3 (AGPL-3.0)"
+__url__        = "https://github.com/openego/ding0/blob/master/LICENSE"
+__author__     = "nesnoj, gplssm"
+
+
+import argparse
+import time
+
+import numpy as np
+
+from ding0.tools.results import load_nd_from_pickle
+
+
+def load_network(filenames, districts):
+    """Returns network containing the first `districts` MV grid districts
+    of the pickled networks"""
+    nd = None
+    for filename in filenames:
+        nd_file = load_nd_from_pickle(filename=filename)
+        grid_districts = list(nd_file.mv_grid_districts())
+        if nd is None:
+            nd = nd_file
+            nd._mv_grid_districts = []
+        for grid_district in grid_districts:
+            if len(nd._mv_grid_districts) < districts:
+                nd.add_mv_grid_district(grid_district)
+    if nd is None or len(nd._mv_grid_districts) < districts:
+        raise ValueError('Pickles contain less than {} MV grid '
+                         'districts.'.format(districts))
+    return nd
+
+
+def collect_results(nd):
+    """Returns voltages of nodes and apparent power of branches of all MV
+    grids"""
+    voltages = {}
+    s_res = {}
+    for grid_district in nd.mv_grid_districts():
+        for node in grid_district.mv_grid.graph.nodes():
+            if hasattr(node, 'voltage_res'):
+                voltages[node] = node.voltage_res
+        for edge in grid_district.mv_grid.graph_edges():
+            s_res[edge['branch']] = edge['branch'].s_res
+    return voltages, s_res
+
+
+def run(nd, method, batch_size):
+    # export of grids closes circuit breakers, open them for each run
+    nd.control_circuit_breakers(mode='open')
+    start = time.perf_counter()
+    nd.run_powerflow(method=method, batch_size=batch_size)
+    duration = time.perf_counter() - start
+    return duration, collect_results(nd)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[2])
+    parser.add_argument('pickles', nargs='+',
+                        help='pickled ding0 networks')
+    parser.add_argument('--districts', type=int, default=100,
+                        help='number of MV grid districts')
+    parser.add_argument('--batch-sizes', type=int, nargs='+',
+                        default=[10, 100], help='batch sizes to compare')
+    parser.add_argument('--method', default='onthefly',
+                        choices=['onthefly', 'radial'])
+    args = parser.parse_args()
+
+    nd = load_network(args.pickles, args.districts)
+    print('{} MV grid districts, method {}'.format(args.districts,
+                                                   args.method))
+
+    duration, (voltages, s_res) = run(nd, args.method, None)
+    print('{:<16} {:8.2f} s'.format('per district', duration))
+    for batch_size in args.batch_sizes:
+        duration, (voltages_batch, s_res_batch) = run(nd, args.method,
+                                                      batch_size)
+        max_diff_v = max(np.abs(np.subtract(voltages_batch[node],
+                                            voltage)).max()
+                         for node, voltage in voltages.items())
+        max_diff_s = max(np.abs(np.subtract(s_res_batch[branch], s)).max()
+                         for branch, s in s_res.items())
+        print('{:<16} {:8.2f} s   max. deviation v {:.1e} p.u., '
+              's {:.1e} MVA'.format('batch of {}'.format(batch_size),
+                                    duration, max_diff_v, max_diff_s))
+
+
+if __name__ == '__main__':
+    main()
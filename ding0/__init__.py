@@ -14,7 +14,6 @@ __author__     = "nesnoj, gplssm"
 
 
 import numpy
-from psycopg2.extensions import register_adapter, AsIs
 
 
 # TODO: (Maybe) move to more general place (ego.io repo)
@@ -37,7 +36,24 @@ def adapt_numpy_int64(numpy_int64):
     
     .. [#] http://initd.org/psycopg/docs/advanced.html#adapting-new-python-types-to-sql-syntax
     """
+    from psycopg2.extensions import AsIs
+
     return AsIs(numpy_int64)
 
 
-register_adapter(numpy.int64, adapt_numpy_int64)
\ No newline at end of file
+def register_numpy_adapter():
+    """Registers :func:`adapt_numpy_int64` with psycopg2.
+
+    psycopg2 is imported on first database access instead of on import of
+    ding0, processes that do not touch the database never load it. Repeated
+    calls do nothing.
+    """
+    global _numpy_adapter_registered
+    if not _numpy_adapter_registered:
+        from psycopg2.extensions import register_adapter
+
+        register_adapter(numpy.int64, adapt_numpy_int64)
+        _numpy_adapter_registered = True
+
+
+_numpy_adapter_registered = False
@@ -4,6 +4,30 @@ parameterized by load profiles.
 
 """
 
+# built once at import, get_config_osm() is called in tight loops
+_CONFIG_OSM = {
+    'srid' : 3035,
+    'EARTH_RADIUS_M' : 6_371_009,  # deprecated!? not mandatory anymore?!
+    'lv_threshold_capacity' : 100,      # < 100kW connected to grid
+    'mv_lv_threshold_capacity' : 200,   # 100 to < 200kW connected to station directly
+    'hv_mv_threshold_capacity' : 5500,  # 200 to < 5.5MW own station with trafos
+    'additional_trafo_capacity' : 1.0,
+    'avg_trafo_size' : 500,
+    'avg_square_meters' : 100,
+    'quadrat_width' : 1000,
+    'dist_edge_segments' : 50,
+    'cluster_increment_counter_threshold' : 20,
+    'ons_dist_threshold' : 1500,
+    'min_detour_length': 100,
+    'max_detour_factor': 3,
+    'buffer_distance' : (5, 25, 50, 100),
+    'unconn_nodes_ratio' : 0.02,
+    'major_ccs_ratio_threshold' : .30,
+    'get_fully_conn_graph_number_max_it' : 4,
+    'diversity_factor_not_residential' : 0.6,
+}
+
+
 def get_config_osm(key):
     
     """
@@ -24,30 +48,7 @@ def get_config_osm(key):
 
     """
 
-    config_osm = {
-        
-        'srid' : 3035,
-        'EARTH_RADIUS_M' : 6_371_009,  # deprecated!? not mandatory anymore?!
-        'lv_threshold_capacity' : 100,      # < 100kW connected to grid
-        'mv_lv_threshold_capacity' : 200,   # 100 to < 200kW connected to station directly
-        'hv_mv_threshold_capacity' : 5500,  # 200 to < 5.5MW own station with trafos
-        'additional_trafo_capacity' : 1.0,
-        'avg_trafo_size' : 500,
-        'avg_square_meters' : 100,
-        'quadrat_width' : 1000,
-        'dist_edge_segments' : 50,
-        'cluster_increment_counter_threshold' : 20,
-        'ons_dist_threshold' : 1500,
-        'min_detour_length': 100,
-        'max_detour_factor': 3,
-        'buffer_distance' : [5, 25, 50, 100],
-        'unconn_nodes_ratio' : 0.02,
-        'major_ccs_ratio_threshold' : .30,
-        'get_fully_conn_graph_number_max_it' : 4,
-        'diversity_factor_not_residential' : 0.6,
-    }
-        
-    return config_osm[key]
+    return _CONFIG_OSM[key]
 
 
 
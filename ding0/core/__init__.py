@@ -23,12 +23,11 @@ from ding0.core.network.grids import *
 from ding0.core.network.stations import *
 from ding0.core.structure.regions import *
 from ding0.core.powerflow import *
-from ding0.tools.pypsa_io import initialize_component_dataframes, fill_mvgd_component_dataframes
-from ding0.tools.animation import AnimationDing0
-from ding0.tools.plots import plot_mv_topology, plot_lv_topology
+from ding0.tools import pypsa_io
 from ding0.flexopt.reinforce_grid import *
+from ding0.tools.equipment import load_static_data
 from ding0.tools.logger import get_default_home_dir
-from ding0.tools.tools import merge_two_dicts_of_dataframes
+from ding0.tools.tools import concat_dicts_of_dataframes, estimate_memory
 from ding0.core.network.loads import MVLoadDing0
 from ding0.grid.lv_grid.parameterization import get_peak_load_diversity
 
@@ -161,6 +160,11 @@ class NetworkDing0:
         self._run_id = kwargs.get('run_id', None)
         self._mv_grid_districts = []
 
+        # sessions may be created without ding0.tools.database, e.g. by
+        # egoio, register adapter before first query
+        if session is not None:
+            ding0.register_numpy_adapter()
+
         self._config = self.import_config()
         self._pf_config = self.import_pf_config()
         self._static_data = self.import_static_data()
@@ -245,7 +249,8 @@ class NetworkDing0:
             export_lv_figures=False,
             ding0_legacy=False,
             path=None,
-            peak_load_determination_mode="sum_of_loads"
+            peak_load_determination_mode="sum_of_loads",
+            release_osm_data=False
     ):
 
         """
@@ -270,6 +275,15 @@ class NetworkDing0:
             If True, lv figures are shown or exported during run.
         path : :obj:`str` or None , defaults to None
             Set path to save the figures if not None
+        release_osm_data : :obj:`bool`, defaults to False
+            If True, OSM street graphs and building footprints are released
+            once they are no longer needed (after STEP 5 and STEP 6) to reduce
+            memory held per MV grid district, see :meth:`release_osm_data`.
+            Afterwards, LV grids can't be rebuilt from their district graphs,
+            LV grid plots of :mod:`~.ding0.tools.plots` lack building
+            footprints, and
+            :func:`~.ding0.grid.mv_grid.analysis.get_load_specific_results`
+            returns no rates of isolated load areas (NaN).
 
         Returns
         -------
@@ -370,11 +384,15 @@ class NetworkDing0:
         self.build_lv_grids()
         if export_lv_figures:
             self.plot_lv_grids(path=path, filename="lv_grid_building_completed")
+        if release_osm_data:
+            self.release_osm_data(level='lv')
 
         logger.info("STEP 6: Build MV grids")
         self.mv_routing(debug=False)
         if export_mv_figures:
             self.plot_mv_grids(path=path, filename='1_routing_completed')
+        if release_osm_data:
+            self.release_osm_data(level='mv')
 
         logger.info("STEP 7: Connect MV and LV generators")
         self.connect_generators(debug=False)
@@ -1385,101 +1403,15 @@ class NetworkDing0:
         """
         Imports static data into NetworkDing0 such as equipment.
 
+        The data is parsed once per process and shared by all NetworkDing0
+        instances, see :func:`~.ding0.tools.equipment.load_static_data`.
+
         Returns
         -------
         :obj: `dict`
             Dictionary with equipment data
         """
-
-        package_path = ding0.__path__[0]
-
-        static_data = {}
-
-        equipment_mv_parameters_trafos = cfg_ding0.get('equipment',
-                                                       'equipment_mv_parameters_trafos')
-        static_data['MV_trafos'] = pd.read_csv(os.path.join(package_path, 'data',
-                                                            equipment_mv_parameters_trafos),
-                                               comment='#',
-                                               delimiter=',',
-                                               decimal='.',
-                                               converters={'S_nom': lambda x: int(x)})
-
-        # import equipment
-        equipment_mv_parameters_lines = cfg_ding0.get('equipment',
-                                                      'equipment_mv_parameters_lines')
-        static_data['MV_overhead_lines'] = pd.read_csv(os.path.join(package_path, 'data',
-                                                                    equipment_mv_parameters_lines),
-                                                       comment='#',
-                                                       converters={'I_max_th': lambda x: int(x),
-                                                                   'U_n': lambda x: int(x),
-                                                                   'reinforce_only': lambda x: int(x)})
-
-        equipment_mv_parameters_cables = cfg_ding0.get('equipment',
-                                                       'equipment_mv_parameters_cables')
-        static_data['MV_cables'] = pd.read_csv(os.path.join(package_path, 'data',
-                                                            equipment_mv_parameters_cables),
-                                               comment='#',
-                                               converters={'I_max_th': lambda x: int(x),
-                                                           'U_n': lambda x: int(x),
-                                                           'reinforce_only': lambda x: int(x)})
-
-        equipment_lv_parameters_cables = cfg_ding0.get('equipment',
-                                                       'equipment_lv_parameters_cables')
-        static_data['LV_cables'] = pd.read_csv(os.path.join(package_path, 'data',
-                                                            equipment_lv_parameters_cables),
-                                               comment='#',
-                                               index_col='name',
-                                               converters={'I_max_th': lambda x: int(x), 'U_n': lambda x: int(x)})
-
-        equipment_lv_parameters_trafos = cfg_ding0.get('equipment',
-                                                       'equipment_lv_parameters_trafos')
-        static_data['LV_trafos'] = pd.read_csv(os.path.join(package_path, 'data',
-                                                            equipment_lv_parameters_trafos),
-                                               comment='#',
-                                               delimiter=',',
-                                               decimal='.',
-                                               converters={'S_nom': lambda x: int(x)})
-        static_data['LV_trafos']['r_pu'] = static_data['LV_trafos']['P_k'] / (static_data['LV_trafos']['S_nom'] * 1000)
-        static_data['LV_trafos']['x_pu'] = np.sqrt(
-            (static_data['LV_trafos']['u_kr'] / 100) ** 2 - static_data['LV_trafos']['r_pu'] ** 2)
-
-        # import LV model grids
-        model_grids_lv_string_properties = cfg_ding0.get('model_grids',
-                                                         'model_grids_lv_string_properties')
-        static_data['LV_model_grids_strings'] = pd.read_csv(os.path.join(package_path, 'data',
-                                                                         model_grids_lv_string_properties),
-                                                            comment='#',
-                                                            delimiter=',',
-                                                            decimal='.',
-                                                            index_col='string_id',
-                                                            converters={'string_id': lambda x: int(x),
-                                                                        'type': lambda x: int(x),
-                                                                        'Kerber Original': lambda x: int(x),
-                                                                        'count house branch': lambda x: int(x),
-                                                                        'distance house branch': lambda x: int(x),
-                                                                        'cable width': lambda x: int(x),
-                                                                        'string length': lambda x: int(x),
-                                                                        'length house branch A': lambda x: int(x),
-                                                                        'length house branch B': lambda x: int(x),
-                                                                        'cable width A': lambda x: int(x),
-                                                                        'cable width B': lambda x: int(x)})
-
-        model_grids_lv_apartment_string = cfg_ding0.get('model_grids',
-                                                        'model_grids_lv_apartment_string')
-        converters_ids = {}
-        for id in range(1, 47):  # create int() converter for columns 1..46
-            converters_ids[str(id)] = lambda x: int(x)
-        static_data['LV_model_grids_strings_per_grid'] = pd.read_csv(os.path.join(package_path, 'data',
-                                                                                  model_grids_lv_apartment_string),
-                                                                     comment='#',
-                                                                     delimiter=',',
-                                                                     decimal='.',
-                                                                     index_col='apartment_count',
-                                                                     converters=dict(
-                                                                         {'apartment_count': lambda x: int(x)},
-                                                                         **converters_ids))
-
-        return static_data
+        return load_static_data()
 
     def import_orm(self, session):
         """
@@ -1979,41 +1911,14 @@ class NetworkDing0:
         only_export_mv: bool
             When True only mv topology is exported with aggregated lv grid districts
         '''
-        def transform_all_geodata(gd_components, network_df, grids_df):
-            from pyproj import Transformer
-            from shapely.ops import transform
-            import time
-
-            logger.info("Transform all geodata from 'EPSG:3035' to 'EPSG:4326'.")
-            t_start = time.perf_counter()
-
-            # initialize the Coordinate-Reference-System-Transformer
-            crs_transformer = Transformer.from_crs("EPSG:3035", "EPSG:4326", always_xy=True).transform
-
-            # Transform geodata
-            network_df["mv_grid_district_geom"] = [transform(crs_transformer, geom) for geom in
-                                                   network_df["mv_grid_district_geom"].to_list()]
-            grids_df["grid_district_geom"] = [transform(crs_transformer, geom) for geom in
-                                              grids_df["grid_district_geom"].to_list()]
-            for key, item in gd_components.items():
-                if key == 'Bus':
-                    gd_components[key]['x'], gd_components[key]['y'] = crs_transformer(gd_components[key]['x'],
-                                                                                       gd_components[key]['y'])
-                elif key == 'Line':
-                    gd_components[key]["geometry"] = [transform(crs_transformer, geom) for geom in
-                                                      gd_components[key]["geometry"].to_list()]
-
-            logger.debug(f"Transformed all geodata in {time.perf_counter() - t_start}s.")
-            return gd_components, network_df, grids_df
-
-        buses_df, generators_df, lines_df, loads_df, transformer_df = initialize_component_dataframes()
+        buses_df, generators_df, lines_df, loads_df, transformer_df = pypsa_io.initialize_component_dataframes()
         if (dir == ''):
             dir = get_default_home_dir()  # eventuell ändern
         # open all switch connectors
         self.control_circuit_breakers(mode='open')
         # start filling component dataframes
         for grid_district in self.mv_grid_districts():
-            gd_components, network_df, grids_df, _ = fill_mvgd_component_dataframes(
+            gd_components, network_df, grids_df, _ = pypsa_io.fill_mvgd_component_dataframes(
                 grid_district,
                 buses_df,
                 generators_df,
@@ -2023,7 +1928,7 @@ class NetworkDing0:
                 only_export_mv
             )
             # Transform all geodata from 'EPSG:3035' to 'EPSG:4326' for eDisGo
-            gd_components, network_df, grids_df = transform_all_geodata(
+            gd_components, network_df, grids_df = self.transform_all_geodata(
                 gd_components, network_df, grids_df
             )
             # Make directories for the grid data and save to csv
@@ -2074,24 +1979,108 @@ class NetworkDing0:
                   'w') as f:
             json.dump(metadata, f, indent=4)
 
+    @staticmethod
+    def transform_all_geodata(gd_components, network_df, grids_df):
+        """
+        Transforms geodata of exported grid district from 'EPSG:3035' to
+        'EPSG:4326', see :meth:`to_csv`
+        """
+        from ding0.tools.geo import get_crs_transformer, transform_geometries
+        import time
+
+        logger.info("Transform all geodata from 'EPSG:3035' to 'EPSG:4326'.")
+        t_start = time.perf_counter()
+
+        # Coordinate-Reference-System-Transformer is cached across grid districts
+        crs_transformer = get_crs_transformer("EPSG:3035", "EPSG:4326")
+
+        # Transform geodata, coordinates of all geometries of a table at once
+        network_df["mv_grid_district_geom"] = transform_geometries(
+            network_df["mv_grid_district_geom"].to_list(), crs_transformer)
+        grids_df["grid_district_geom"] = transform_geometries(
+            grids_df["grid_district_geom"].to_list(), crs_transformer)
+        for key, item in gd_components.items():
+            if key == 'Bus':
+                gd_components[key]['x'], gd_components[key]['y'] = crs_transformer.transform(
+                    gd_components[key]['x'], gd_components[key]['y'])
+            elif key == 'Line':
+                gd_components[key]["geometry"] = transform_geometries(
+                    gd_components[key]["geometry"].to_list(), crs_transformer)
+
+        logger.debug(f"Transformed all geodata in {time.perf_counter() - t_start}s.")
+        return gd_components, network_df, grids_df
+
+    def to_parquet(self, dir='', only_export_mv=False):
+        """
+        Exports network to partitioned Parquet datasets, one per component,
+        see :mod:`~.ding0.tools.parquet_io`
+
+        Contents equal the files of :meth:`to_csv`. Grid districts are
+        appended to existing datasets in `dir` as soon as they are exported,
+        data of grid districts exported before is replaced.
+
+        Parameters
+        ----------
+        dir: :obj:`str`
+            Directory to which network is saved.
+        only_export_mv: bool
+            When True only mv topology is exported with aggregated lv grid districts
+        """
+        from ding0.tools import parquet_io
+
+        buses_df, generators_df, lines_df, loads_df, transformer_df = pypsa_io.initialize_component_dataframes()
+        if (dir == ''):
+            dir = get_default_home_dir()
+        # open all switch connectors
+        self.control_circuit_breakers(mode='open')
+        for grid_district in self.mv_grid_districts():
+            gd_components, network_df, grids_df, _ = pypsa_io.fill_mvgd_component_dataframes(
+                grid_district,
+                buses_df,
+                generators_df,
+                lines_df,
+                loads_df,
+                transformer_df,
+                only_export_mv
+            )
+            # Transform all geodata from 'EPSG:3035' to 'EPSG:4326' for eDisGo
+            gd_components, network_df, grids_df = self.transform_all_geodata(
+                gd_components, network_df, grids_df
+            )
+            gd_components['Network'] = network_df
+            gd_components['Grids'] = grids_df
+            parquet_io.write_mv_grid_district(dir, grid_district.id_db,
+                                              gd_components)
+
+        parquet_io.write_metadata(dir, self.metadata)
+
     def to_dataframe(self, only_export_mv=False):
         '''
-        Function to export network to csv. Converts network in dataframes which are adapted to pypsa format.
-        Respectively saves files for network, buses, lines, transformers, loads and generators.
+        Function to export network to dataframes. Converts network in dataframes which are adapted to pypsa format.
+        Respectively returns dataframes for network, buses, lines, transformers, loads and generators.
+
+        Components of all grid districts are collected first and concatenated
+        once, time grows linearly with the number of grid districts.
 
         Parameters
         ----------
         only_export_mv: bool
             When True only mv topology is exported with aggregated lv grid districts
+
+        Returns
+        -------
+        dict of :pandas:`pandas.DataFrame<dataframe>`
+            Components of all grid districts keyed by component, 'Network'
+            contains one row per grid district
         '''
-        buses_df, generators_df, lines_df, loads_df, transformer_df = initialize_component_dataframes()
-        components = {}
-        networks = pd.DataFrame()
+        buses_df, generators_df, lines_df, loads_df, transformer_df = pypsa_io.initialize_component_dataframes()
+        components = []
+        networks = []
         # open all switch connectors
         self.control_circuit_breakers(mode='open')
         # start filling component dataframes
         for grid_district in self.mv_grid_districts():
-            gd_components, network_df, _, _ = fill_mvgd_component_dataframes(
+            gd_components, network_df, _, _ = pypsa_io.fill_mvgd_component_dataframes(
                 grid_district,
                 buses_df,
                 generators_df,
@@ -2100,14 +2089,12 @@ class NetworkDing0:
                 transformer_df,
                 only_export_mv
             )
-            if len(components) == 0:
-                components = gd_components
-                networks = network_df
-            else:
-                components = merge_two_dicts_of_dataframes(components, gd_components)
-                networks = networks.append(network_df)
+            components.append(gd_components)
+            networks.append(network_df)
 
-        components['Network'] = network_df
+        components = concat_dicts_of_dataframes(components)
+        if networks:
+            components['Network'] = pd.concat(networks, sort=False)
         return components
 
     def mv_routing(self, debug=False, animation=False):
@@ -2128,6 +2115,7 @@ class NetworkDing0:
         ding0.core.network.grids.MVGridDing0.routing : for details on MVGridDing0 objects routing
         ding0.tools.animation.AnimationDing0 : for details on animation function.
         """
+        from ding0.tools.animation import AnimationDing0
 
         if animation:
             anim = AnimationDing0()
@@ -2182,6 +2170,95 @@ class NetworkDing0:
 
         logger.info('=====> LV model grids created')
 
+    def osm_data_memory(self):
+        """
+        Estimates memory held by OSM street graphs and buildings of every
+        MV grid district
+
+        Objects shared by several graphs or frames of a MV grid district
+        are counted once, e.g. edge geometries of LV grid district graphs
+        taken from the load area graph are attributed to the load area graph.
+
+        Returns
+        -------
+        :pandas:`pandas.DataFrame<dataframe>`
+            Estimated memory in bytes of load area graphs
+            (`load_area_graph`), graphs of LV grid districts (`graph_district`)
+            and buildings of LV grid districts (`buildings`), indexed by
+            id of MV grid district
+        """
+        memory = {}
+        for mv_grid_district in self.mv_grid_districts():
+            seen = set()
+            memory_district = dict.fromkeys(
+                ['load_area_graph', 'graph_district', 'buildings'], 0)
+            for load_area in mv_grid_district.lv_load_areas():
+                memory_district['load_area_graph'] += estimate_memory(
+                    load_area.load_area_graph or None, seen)
+                for lv_grid_district in load_area.lv_grid_districts():
+                    memory_district['graph_district'] += estimate_memory(
+                        lv_grid_district.graph_district, seen)
+                    memory_district['buildings'] += estimate_memory(
+                        lv_grid_district.buildings, seen)
+            memory[mv_grid_district.id_db] = memory_district
+
+        memory = pd.DataFrame.from_dict(
+            memory, orient='index',
+            columns=['load_area_graph', 'graph_district', 'buildings'])
+        memory.index.name = 'mv_grid_district'
+        return memory
+
+    def release_osm_data(self, level):
+        """
+        Releases OSM street graphs and building data no longer needed
+
+        Parameters
+        ----------
+        level: :obj:`str`
+            Data to release::
+
+            'lv':   Graphs of LV grid districts and building footprints,
+                    once LV grids are built (STEP 5). Footprints are only
+                    used by LV grid plots.
+
+            'mv':   Graphs of load areas, once MV grids are built (STEP 6).
+                    They are used by urban MV routing and the connection of
+                    stations in load areas. Released graphs are replaced by
+                    empty graphs with graph attribute `released`.
+
+        Returns
+        -------
+        :pandas:`pandas.DataFrame<dataframe>`
+            Estimated memory in bytes held per MV grid district before
+            release, see :meth:`osm_data_memory`
+        """
+        if level not in ('lv', 'mv'):
+            raise ValueError('\'level\' is invalid.')
+
+        memory = self.osm_data_memory()
+        for mv_grid_district in self.mv_grid_districts():
+            for load_area in mv_grid_district.lv_load_areas():
+                if level == 'mv':
+                    load_area.load_area_graph = nx.MultiDiGraph(released=True)
+                    continue
+                for lv_grid_district in load_area.lv_grid_districts():
+                    lv_grid_district.graph_district = None
+                    if lv_grid_district.buildings is not None:
+                        lv_grid_district.buildings = \
+                            lv_grid_district.buildings.drop(
+                                columns='footprint', errors='ignore')
+
+        released = (['graph_district', 'buildings'] if level == 'lv'
+                    else ['load_area_graph'])
+        for mv_grid_district_id, held in memory[released].sum(
+                axis=1).items():
+            logger.info(
+                f"Released OSM data ({level.upper()}) of MV grid district "
+                f"{mv_grid_district_id}, held {held / 1e6:.1f} MB before")
+
+        logger.info(f'=====> OSM data ({level.upper()}) released')
+        return memory
+
     def connect_generators(self, debug=False):
         """
         Connects generators (graph nodes) to grid (graph) for every MV and LV Grid District
@@ -2265,7 +2342,7 @@ class NetworkDing0:
             logger.info('=====> MV Circuit Breakers closed')
 
     def run_powerflow(self, session=None, method='onthefly', only_calc_mv=True, export_pypsa=False, debug=False,
-                      export_result_dir=None):
+                      export_result_dir=None, batch_size=None):
         """
         Performs power flow calculation for all MV grids
 
@@ -2280,14 +2357,44 @@ class NetworkDing0:
 
             If method='onthefly' grid data will be passed to PyPSA directly (default)
 
+            If method='radial' power flow is calculated by backward/forward
+            sweep without PyPSA, grids must be radial
+
+        only_calc_mv: :obj:`bool`
+            If True (default), LV grids are aggregated at their stations.
+            If False, LV grids are part of the power flow problem and results
+            are assigned to their nodes and branches as well. Use
+            method='radial' for grid districts with many LV grids.
+
         export_pypsa: :obj:`bool`
             If True PyPSA networks will be exported as csv to output/debug/grid/<MV-GRID_NAME>/
+            (not available for method='radial')
 
         debug: :obj:`bool`, defaults to False
             If True, information is printed during process
-        """
 
-        if method == 'db':
+        batch_size: :obj:`int`, defaults to None
+            Number of MV grid districts whose power flow is calculated as
+            one problem, see :func:`~.ding0.tools.pypsa_io.run_powerflow_batch`.
+            If None, power flow is calculated per MV grid district.
+            Only available for method='onthefly' and method='radial',
+            export_pypsa is not supported.
+        """
+
+        if batch_size and method in ['onthefly', 'radial']:
+            if export_pypsa:
+                raise ValueError('PyPSA networks cannot be exported when '
+                                 'power flow is calculated in batches.')
+            mv_grids = [grid_district.mv_grid
+                        for grid_district in self.mv_grid_districts()]
+            for start in range(0, len(mv_grids), batch_size):
+                pypsa_io.run_powerflow_batch(mv_grids[start:start + batch_size],
+                                             method=method,
+                                             only_calc_mv=only_calc_mv,
+                                             debug=debug,
+                                             export_result_dir=export_result_dir)
+
+        elif method == 'db':
             # Empty tables
             pypsa_io.delete_powerflow_tables(session)
 
@@ -2313,6 +2420,12 @@ class NetworkDing0:
                                                     debug=debug,
                                                     export_result_dir=export_result_dir)
 
+        elif method == 'radial':
+            for grid_district in self.mv_grid_districts():
+                grid_district.mv_grid.run_powerflow(method='radial',
+                                                    only_calc_mv=only_calc_mv,
+                                                    export_result_dir=export_result_dir)
+
     def reinforce_grid(self):
         """
         Performs grid reinforcement measures for all MV and LV grids
@@ -2582,6 +2695,7 @@ class NetworkDing0:
         return lv_grid_districts
 
     def plot_mv_grids(self, path=None, filename=None):
+        from ding0.tools.plots import plot_mv_topology
         kwargs = {}
 
         kwargs["path"] = path
@@ -2620,6 +2734,7 @@ class NetworkDing0:
 
 
     def plot_lv_grids(self, path=None, filename=None):
+        from ding0.tools.plots import plot_lv_topology
         for mv_grid_district in self.mv_grid_districts():
             for load_area in mv_grid_district.lv_load_areas():
                 for lv_grid_district in load_area.lv_grid_districts():
@@ -13,11 +13,237 @@ __url__        = "https://github.com/openego/ding0/blob/master/LICENSE"
 __author__     = "nesnoj, gplssm"
 
 
-import matplotlib.pyplot as plt
+from bisect import bisect_left, bisect_right
+
 import networkx as nx
 
 from ding0.core.structure.regions import LVLoadAreaDing0, LVLoadAreaCentreDing0
 import ding0.tools as tl
+from ding0.tools.equipment import equipment_type
+
+
+def _set_slots_state(obj, state):
+    """
+    Restores pickled state of objects storing attributes in `__slots__`
+
+    Used as `__setstate__` of nodes and branches. Objects pickled before
+    attributes were moved to `__slots__` hold all attributes in their
+    `__dict__`, they are restored to slots as well.
+
+    Parameters
+    ----------
+    obj: :obj:`object`
+        Object to restore
+    state: :obj:`dict` or :obj:`tuple`
+        Attributes of `__dict__` or 2-tuple of attributes of `__dict__`
+        and of slots
+    """
+    if isinstance(state, tuple):
+        state, slots_state = state
+        for name, value in (slots_state or {}).items():
+            object.__setattr__(obj, name, value)
+    for name, value in (state or {}).items():
+        # attributes of slots or properties of older versions
+        setattr(obj, name, value)
+
+
+class GridGraph(nx.Graph):
+    """
+    Graph of a grid with an index of its branches
+
+    Branches are stored as edge attribute 'branch'. The graph keeps the
+    adjacent nodes of every branch and the order of edges by names of their
+    nodes up to date whenever edges or nodes are added or removed, so
+    :meth:`GridDing0.graph_nodes_from_branch` and
+    :meth:`GridDing0.graph_edges` neither search nor sort the graph.
+
+    Nodes of an edge are given in the order networkx iterates edges, i.e.
+    the node added to the graph first comes first. Single edges and nodes
+    are indexed incrementally, methods adding or removing many of them
+    (e.g. `add_edges_from`) rebuild the index once.
+
+    Note
+    ----
+    Branches have to be set when edges are added, e.g. by
+    ``graph.add_edge(node1, node2, branch=branch)``. Replacing attribute
+    'branch' of an existing edge in place is not noticed by the index, nor
+    are names (`repr`) of nodes changed while they are part of the graph.
+
+    Results derived from the topology of the graph, e.g. rings of MV grids,
+    can be kept in :attr:`topology_cache`, it is cleared whenever nodes or
+    edges are added or removed.
+    """
+
+    def __init__(self, incoming_graph_data=None, **attr):
+        self._topology_cache = {}
+        self._reset_index()
+        super().__init__(incoming_graph_data, **attr)
+
+    @property
+    def topology_cache(self):
+        """
+        Cache of results derived from nodes and edges of graph
+
+        Returns
+        -------
+        :obj:`dict`
+            Results keyed by name, empty after every change of nodes or
+            edges
+        """
+        return self._topology_cache
+
+    def branch_nodes(self, branch):
+        """
+        Returns nodes adjacent to `branch`
+
+        Parameters
+        ----------
+        branch: :class:`~.ding0.core.network.BranchDing0`
+            Branch of graph
+
+        Returns
+        -------
+        :obj:`tuple`
+            2-tuple of nodes
+        """
+        try:
+            return self._branch_edges[branch]
+        except KeyError:
+            # repr of branch needs its nodes, it cannot be part of message
+            raise ValueError('Branch is not part of graph.')
+
+    def sorted_branch_edges(self):
+        """
+        Returns edges with branch sorted by names of their nodes
+
+        Returns
+        -------
+        :obj:`list` of :obj:`tuple`
+            2-tuples of nodes, the list is a copy and can be iterated while
+            the graph is changed
+        """
+        return list(self._edge_list)
+
+    def add_node(self, node_for_adding, **attr):
+        if node_for_adding not in self._node:
+            self._topology_cache.clear()
+        self._add_position(node_for_adding)
+        super().add_node(node_for_adding, **attr)
+
+    def add_edge(self, u_of_edge, v_of_edge, **attr):
+        # attributes of edges (branches) are part of topology, too
+        self._topology_cache.clear()
+        self._add_position(u_of_edge)
+        self._add_position(v_of_edge)
+        if u_of_edge in self._adj and v_of_edge in self._adj[u_of_edge]:
+            self._unindex_edge(u_of_edge, v_of_edge)
+        super().add_edge(u_of_edge, v_of_edge, **attr)
+        self._index_edge(u_of_edge, v_of_edge)
+
+    def remove_edge(self, u, v):
+        self._topology_cache.clear()
+        if u in self._adj and v in self._adj[u]:
+            self._unindex_edge(u, v)
+        super().remove_edge(u, v)
+
+    def remove_node(self, n):
+        self._topology_cache.clear()
+        if n in self._adj:
+            for neighbor in list(self._adj[n]):
+                self._unindex_edge(n, neighbor)
+        super().remove_node(n)
+        self._node_position.pop(n, None)
+
+    def add_nodes_from(self, nodes_for_adding, **attr):
+        super().add_nodes_from(nodes_for_adding, **attr)
+        self._reindex()
+
+    def add_edges_from(self, ebunch_to_add, **attr):
+        super().add_edges_from(ebunch_to_add, **attr)
+        self._reindex()
+
+    def remove_nodes_from(self, nodes):
+        super().remove_nodes_from(nodes)
+        self._reindex()
+
+    def remove_edges_from(self, ebunch):
+        super().remove_edges_from(ebunch)
+        self._reindex()
+
+    def clear(self):
+        super().clear()
+        self._reindex()
+
+    def clear_edges(self):
+        super().clear_edges()
+        self._reindex()
+
+    def _reset_index(self):
+        self._node_position = {}
+        self._next_position = 0
+        self._branch_edges = {}
+        self._edge_keys = {}
+        # keys and edges sorted by key
+        self._sorted_keys = []
+        self._edge_list = []
+
+    def _reindex(self):
+        """Rebuilds index from graph"""
+        self._topology_cache.clear()
+        self._reset_index()
+        for node in self._adj:
+            self._add_position(node)
+        edges = []
+        for u, v, data in self.edges(data=True):
+            if 'branch' in data:
+                self._branch_edges[data['branch']] = (u, v)
+                self._edge_keys[(u, v)] = self._edge_key(u, v)
+                edges.append((self._edge_keys[(u, v)], (u, v)))
+        # sort is stable, edges with equal keys stay in order of graph
+        edges.sort(key=lambda edge: edge[0])
+        self._sorted_keys = [key for key, _ in edges]
+        self._edge_list = [edge for _, edge in edges]
+
+    def _add_position(self, node):
+        if node not in self._node_position:
+            self._node_position[node] = self._next_position
+            self._next_position += 1
+
+    def _oriented(self, u, v):
+        if self._node_position[u] > self._node_position[v]:
+            return v, u
+        return u, v
+
+    @staticmethod
+    def _edge_key(u, v):
+        return ''.join(sorted([repr(u), repr(v)]))
+
+    def _index_edge(self, u, v):
+        data = self._adj[u][v]
+        if 'branch' not in data:
+            return
+        edge = self._oriented(u, v)
+        key = self._edge_key(*edge)
+        position = bisect_right(self._sorted_keys, key)
+        self._sorted_keys.insert(position, key)
+        self._edge_list.insert(position, edge)
+        self._edge_keys[edge] = key
+        self._branch_edges[data['branch']] = edge
+
+    def _unindex_edge(self, u, v):
+        edge = self._oriented(u, v)
+        # key of edge when it was indexed, names of nodes may have changed
+        key = self._edge_keys.pop(edge, None)
+        if key is None:
+            return
+        position = bisect_left(self._sorted_keys, key)
+        while self._edge_list[position] != edge:
+            position += 1
+        del self._sorted_keys[position]
+        del self._edge_list[position]
+        branch = self._adj[u][v].get('branch')
+        if self._branch_edges.get(branch) == edge:
+            del self._branch_edges[branch]
 
 
 class GridDing0:
@@ -74,7 +300,7 @@ class GridDing0:
         self._generators = []
         self.v_level = kwargs.get('v_level', None)
 
-        self._graph = nx.Graph()
+        self._graph = GridGraph()
 
     def cable_distributors(self):
         """
@@ -165,6 +391,9 @@ class GridDing0:
     @property
     def graph(self):
         """Provide access to the graph"""
+        # graphs of grids created by older versions have no branch index
+        if not isinstance(self._graph, GridGraph):
+            self._graph = GridGraph(self._graph)
         return self._graph
 
     def graph_add_node(self, node_object):
@@ -219,6 +448,7 @@ class GridDing0:
         Since no coordinate transformation is
         performed, the drawn graph representation is falsified!
         """
+        import matplotlib.pyplot as plt
 
         g = self.graph
 
@@ -329,9 +559,7 @@ class GridDing0:
             2-tuple of Ding0 node objects i.e.
             |ding0_node_object_types|
         """
-        edges = nx.get_edge_attributes(self.graph, 'branch')
-        nodes = list(edges.keys())[list(edges.values()).index(branch)]
-        return nodes
+        return self.graph.branch_nodes(branch)
 
     def graph_branches_from_node(self, node):
         """ Returns branches that are connected to `node`
@@ -353,13 +581,7 @@ class GridDing0:
 
             node in ding0 is either |ding0_node_object_types|
         """
-        # TODO: This method can be replaced and speed up by using NetworkX' neighbors()
-
-        branches = []
-        branches_dict = self.graph.adj[node]
-        for branch in branches_dict.items():
-            branches.append(branch)
-        return sorted(branches, key=lambda _: repr(_))
+        return sorted(self.graph.adj[node].items(), key=lambda _: repr(_[0]))
 
     def graph_edges(self):
         """
@@ -405,11 +627,10 @@ class GridDing0:
         this changes, the code will break.
         """
 
-        # get edges with attributes
-        edges = nx.get_edge_attributes(self.graph, 'branch').items()
-
-        # sort them according to connected nodes
-        edges_sorted = sorted(list(edges), key=lambda _: (''.join(sorted([repr(_[0][0]),repr(_[0][1])]))))
+        # edges are kept sorted according to connected nodes by the graph
+        adj = self.graph.adj
+        edges_sorted = [(edge, adj[edge[0]][edge[1]]['branch'])
+                        for edge in self.graph.sorted_branch_edges()]
 
         for edge in edges_sorted:
             yield {'adj_nodes': edge[0], 'branch': edge[1]}
@@ -591,6 +812,11 @@ class StationDing0:
      :class:`~.ding0.core.network.grid.MVGridDing0`)
     """
 
+    # attributes are stored in slots, others set by users in `__dict__`
+    __slots__ = ('id_db', 'geo_data', 'grid', '_transformers',
+                 'v_level_operation', 'voltage_res', '__dict__')
+    __setstate__ = _set_slots_state
+
     def __init__(self, **kwargs):
         self.id_db = kwargs.get('id_db', None)
         self.geo_data = kwargs.get('geo_data', None)
@@ -743,8 +969,10 @@ class BranchDing0:
     ----------
     length : :obj:`float`
         Length of line given in m
-    type : :pandas:`pandas.DataFrame<dataframe>`
-        Association to pandas Series. DataFrame with attributes of line/cable.
+    type : :class:`~.ding0.tools.equipment.EquipmentType`
+        Parameters of line/cable. Rows of equipment tables
+        (:pandas:`pandas.Series<series>`) assigned to it are converted to
+        records shared by all branches of the same type.
     id_db : :obj:`int`
         id according to database table
     ring : :class:`~.ding0.core.network.RingDing0`
@@ -773,6 +1001,13 @@ class BranchDing0:
         to enable visualisation of the right course of the road.
     """
 
+    # attributes are stored in slots, others set by users in `__dict__`
+    __slots__ = ('id_db', 'ring', 'feeder', 'grid', 'length', 'kind',
+                 '_type', 'connects_aggregated', 'circuit_breaker',
+                 'geometry', 'num_parallel', 'critical', 'helper_component',
+                 's_res', '__dict__')
+    __setstate__ = _set_slots_state
+
     def __init__(self, **kwargs):
 
         self.id_db = kwargs.get('id_db', None)
@@ -781,7 +1016,7 @@ class BranchDing0:
         self.grid = kwargs.get('grid', None)
         self.length = kwargs.get('length', None)  # branch (line/cable) length in m
         self.kind = kwargs.get('kind', None)  # 'line' or 'cable'
-        self.type = kwargs.get('type', None)  # DataFrame with attributes of line/cable
+        self.type = kwargs.get('type', None)  # attributes of line/cable
         self.connects_aggregated = kwargs.get('connects_aggregated', False)
         self.circuit_breaker = kwargs.get('circuit_breaker', None)
         self.geometry = kwargs.get('geometry', None) # branch coordinates
@@ -802,6 +1037,26 @@ class BranchDing0:
         """
         return self.ring.network
 
+    @property
+    def type(self):
+        """
+        Parameters of line/cable
+
+        Returns
+        -------
+        :class:`~.ding0.tools.equipment.EquipmentType`
+        """
+        try:
+            return self._type
+        except AttributeError:
+            # branches pickled by older versions hold type as Series
+            self.type = self.__dict__.pop('type', None)
+            return self._type
+
+    @type.setter
+    def type(self, type):
+        self._type = equipment_type(type)
+
     def __repr__(self):
         """
         The Representative of the :class:`~.ding0.core.network.BranchDing0` object.
@@ -954,6 +1209,13 @@ class GeneratorDing0:
         
     """
 
+    # attributes are stored in slots, others set by users in `__dict__`
+    __slots__ = ('id_db', 'name', 'geo_data', 'mv_grid', 'lv_load_area',
+                 'lv_grid', 'capacity', 'capacity_factor', 'type', 'subtype',
+                 'v_level', 'building_id', 'gens_id', 'voltage_res',
+                 '__dict__')
+    __setstate__ = _set_slots_state
+
     def __init__(self, **kwargs):
         self.id_db = kwargs.get('id_db', None)
         self.name = kwargs.get('name', None)
@@ -1032,6 +1294,9 @@ class GeneratorFluctuatingDing0(GeneratorDing0):
         ID of the weather cell used to generate feed-in time series
 
     """
+
+    __slots__ = ('_weather_cell_id',)
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
@@ -1076,6 +1341,11 @@ class CableDistributorDing0:
     
     """
 
+    # attributes are stored in slots, others set by users in `__dict__`
+    __slots__ = ('id_db', 'geo_data', 'grid', 'helper_component',
+                 'voltage_res', '__dict__')
+    __setstate__ = _set_slots_state
+
     def __init__(self, **kwargs):
         self.id_db = kwargs.get('id_db', None)
         self.geo_data = kwargs.get('geo_data', None)
@@ -1117,6 +1387,13 @@ class LoadDing0:
     """
     #ToDo: Add consumption, type and sector to the documentation
 
+    # attributes are stored in slots, others set by users in `__dict__`
+    __slots__ = ('id_db', 'geo_data', 'grid', 'peak_load',
+                 'peak_load_residential', 'number_households',
+                 'peak_load_cts', 'peak_load_industrial', 'consumption',
+                 'building_id', 'sector', 'type', 'voltage_res', '__dict__')
+    __setstate__ = _set_slots_state
+
     def __init__(self, **kwargs):
         self.id_db = kwargs.get('id_db', None)
         self.geo_data = kwargs.get('geo_data', None)
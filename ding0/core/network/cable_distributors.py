@@ -25,6 +25,8 @@ class MVCableDistributorDing0(CableDistributorDing0):
         Description #TODO
     """
 
+    __slots__ = ('osm_id_node', 'lv_load_area_group')
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
@@ -64,6 +66,8 @@ class LVCableDistributorDing0(CableDistributorDing0):
         Description #TODO
     """
 
+    __slots__ = ('string_id', 'branch_no', 'load_no', 'in_building')
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
@@ -26,11 +26,11 @@ from ding0.tools.geo import calc_geo_dist
 from ding0.grid.mv_grid.tools import set_circuit_breakers
 from ding0.flexopt.reinforce_grid import *
 from ding0.core.structure.regions import LVLoadAreaCentreDing0
-from ding0.tools.pypsa_io import initialize_component_dataframes, fill_mvgd_component_dataframes
 
 import os
 import logging
 import networkx as nx
+from collections import deque
 from datetime import datetime
 from pyproj import Transformer
 
@@ -207,14 +207,9 @@ class MVGridDing0(GridDing0):
         -----
             Circuit breakers must be closed to find rings, this is done automatically.
         """
-        for circ_breaker in self.circuit_breakers():
-            if circ_breaker.status == 'open':
-                circ_breaker.close()
-                logger.info('Circuit breakers were closed in order to find MV '
-                            'rings')
+        for ring in self._ring_decomposition()['rings']:
+            ring = list(ring)
 
-        for ring in nx.cycle_basis(self.graph, root=self._station):
-            
             if not include_root_node:
                 if self._station in ring:
                     ring.remove(self._station)
@@ -251,24 +246,22 @@ class MVGridDing0(GridDing0):
         -----
             Circuit breakers must be closed to find rings, this is done automatically.
         """
-        #close circuit breakers
-        for circ_breaker in self.circuit_breakers():
-            if not circ_breaker.status == 'closed':
-                circ_breaker.close()
-                logger.info('Circuit breakers were closed in order to find MV '
-                            'rings')
+        rings = self._ring_decomposition()
         #find True rings (cycles from station through breaker and back to station)
-        for ring_nodes in nx.cycle_basis(self.graph, root=self._station):
-            edges_ring = []
-            for node in ring_nodes:
-                for edge in self.graph_branches_from_node(node):
-                    nodes_in_the_branch = self.graph_nodes_from_branch(edge[1]['branch'])
-                    if (nodes_in_the_branch[0] in ring_nodes and
-                        nodes_in_the_branch[1] in ring_nodes
-                        ):
-                        if not edge[1]['branch'] in edges_ring:
+        for ring_idx, ring_nodes in enumerate(rings['rings']):
+            if ring_idx not in rings['branches']:
+                nodes = rings['ring_node_sets'][ring_idx]
+                edges_ring = []
+                edges_found = set()
+                for node in ring_nodes:
+                    for edge in self.graph_branches_from_node(node):
+                        if (edge[0] in nodes and
+                                edge[1]['branch'] not in edges_found):
+                            edges_found.add(edge[1]['branch'])
                             edges_ring.append(edge[1]['branch'])
-            yield (edges_ring[0].ring,edges_ring,ring_nodes)
+                rings['branches'][ring_idx] = edges_ring
+            edges_ring = rings['branches'][ring_idx]
+            yield (edges_ring[0].ring, list(edges_ring), list(ring_nodes))
 
         ##Find "rings" associated to aggregated LA
         #for node in self.graph_nodes_sorted():
@@ -318,33 +311,80 @@ class MVGridDing0(GridDing0):
         Returns
         -------
         :obj:`list` of :obj:`GridDing0`
-            List of nodes (Ding0 objects)
+            List of nodes (Ding0 objects) in order of breadth-first search
         """
         if node_source in self.graph.nodes():
 
-            # get all nodes that are member of a ring
-            node_ring = []
-            for ring in self.rings_nodes(include_root_node=include_root_node):
-                if node_source in ring:
-                    node_ring = ring
-                    break
-
-            # result set
-            nodes_subtree = set()
-
-            # get nodes from subtree
-            if node_source in node_ring:
-                for path in nx.shortest_path(self.graph, node_source).values():
-                    if len(path)>1:
-                        if (path[1] not in node_ring) and (path[1] is not self.station()):
-                            nodes_subtree.update(path[1:len(path)])
-            else:
+            rings = self._ring_decomposition()
+
+            # get ring of node, root node is only member of a ring if included
+            ring_idx = rings['ring_of_node'].get(node_source)
+            if ring_idx is None or (node_source is self._station and
+                                    not include_root_node):
                 raise ValueError(node_source, 'is not member of ring.')
 
+            if node_source not in rings['satellites']:
+                # get nodes from subtree, ring and root node are not
+                # traversed
+                node_ring = rings['ring_node_sets'][ring_idx]
+                nodes_subtree = []
+                visited = {node_source}
+                queue = deque([node_source])
+                while queue:
+                    node = queue.popleft()
+                    for neighbor in self.graph.adj[node]:
+                        if (neighbor not in visited and
+                                neighbor not in node_ring and
+                                neighbor is not self._station):
+                            visited.add(neighbor)
+                            nodes_subtree.append(neighbor)
+                            queue.append(neighbor)
+                rings['satellites'][node_source] = nodes_subtree
+
         else:
             raise ValueError(node_source, 'is not member of graph.')
 
-        return list(nodes_subtree)
+        return list(rings['satellites'][node_source])
+
+    def _ring_decomposition(self):
+        """ Returns rings of graph, ring membership of nodes and satellites
+
+        The decomposition is found once and kept in the topology cache of
+        the graph until nodes or edges change. Branches of rings and
+        satellites of ring nodes are added on first request by
+        :meth:`rings_full_data` and :meth:`graph_nodes_from_subtree`.
+
+        Returns
+        -------
+        :obj:`dict`
+            Rings as lists of nodes including root node (key 'rings'), sets
+            of nodes of rings ('ring_node_sets'), index of first ring of
+            each ring node ('ring_of_node'), branches of rings by index
+            ('branches') and satellites by ring node ('satellites')
+
+        Note
+        -----
+            Circuit breakers must be closed to find rings, this is done automatically.
+        """
+        for circ_breaker in self.circuit_breakers():
+            if circ_breaker.status == 'open':
+                circ_breaker.close()
+                logger.info('Circuit breakers were closed in order to find MV '
+                            'rings')
+
+        cache = self.graph.topology_cache
+        if 'rings' not in cache:
+            rings = nx.cycle_basis(self.graph, root=self._station)
+            ring_of_node = {}
+            for ring_idx, ring in enumerate(rings):
+                for node in ring:
+                    ring_of_node.setdefault(node, ring_idx)
+            cache['rings'] = {'rings': rings,
+                              'ring_node_sets': [set(ring) for ring in rings],
+                              'ring_of_node': ring_of_node,
+                              'branches': {},
+                              'satellites': {}}
+        return cache['rings']
 
     def routing(self, debug=False, anim=None):
         """ Performs routing on Load Area centres to build MV grid with ring topology.
@@ -753,8 +793,8 @@ class MVGridDing0(GridDing0):
                                                   resolution=resolution,
                                                   start_time=start_time)
         elif method == 'onthefly':
-            buses_df, generators_df, lines_df, loads_df, transformer_df = initialize_component_dataframes()
-            components, _, _, components_data = fill_mvgd_component_dataframes(self.grid_district, buses_df, generators_df,
+            buses_df, generators_df, lines_df, loads_df, transformer_df = pypsa_io.initialize_component_dataframes()
+            components, _, _, components_data = pypsa_io.fill_mvgd_component_dataframes(self.grid_district, buses_df, generators_df,
                                                                             lines_df, loads_df, transformer_df,
                                                                             only_export_mv=only_calc_mv,
                                                                             return_time_varying_data=True)
@@ -781,7 +821,12 @@ class MVGridDing0(GridDing0):
             
             'db': grid data will be exported to database
             'onthefly': grid data will be passed to PyPSA directly (default)
+            'radial': backward/forward sweep power flow without PyPSA, grid
+            must be radial, see :mod:`~.ding0.core.powerflow.radial`
             
+        only_calc_mv: :obj:`bool`
+            If False, LV grids are part of the power flow problem and
+            results are assigned to their nodes and branches as well
         debug: bool, defaults to False
             If True, information is printed during process
 
@@ -797,8 +842,8 @@ class MVGridDing0(GridDing0):
             raise NotImplementedError("Please use 'onthefly'.")
 
         elif method == 'onthefly':
-            buses_df, generators_df, lines_df, loads_df, transformer_df = initialize_component_dataframes()
-            components, _, _, components_data = fill_mvgd_component_dataframes(self.grid_district, buses_df, generators_df,
+            buses_df, generators_df, lines_df, loads_df, transformer_df = pypsa_io.initialize_component_dataframes()
+            components, _, _, components_data = pypsa_io.fill_mvgd_component_dataframes(self.grid_district, buses_df, generators_df,
                                                                          lines_df, loads_df, transformer_df,  only_export_mv=only_calc_mv,
                                                                          return_time_varying_data=True)
             pypsa_io.run_powerflow_onthefly(components,
@@ -806,7 +851,22 @@ class MVGridDing0(GridDing0):
                                             self,
                                             export_pypsa_dir=export_pypsa_dir,
                                             debug=debug,
-                                            export_result_dir=export_result_dir)
+                                            export_result_dir=export_result_dir,
+                                            only_calc_mv=only_calc_mv)
+
+        elif method == 'radial':
+            buses_df, generators_df, lines_df, loads_df, transformer_df = pypsa_io.initialize_component_dataframes()
+            components, _, _, components_data = pypsa_io.fill_mvgd_component_dataframes(self.grid_district, buses_df, generators_df,
+                                                                         lines_df, loads_df, transformer_df,  only_export_mv=only_calc_mv,
+                                                                         return_time_varying_data=True)
+            pypsa_io.run_powerflow_radial(components,
+                                          components_data,
+                                          self,
+                                          export_result_dir=export_result_dir,
+                                          only_calc_mv=only_calc_mv)
+
+        else:
+            raise ValueError('Sorry, this power flow method does not exist!')
 
     def import_powerflow_results(self, session):
         """Assign results from power flow analysis to edges and nodes
@@ -26,6 +26,8 @@ class MVLoadDing0(LoadDing0):
     """
     # TODO: Currently not used, check later if still required
 
+    __slots__ = ('osmid_building', 'osmid_nn', 'nn_coords', 'lv_load_area')
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.id_db = self.grid.mv_grid.loads_count() + 1
@@ -69,6 +71,8 @@ class LVLoadDing0(LoadDing0):
     Current attributes to fulfill requirements of typified model grids.
     """
 
+    __slots__ = ('string_id', 'branch_no', 'load_no')
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
@@ -16,6 +16,7 @@ __author__     = "nesnoj, gplssm"
 from . import StationDing0
 from ding0.core.network import TransformerDing0
 from ding0.tools import config as cfg_ding0
+from ding0.tools.equipment import sorted_equipment
 
 from itertools import compress
 import numpy as np
@@ -26,6 +27,8 @@ class MVStationDing0(StationDing0):
     Defines a MV station in DINGO
     """
 
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
@@ -122,8 +125,9 @@ class MVStationDing0(StationDing0):
         load_factor_mv_trans_fc_normal = float(cfg_ding0.get('assumptions',
                                                              'load_factor_mv_trans_fc_normal'))
 
-        # get equipment parameters of MV transformers
-        trafo_parameters = self.grid.network.static_data['MV_trafos']
+        # get equipment parameters of MV transformers sorted by nominal power
+        trafos = sorted_equipment(self.grid.network.static_data['MV_trafos'],
+                                  'S_nom')
 
         # get peak load and peak generation
         cum_peak_load = self.peak_load / cos_phi_load
@@ -143,16 +147,15 @@ class MVStationDing0(StationDing0):
         # determine number and size of required transformers
 
         # get max. trafo
-        transformer_max = trafo_parameters.iloc[trafo_parameters['S_nom'].idxmax()]
+        transformer_max = trafos.largest()
 
         while residual_apparent_power > 0:
             if residual_apparent_power > load_factor_mv_trans * transformer_max['S_nom']:
                 transformer = transformer_max
             else:
                 # choose trafo
-                transformer = trafo_parameters.iloc[
-                    trafo_parameters[trafo_parameters['S_nom'] * load_factor_mv_trans >
-                                     residual_apparent_power]['S_nom'].idxmin()]
+                transformer = trafos.select(residual_apparent_power,
+                                            factor=load_factor_mv_trans)
 
             # add transformer on determined size with according parameters
             self.add_transformer(TransformerDing0(**{'grid': self.grid,
@@ -165,7 +168,7 @@ class MVStationDing0(StationDing0):
 
         # if no transformer was selected (no load in grid district), use smallest one
         if len(self._transformers) == 0:
-            transformer = trafo_parameters.iloc[trafo_parameters['S_nom'].idxmin()]
+            transformer = trafos.smallest()
 
             self.add_transformer(
                 TransformerDing0(grid=self.grid,
@@ -216,6 +219,8 @@ class LVStationDing0(StationDing0):
     Defines a LV station in DINGO
     """
 
+    __slots__ = ('lv_load_area', 'osm_id_node')
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
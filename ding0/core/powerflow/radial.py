@@ -0,0 +1,347 @@
+"""This file is part of DING0, the DIstribution Network GeneratOr.
+DING0 is a tool to generate synthetic medium and low voltage power
+distribution grids based on open data.
+
+It is developed in the project open_eGo: https://openegoproject.wordpress.com
+
+DING0 lives at github: https://github.com/openego/ding0/
+The documentation is available on RTD: http://ding0.readthedocs.io
+
+Backward/forward sweep power flow for radial grids.
+
+The power flow problem is given by the component DataFrames that are passed
+to PyPSA otherwise, see
+:func:`~.ding0.tools.pypsa_io.fill_mvgd_component_dataframes`. Buses are
+arranged in a tree rooted at the slack bus, branch currents are obtained by
+summing up the nodal currents of the subtrees (backward sweep) and voltages by
+subtracting the voltage drops along the paths from the slack bus (forward
+sweep). Both sweeps are solves of the same sparse linear system, which is
+factorised once for all iterations and snapshots. Generators are PQ nodes,
+voltage control (PV) is not supported.
+"""
+
+__copyright__  = "Reiner Lemoine Institut gGmbH"
+__license__    = "GNU Affero General Public License Version 3 (AGPL-3.0)"
+__url__        = "https://github.com/openego/ding0/blob/master/LICENSE"
+__author__     = "nesnoj, gplssm"
+
+
+import logging
+
+import numpy as np
+import pandas as pd
+from scipy.sparse import coo_matrix, csc_matrix
+from scipy.sparse.csgraph import breadth_first_order, connected_components
+from scipy.sparse.linalg import splu
+
+logger = logging.getLogger(__name__)
+
+
+class RadialPowerFlowProblem:
+    """
+    Power flow problem of a radial grid in array representation
+
+    Quantities are in per unit of 1 MVA and the nominal voltage of the buses,
+    as in PyPSA. Every connected part of the grid is rooted at its slack
+    bus, which is chosen like PyPSA does: the bus of the slack generator, of
+    the first generator if there is no slack generator or the first bus if
+    there are no generators.
+
+    Parameters
+    ----------
+    components: dict of :pandas:`pandas.DataFrame<dataframe>`
+        Component DataFrames 'Bus', 'Line', 'Transformer', 'Generator' and
+        'Load' indexed by name
+    components_data: dict of :pandas:`pandas.DataFrame<dataframe>`
+        DataFrames 'Bus', 'Generator' and 'Load' with lists of v_mag_pu_set
+        and p_set, q_set per snapshot, respectively
+
+    Attributes
+    ----------
+    buses: :pandas:`pandas.Index<index>`
+        Names of buses
+    lines: :pandas:`pandas.Index<index>`
+        Names of lines
+    parent: :obj:`numpy.ndarray`
+        Position of parent bus of every bus, -1 for slack buses
+    z: :obj:`numpy.ndarray`
+        Impedance of branch connecting every bus to its parent
+    s: :obj:`numpy.ndarray`
+        Complex power injected at buses with shape (buses, snapshots)
+    v_slack: :obj:`numpy.ndarray`
+        Voltage set point of slack bus of every bus with shape
+        (buses, snapshots)
+    """
+
+    def __init__(self, components, components_data):
+        buses = components['Bus']
+        lines = components['Line']
+        trafos = components['Transformer']
+        generators = components['Generator']
+        loads = components['Load']
+
+        self.buses = buses.index
+        self.lines = lines.index
+        n_buses = len(self.buses)
+
+        # voltage set points, buses without set point are set to 1 p.u.,
+        # set points of buses that are not part of the problem are ignored
+        v_mag_pu_set = components_data['Bus']['v_mag_pu_set']
+        v_mag_pu_set = v_mag_pu_set[v_mag_pu_set.index.isin(self.buses) &
+                                    ~v_mag_pu_set.index.duplicated()]
+        n_snapshots = len(v_mag_pu_set.iloc[0])
+        v_set = np.ones((n_buses, n_snapshots))
+        v_set[self._bus_positions(v_mag_pu_set.index)] = \
+            _series_to_array(v_mag_pu_set)
+
+        # branches in order lines, transformers
+        bus0 = self._bus_positions(np.concatenate(
+            [lines['bus0'].to_numpy(), trafos['bus0'].to_numpy()]))
+        bus1 = self._bus_positions(np.concatenate(
+            [lines['bus1'].to_numpy(), trafos['bus1'].to_numpy()]))
+        v_nom = buses['v_nom'].to_numpy(dtype=float)
+        z = np.concatenate([
+            (lines['r'].to_numpy(dtype=float) +
+             1j * lines['x'].to_numpy(dtype=float)) /
+            v_nom[bus0[:len(lines)]] ** 2,
+            (trafos['r'].to_numpy(dtype=float) +
+             1j * trafos['x'].to_numpy(dtype=float)) /
+            trafos['s_nom'].to_numpy(dtype=float)])
+
+        # complex power injected at buses
+        self.s = np.zeros((n_buses, n_snapshots), dtype=complex)
+        for df, data, sign in [(generators, components_data['Generator'], 1),
+                               (loads, components_data['Load'], -1)]:
+            data = data.reindex(df.index[df.index.isin(data.index)])
+            if data.empty:
+                continue
+            np.add.at(self.s, self._bus_positions(df.loc[data.index, 'bus']),
+                      sign * (_series_to_array(data['p_set']) +
+                              1j * _series_to_array(data['q_set'])))
+
+        # choose slack bus of every connected part of grid
+        n_branches = len(bus0)
+        adjacency = coo_matrix(
+            (np.ones(n_branches), (bus0, bus1)), shape=(n_buses, n_buses))
+        n_parts, part = connected_components(adjacency, directed=False)
+        if n_branches != n_buses - n_parts:
+            raise ValueError('Grid is not radial: {} branches connect {} '
+                             'buses in {} connected parts. Open circuit '
+                             'breakers of rings or use PyPSA.'.format(
+                n_branches, n_buses, n_parts))
+        if (generators['control'] == 'PV').any():
+            raise ValueError('Generators with voltage control (PV) are not '
+                             'supported by radial power flow.')
+        slack_generators = generators[generators['control'] == 'Slack']
+        candidates = np.concatenate([
+            self._bus_positions(slack_generators['bus']),
+            self._bus_positions(generators['bus']),
+            np.arange(n_buses)])
+        _, first = np.unique(part[candidates], return_index=True)
+        slack_buses = candidates[first]
+
+        # arrange buses in tree, a virtual bus is linked to all slack buses
+        # to traverse all parts at once
+        virtual_bus = n_buses
+        tree = coo_matrix(
+            (np.ones(n_branches + n_parts),
+             (np.concatenate([bus0, np.full(n_parts, virtual_bus)]),
+              np.concatenate([bus1, slack_buses]))),
+            shape=(n_buses + 1, n_buses + 1)).tocsr()
+        _, predecessors = breadth_first_order(
+            tree, virtual_bus, directed=False, return_predecessors=True)
+        self.parent = predecessors[:n_buses]
+        self.parent[slack_buses] = -1
+
+        # impedance of branch connecting bus to its parent
+        child = np.where(self.parent[bus1] == bus0, bus1, bus0)
+        self.z = np.zeros(n_buses, dtype=complex)
+        self.z[child] = z
+        self.line_child = child[:len(lines)]
+        self.line_reversed = child[:len(lines)] == bus0[:len(lines)]
+        self.bus0 = bus0[:len(lines)]
+        self.bus1 = bus1[:len(lines)]
+
+        slack_of_part = np.empty(n_parts, dtype=int)
+        slack_of_part[part[slack_buses]] = slack_buses
+        self.v_slack = v_set[slack_of_part[part]].astype(complex)
+
+        # incidence matrix of buses that are not slack buses, rows are
+        # parents and columns children, see :meth:`solve`
+        self._unknown = np.flatnonzero(self.parent >= 0)
+        n_unknown = len(self._unknown)
+        position = np.full(n_buses, -1)
+        position[self._unknown] = np.arange(n_unknown)
+        parent_position = position[self.parent[self._unknown]]
+        has_parent = parent_position >= 0
+        rows = np.concatenate([np.arange(n_unknown),
+                               parent_position[has_parent]])
+        cols = np.concatenate([np.arange(n_unknown),
+                               np.flatnonzero(has_parent)])
+        values = np.concatenate([np.ones(n_unknown),
+                                 -np.ones(has_parent.sum())])
+        self._incidence = csc_matrix((values.astype(complex), (rows, cols)),
+                                     shape=(n_unknown, n_unknown))
+        self._lu = None
+
+    def _bus_positions(self, names):
+        positions = self.buses.get_indexer(names)
+        if (positions < 0).any():
+            raise ValueError('Buses {} are not contained in power flow '
+                             'problem.'.format(
+                sorted(set(np.asarray(names)[positions < 0]))))
+        return positions
+
+    def solve(self, tol=1e-10, max_iter=100, s=None, v_slack=None):
+        """
+        Runs backward/forward sweep until voltages change by less than `tol`
+
+        Let B be the incidence matrix of the tree without slack buses with
+        B[i, i] = 1 and B[parent(i), i] = -1. The branch currents J from
+        parent to child follow from the currents I injected at the buses by
+        B J = -I, the voltages from the voltage drops by
+        B^T V = V_slack - Z J, where V_slack is non-zero for the children of
+        slack buses only.
+
+        Parameters
+        ----------
+        tol: :obj:`float`
+            Maximum change of voltage in p.u. between iterations for
+            convergence
+        max_iter: :obj:`int`
+            Maximum number of iterations
+        s: :obj:`numpy.ndarray`
+            Complex power injected at buses with shape (buses, snapshots),
+            defaults to :attr:`s`
+        v_slack: :obj:`numpy.ndarray`
+            Voltage set point of slack bus of every bus, defaults to
+            :attr:`v_slack`. Shape (buses, 1) applies the set point to all
+            snapshots.
+
+        Returns
+        -------
+        v: :obj:`numpy.ndarray`
+            Complex voltage of buses in p.u. with shape (buses, snapshots)
+        j: :obj:`numpy.ndarray`
+            Complex current from parent to bus in p.u. with shape
+            (buses, snapshots), zero for slack buses
+        """
+        if s is None:
+            s = self.s
+        if v_slack is None:
+            v_slack = self.v_slack
+        v = np.broadcast_to(v_slack, s.shape).astype(complex)
+        j = np.zeros_like(v)
+        unknown = self._unknown
+        if not len(unknown):
+            return v, j
+
+        # factorisation is kept for subsequent solves
+        if self._lu is None:
+            self._lu = splu(self._incidence)
+        lu = self._lu
+        z = self.z[unknown][:, np.newaxis]
+        # voltage of slack bus for children of slack buses
+        is_slack_child = self.parent[self.parent[unknown]] < 0
+        v_fixed = np.where(is_slack_child[:, np.newaxis], v[unknown], 0)
+
+        for iteration in range(1, max_iter + 1):
+            i = np.conj(s[unknown] / v[unknown])
+            j_unknown = lu.solve(-i)
+            v_unknown = lu.solve(v_fixed - z * j_unknown, trans='T')
+            change = np.abs(v_unknown - v[unknown]).max()
+            v[unknown] = v_unknown
+            j[unknown] = j_unknown
+            if change < tol:
+                logger.debug('Radial power flow converged after {} '
+                             'iterations.'.format(iteration))
+                break
+        else:
+            logger.warning('Radial power flow did not converge after {} '
+                           'iterations, maximum change of voltage is {} '
+                           'p.u.'.format(max_iter, change))
+        return v, j
+
+    def line_power(self, v, j):
+        """
+        Returns complex power flowing into lines at bus0 and bus1
+
+        Parameters
+        ----------
+        v: :obj:`numpy.ndarray`
+            Complex bus voltages, see :meth:`solve`
+        j: :obj:`numpy.ndarray`
+            Complex branch currents, see :meth:`solve`
+
+        Returns
+        -------
+        s0, s1: :obj:`numpy.ndarray`
+            Complex power in MVA with shape (lines, snapshots)
+        """
+        # current from bus0 to bus1 of lines
+        current = j[self.line_child]
+        current[self.line_reversed] *= -1
+        s0 = v[self.bus0] * np.conj(current)
+        s1 = -v[self.bus1] * np.conj(current)
+        return s0, s1
+
+    def results(self, v, j):
+        """
+        Returns results in the format of
+        :func:`~.ding0.tools.pypsa_io.process_pf_results`
+
+        Parameters
+        ----------
+        v: :obj:`numpy.ndarray`
+            Complex bus voltages, see :meth:`solve`
+        j: :obj:`numpy.ndarray`
+            Complex branch currents, see :meth:`solve`
+
+        Returns
+        -------
+        bus_data: :pandas:`pandas.DataFrame<dataframe>`
+            Voltage level results at buses
+        line_data: :pandas:`pandas.DataFrame<dataframe>`
+            Resulting apparent power at lines
+        """
+        s0, s1 = self.line_power(v, j)
+
+        bus_data = pd.DataFrame(
+            {'v_mag_pu': np.abs(v).tolist()},
+            index=pd.Index(self.buses, name='bus_id'))
+        line_data = pd.DataFrame(
+            {'p0': s0.real.tolist(), 'p1': s1.real.tolist(),
+             'q0': s0.imag.tolist(), 'q1': s1.imag.tolist()},
+            index=pd.Index(self.lines, name='line_id'))
+        return bus_data, line_data
+
+
+def run_radial_powerflow(components, components_data, tol=1e-10,
+                         max_iter=100):
+    """
+    Runs backward/forward sweep power flow, see
+    :class:`RadialPowerFlowProblem`
+
+    Parameters
+    ----------
+    components: dict of :pandas:`pandas.DataFrame<dataframe>`
+    components_data: dict of :pandas:`pandas.DataFrame<dataframe>`
+    tol: :obj:`float`
+        Maximum change of voltage in p.u. between iterations for convergence
+    max_iter: :obj:`int`
+        Maximum number of iterations
+
+    Returns
+    -------
+    bus_data: :pandas:`pandas.DataFrame<dataframe>`
+        Voltage level results at buses
+    line_data: :pandas:`pandas.DataFrame<dataframe>`
+        Resulting apparent power at lines
+    """
+    problem = RadialPowerFlowProblem(components, components_data)
+    return problem.results(*problem.solve(tol=tol, max_iter=max_iter))
+
+
+def _series_to_array(series):
+    """Returns Series of lists as 2-dimensional array of floats"""
+    return np.array(series.tolist(), dtype=float).reshape(len(series), -1)
@@ -0,0 +1,297 @@
+"""This file is part of DING0, the DIstribution Network GeneratOr.
+DING0 is a tool to generate synthetic medium and low voltage power
+distribution grids based on open data.
+
+It is developed in the project open_eGo: https://openegoproject.wordpress.com
+
+DING0 lives at github: https://github.com/openego/ding0/
+The documentation is available on RTD: http://ding0.readthedocs.io
+
+Time series power flow for radial grids.
+
+Loads and generators follow profiles of arbitrary length, e.g. a year in
+hourly resolution. Snapshots are solved in chunks by the backward/forward
+sweep of :class:`~.ding0.core.powerflow.radial.RadialPowerFlowProblem` and
+only aggregated results are kept, memory does not grow with the number of
+snapshots. Profiles are read chunk by chunk as well, they can be passed as
+memory-mapped NumPy arrays or Parquet files.
+"""
+
+__copyright__  = "Reiner Lemoine Institut gGmbH"
+__license__    = "GNU Affero General Public License Version 3 (AGPL-3.0)"
+__url__        = "https://github.com/openego/ding0/blob/master/LICENSE"
+__author__     = "nesnoj, gplssm"
+
+
+import logging
+import os
+from itertools import zip_longest
+
+import numpy as np
+import pandas as pd
+from scipy.sparse import csr_matrix
+
+from ding0.core.powerflow.radial import RadialPowerFlowProblem, \
+    _series_to_array
+
+# pyarrow is optional dependency for reading profiles from parquet files
+try:
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover
+    pq = None
+
+logger = logging.getLogger(__name__)
+
+
+class TimeSeriesResults:
+    """
+    Results of time series power flow aggregated over all snapshots
+
+    Parameters
+    ----------
+    buses: :pandas:`pandas.Index<index>`
+        Names of buses
+    lines: :pandas:`pandas.Index<index>`
+        Names of lines
+    s_nom: :obj:`numpy.ndarray`
+        Nominal apparent power of lines in MVA
+    v_limits: :obj:`tuple` of :obj:`float`
+        Minimum and maximum admissible voltage in p.u.
+
+    Attributes
+    ----------
+    n_snapshots: :obj:`int`
+        Number of snapshots added so far
+    """
+
+    def __init__(self, buses, lines, s_nom, v_limits=(0.9, 1.1)):
+        self.buses = buses
+        self.lines = lines
+        self.s_nom = s_nom
+        self.v_limits = v_limits
+        self.n_snapshots = 0
+        self.v_mag_pu_min = np.full(len(buses), np.inf)
+        self.v_mag_pu_max = np.full(len(buses), -np.inf)
+        self.voltage_violations = np.zeros(len(buses), dtype=int)
+        self.s_max = np.zeros(len(lines))
+        self.overloading = np.zeros(len(lines), dtype=int)
+
+    def add(self, v_mag_pu, s):
+        """
+        Adds results of a chunk of snapshots
+
+        Parameters
+        ----------
+        v_mag_pu: :obj:`numpy.ndarray`
+            Voltage magnitudes with shape (buses, snapshots)
+        s: :obj:`numpy.ndarray`
+            Apparent power of lines in MVA with shape (lines, snapshots)
+        """
+        self.n_snapshots += v_mag_pu.shape[1]
+        if len(self.buses):
+            np.minimum(self.v_mag_pu_min, v_mag_pu.min(axis=1),
+                       out=self.v_mag_pu_min)
+            np.maximum(self.v_mag_pu_max, v_mag_pu.max(axis=1),
+                       out=self.v_mag_pu_max)
+            self.voltage_violations += ((v_mag_pu < self.v_limits[0]) |
+                                        (v_mag_pu > self.v_limits[1])).sum(
+                axis=1)
+        if len(self.lines):
+            np.maximum(self.s_max, s.max(axis=1), out=self.s_max)
+            self.overloading += (s > self.s_nom[:, np.newaxis]).sum(axis=1)
+
+    def bus_data(self):
+        """
+        Returns aggregated results of buses
+
+        Returns
+        -------
+        :pandas:`pandas.DataFrame<dataframe>`
+            Minimum and maximum voltage in p.u. and number of snapshots with
+            voltage out of `v_limits` per bus
+        """
+        return pd.DataFrame(
+            {'v_mag_pu_min': self.v_mag_pu_min,
+             'v_mag_pu_max': self.v_mag_pu_max,
+             'voltage_violations': self.voltage_violations},
+            index=pd.Index(self.buses, name='bus_id'))
+
+    def line_data(self):
+        """
+        Returns aggregated results of lines
+
+        Returns
+        -------
+        :pandas:`pandas.DataFrame<dataframe>`
+            Maximum apparent power in MVA, maximum loading relative to s_nom
+            and number of overloaded snapshots per line
+        """
+        return pd.DataFrame(
+            {'s_max': self.s_max,
+             'loading_max': self.s_max / self.s_nom,
+             'overloading': self.overloading},
+            index=pd.Index(self.lines, name='line_id'))
+
+
+def run_timeseries_powerflow(components, components_data, load_profiles,
+                             generator_profiles, chunk_size=168,
+                             v_limits=(0.9, 1.1), tol=1e-10, max_iter=100):
+    """
+    Runs power flow of a radial grid for time series of loads and generators
+
+    Active power of loads and generators is the product of their profile and
+    their peak load `p_set` and nominal power `p_nom`, respectively.
+    Reactive power follows from the ratio of reactive to active power in
+    `components_data`, i.e. the power factors assumed for load case and
+    feed-in case. Voltage set points of the first snapshot of
+    `components_data` are used for all snapshots.
+
+    Parameters
+    ----------
+    components: dict of :pandas:`pandas.DataFrame<dataframe>`
+        Component DataFrames, see
+        :class:`~.ding0.core.powerflow.radial.RadialPowerFlowProblem`
+    components_data: dict of :pandas:`pandas.DataFrame<dataframe>`
+        Time varying data of load case and feed-in case, see
+        :class:`~.ding0.core.powerflow.radial.RadialPowerFlowProblem`
+    load_profiles: :pandas:`pandas.DataFrame<dataframe>` or :obj:`numpy.ndarray` or :obj:`str`
+        Profiles of loads in p.u. of their peak load with snapshots in rows.
+        A DataFrame has a column per load. Columns of an array, e.g. a
+        memory-mapped one, are in the order of loads in `components`. A path
+        is read chunk by chunk, '.npy' files are memory-mapped, other files
+        are read as Parquet files with a column per load.
+    generator_profiles: :pandas:`pandas.DataFrame<dataframe>` or :obj:`numpy.ndarray` or :obj:`str`
+        Profiles of generators in p.u. of their nominal power, as
+        `load_profiles`. The slack generator has no profile. Profiles may be
+        None for grids without loads or generators.
+    chunk_size: :obj:`int`
+        Number of snapshots solved at once
+    v_limits: :obj:`tuple` of :obj:`float`
+        Minimum and maximum admissible voltage in p.u.
+    tol: :obj:`float`
+        Maximum change of voltage in p.u. between iterations for convergence
+    max_iter: :obj:`int`
+        Maximum number of iterations
+
+    Returns
+    -------
+    :class:`TimeSeriesResults`
+        Results aggregated over all snapshots
+    """
+    problem = RadialPowerFlowProblem(components, components_data)
+    loads = components['Load']
+    generators = components['Generator']
+    generators = generators[generators['control'] != 'Slack']
+
+    # complex power per unit of profile and matrices summing it up per bus
+    load_power = _power_per_unit(loads, components_data['Load'])
+    generator_power = _power_per_unit(generators,
+                                      components_data['Generator'],
+                                      scale='p_nom')
+    load_buses = _bus_matrix(problem, loads['bus'])
+    generator_buses = _bus_matrix(problem, generators['bus'])
+
+    results = TimeSeriesResults(
+        problem.buses, problem.lines,
+        components['Line']['s_nom'].to_numpy(dtype=float), v_limits=v_limits)
+    v_slack = problem.v_slack[:, :1]
+    chunks = zip_longest(
+        _profile_chunks(load_profiles, loads.index, chunk_size),
+        _profile_chunks(generator_profiles, generators.index, chunk_size))
+    for load_chunk, generator_chunk in chunks:
+        # grids without loads or generators need no profiles of them
+        if load_chunk is None and not len(loads):
+            load_chunk = np.zeros((len(generator_chunk), 0))
+        if generator_chunk is None and not len(generators):
+            generator_chunk = np.zeros((len(load_chunk), 0))
+        if (load_chunk is None or generator_chunk is None or
+                len(load_chunk) != len(generator_chunk)):
+            raise ValueError('Load and generator profiles differ in number '
+                             'of snapshots.')
+        s = (generator_buses @ (generator_chunk * generator_power).T -
+             load_buses @ (load_chunk * load_power).T)
+        v, j = problem.solve(tol=tol, max_iter=max_iter, s=s,
+                             v_slack=v_slack)
+        s0, s1 = problem.line_power(v, j)
+        results.add(np.abs(v), np.maximum(np.abs(s0), np.abs(s1)))
+        logger.debug('Power flow of {} snapshots solved.'.format(
+            results.n_snapshots))
+    return results
+
+
+def _power_per_unit(components, data, scale='p_set'):
+    """
+    Returns complex power of components per unit of their profile
+
+    The power factor is taken from the snapshot of `data` with the largest
+    active power of the component.
+    """
+    p_nom = components[scale].to_numpy(dtype=float)
+    q_factor = np.zeros(len(components))
+    data = data.reindex(components.index[components.index.isin(data.index)])
+    if not data.empty:
+        p_set = _series_to_array(data['p_set'])
+        q_set = _series_to_array(data['q_set'])
+        rows = np.arange(len(data))
+        snapshot = np.abs(p_set).argmax(axis=1)
+        p = p_set[rows, snapshot]
+        q = q_set[rows, snapshot]
+        q_factor[components.index.get_indexer(data.index)] = np.divide(
+            q, p, out=np.zeros_like(q), where=p != 0)
+    return p_nom * (1 + 1j * q_factor)
+
+
+def _bus_matrix(problem, buses):
+    """Returns sparse matrix summing up power of components per bus"""
+    return csr_matrix(
+        (np.ones(len(buses)),
+         (problem._bus_positions(buses), np.arange(len(buses)))),
+        shape=(len(problem.buses), len(buses)))
+
+
+def _profile_chunks(profiles, names, chunk_size):
+    """
+    Yields profiles of components `names` in arrays of `chunk_size`
+    snapshots, see :func:`run_timeseries_powerflow`
+    """
+    if profiles is None:
+        if len(names):
+            raise ValueError('Profiles of {} are missing.'.format(
+                sorted(names)))
+        return
+    if isinstance(profiles, (str, os.PathLike)):
+        if str(profiles).endswith('.npy'):
+            profiles = np.load(profiles, mmap_mode='r')
+        else:
+            yield from _parquet_chunks(profiles, names, chunk_size)
+            return
+    if isinstance(profiles, pd.DataFrame):
+        missing = names.difference(profiles.columns)
+        if len(missing):
+            raise ValueError('Profiles of {} are missing.'.format(
+                sorted(missing)))
+        profiles = profiles[names].to_numpy(dtype=float)
+    if profiles.ndim != 2 or profiles.shape[1] != len(names):
+        raise ValueError('Profiles of {} components expected, got array of '
+                         'shape {}.'.format(len(names), profiles.shape))
+    for start in range(0, len(profiles), chunk_size):
+        yield np.asarray(profiles[start:start + chunk_size], dtype=float)
+
+
+def _parquet_chunks(path, names, chunk_size):
+    """Yields profiles of components `names` from parquet file"""
+    if pq is None:
+        raise ImportError('Reading profiles from parquet files requires '
+                          'pyarrow.')
+    parquet_file = pq.ParquetFile(path)
+    missing = names.difference(parquet_file.schema_arrow.names)
+    if len(missing):
+        raise ValueError('Profiles of {} are missing in {}.'.format(
+            sorted(missing), path))
+    for batch in parquet_file.iter_batches(batch_size=chunk_size,
+                                           columns=list(names)):
+        profiles = np.empty((batch.num_rows, len(names)))
+        for i, name in enumerate(names):
+            profiles[:, i] = batch.column(name).to_numpy(
+                zero_copy_only=False)
+        yield profiles
@@ -603,11 +603,12 @@ def get_voltage_delta_branch(tree, node, r, x):
     :any:`float`
         Delta voltage for branch
     """
-    cos_phi_load = cfg_ding0.get('assumptions', 'cos_phi_load')
-    cos_phi_feedin = cfg_ding0.get('assumptions', 'cos_phi_gen')
-    cos_phi_load_mode = cfg_ding0.get('assumptions', 'cos_phi_load_mode')
-    cos_phi_feedin_mode = cfg_ding0.get('assumptions', 'cos_phi_gen_mode') #ToDo: Check if this is true. Why would generator run in a way that aggravates voltage issues?
-    v_nom = cfg_ding0.get('assumptions', 'lv_nominal_voltage')
+    assumptions = cfg_ding0.snapshot().assumptions
+    cos_phi_load = assumptions.cos_phi_load
+    cos_phi_feedin = assumptions.cos_phi_gen
+    cos_phi_load_mode = assumptions.cos_phi_load_mode
+    cos_phi_feedin_mode = assumptions.cos_phi_gen_mode #ToDo: Check if this is true. Why would generator run in a way that aggravates voltage issues?
+    v_nom = assumptions.lv_nominal_voltage
 
     # get apparent power for load and generation case
     peak_load, gen_capacity = get_cumulated_conn_gen_load(tree, node)
@@ -57,6 +57,12 @@ def reinforce_grid(grid, mode):
 
     # kind of grid to be evaluated (MV or LV)
     if mode == 'MV':
+        from ding0.tools.pypsa_io import PowerFlowSession
+
+        # PyPSA network is created on first power flow and updated with the
+        # reinforced branches in subsequent runs
+        pf_session = PowerFlowSession(grid)
+
         crit_branches, crit_stations = check_load(grid, mode)
 
         # STEP 1: reinforce branches
@@ -66,7 +72,7 @@ def reinforce_grid(grid, mode):
 
         # if branches or stations have been reinforced: run PF again to check for voltage issues
         if crit_branches or crit_stations:
-            grid.network.run_powerflow(method='onthefly')
+            pf_session.run()
 
         crit_nodes = check_voltage(grid, mode)
         crit_nodes_count_prev_step = len(crit_nodes)
@@ -80,7 +86,7 @@ def reinforce_grid(grid, mode):
             reinforce_branches_voltage(grid, crit_branches_v)
 
             # run PF
-            grid.network.run_powerflow(session=None, method='onthefly')
+            pf_session.run()
 
             crit_nodes = check_voltage(grid, mode)
 
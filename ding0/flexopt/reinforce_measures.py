@@ -18,6 +18,7 @@ import os
 import ding0
 import pandas as pd
 from ding0.tools import config as cfg_ding0
+from ding0.tools.equipment import sorted_equipment
 from ding0.grid.lv_grid.build_grid import select_transformers
 from ding0.core.network import TransformerDing0
 from ding0.flexopt.check_tech_constraints import get_voltage_at_bus_bar
@@ -54,24 +55,18 @@ def reinforce_branches_current(grid, crit_branches):
     ding0.flexopt.reinforce_measures.reinforce_branches_voltage :
     """
     # load cable data, file_names and parameter
-    branch_parameters = grid.network.static_data['MV_cables']
-    branch_parameters = branch_parameters[branch_parameters['U_n'] == grid.v_level].sort_values('I_max_th')
+    branch_parameters = sorted_equipment(grid.network.static_data['MV_cables'],
+                                         'I_max_th', U_n=grid.v_level)
 
     branch_ctr = 0
 
     for branch, rel_overload in crit_branches.items():
-        try:
-            type = branch_parameters.loc[
-                branch_parameters[
-                    branch_parameters['I_max_th'] >= branch 
-                    .type['I_max_th'] * rel_overload
-                ].loc[
-                    :, 'I_max_th'
-                ].idxmin(), :
-            ]
+        type = branch_parameters.select(
+            branch.type['I_max_th'] * rel_overload, inclusive=True)
+        if type is not None:
             branch.type = type
             branch_ctr += 1
-        except:
+        else:
             logger.warning('Branch {} could not be reinforced (current '
                            'issues) as there is no appropriate cable type '
                            'available. Original type is retained.'.format(
@@ -107,24 +102,19 @@ def reinforce_branches_voltage(grid, crit_branches, grid_level='MV'):
     """
 
     # load cable data, file_names and parameter
-    branch_parameters = grid.network.static_data['{gridlevel}_cables'.format(
-        gridlevel=grid_level)]
-    branch_parameters = branch_parameters[branch_parameters['U_n'] == grid.v_level].sort_values('I_max_th')
+    branch_parameters = sorted_equipment(
+        grid.network.static_data['{gridlevel}_cables'.format(
+            gridlevel=grid_level)],
+        'I_max_th', U_n=grid.v_level)
 
     branch_ctr = 0
 
     for branch in crit_branches:
-        try:
-            type = branch_parameters.loc[
-                branch_parameters.loc[
-                       branch_parameters['I_max_th'] > branch.type['I_max_th']
-                ].loc[
-                    :, 'I_max_th'
-                ].idxmin(), :
-            ]
+        type = branch_parameters.select(branch.type['I_max_th'])
+        if type is not None:
             branch.type = type
             branch_ctr += 1
-        except:
+        else:
             logger.warning('Branch {} could not be reinforced (voltage '
                            'issues) as there is no appropriate cable type '
                            'available. Original type is retained.'.format(
@@ -18,6 +18,7 @@ from ding0.tools import config as cfg_ding0
 from ding0.core.network import TransformerDing0, BranchDing0
 from ding0.core.network.cable_distributors import LVCableDistributorDing0
 from ding0.core.network.loads import LVLoadDing0
+from ding0.tools.equipment import sorted_equipment
 import logging
 import math
 
@@ -93,8 +94,8 @@ def select_transformers(grid, s_max=None):
     cos_phi_gen = cfg_ding0.get('assumptions',
                                 'cos_phi_gen')
 
-    # get equipment parameters of LV transformers
-    trafo_parameters = grid.network.static_data['LV_trafos']
+    # get equipment parameters of LV transformers sorted by nominal power
+    trafos = sorted_equipment(grid.network.static_data['LV_trafos'], 'S_nom')
 
     # determine s_max from grid object if not provided via arguments
     if s_max is None:
@@ -122,28 +123,20 @@ def select_transformers(grid, s_max=None):
                              '`s_max`.')
         s_max = s_max['s_max']
 
-    # get max. trafo
-    transformer_max = trafo_parameters.iloc[trafo_parameters['S_nom'].idxmax()]
-
-    # peak load is smaller than max. available trafo
-    if s_max < (transformer_max['S_nom'] * load_factor_lv_trans ):
-        # choose trafo
-        transformer = trafo_parameters.iloc[
-            trafo_parameters[
-                trafo_parameters['S_nom'] * load_factor_lv_trans > s_max][
-                'S_nom'].idxmin()]
-        transformer_cnt = 1
+    # choose smallest trafo whose capacity (respecting load factor) exceeds
+    # peak load
+    transformer = trafos.select(s_max, factor=load_factor_lv_trans)
+    transformer_cnt = 1
+
     # peak load is greater than max. available trafo -> use multiple trafos
-    else:
+    if transformer is None:
         transformer_cnt = 2
         # increase no. of trafos until peak load can be supplied
-        while not any(trafo_parameters['S_nom'] * load_factor_lv_trans > (
-                    s_max / transformer_cnt)):
+        while trafos.position(s_max / transformer_cnt,
+                              factor=load_factor_lv_trans) is None:
             transformer_cnt += 1
-        transformer = trafo_parameters.iloc[
-            trafo_parameters[
-                trafo_parameters['S_nom'] * load_factor_lv_trans
-                > (s_max / transformer_cnt)]['S_nom'].idxmin()]
+        transformer = trafos.select(s_max / transformer_cnt,
+                                    factor=load_factor_lv_trans)
 
     return transformer, transformer_cnt
 
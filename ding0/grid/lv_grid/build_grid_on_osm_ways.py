@@ -13,9 +13,6 @@ __url__ = "https://github.com/openego/ding0/blob/master/LICENSE"
 __author__ = "nesnoj, gplssm"
 
 import networkx as nx
-import pymetis
-
-import osmnx as ox
 import numpy as np
 from math import tan, acos
 from shapely.geometry import LineString, Point
@@ -24,8 +21,9 @@ from ding0.core.network import BranchDing0
 from ding0.core.network.cable_distributors import LVCableDistributorDing0
 from ding0.core.network.loads import LVLoadDing0
 from ding0.tools import config as cfg_ding0
-from ding0.tools.pypsa_io import q_sign
-from ding0.grid.lv_grid.routing import identify_street_loads
+from ding0.tools.equipment import sorted_equipment
+from ding0.core.powerflow import q_sign
+from ding0.grid.lv_grid.routing import identify_street_loads, NodeTree, point_coords
 from ding0.grid.mv_grid.tools import get_shortest_path_shp_single_target, get_shortest_path_shp_multi_target
 
 from ding0.config.config_lv_grids_osm import get_config_osm, get_load_profile_categories
@@ -73,6 +71,7 @@ def partition_network(network, n_parts=2, node_weight='load', edge_weight='lengt
             A list of partitioned parts, where each part is a list of node IDs belonging to that partition.
 
        """
+    import pymetis
 
     args, index = convert_graph_c(network, nparts=n_parts, node_weight=node_weight, edge_weight=edge_weight)
     args["contiguous"] = contiguous
@@ -198,19 +197,19 @@ def relocate_buildings_with_station_as_nn(full_graph, station_id, lv_loads_grid)
 
     if station_nbs:
 
-        G = full_graph.copy()
-        G = G.subgraph(station_nbs)
-
         station_as_nn = lv_loads_grid.loc[lv_loads_grid['nn'] == station_id]
 
         # if all or one building has station as nearest nodes, pass over relocation
-        if len(station_as_nn) != len(lv_loads_grid) or len(station_as_nn) > 1:
+        if (len(station_as_nn) != len(lv_loads_grid) or len(station_as_nn) > 1) \
+                and len(station_as_nn):
 
-            for building_node, row in station_as_nn.iterrows():
-                node_id, nn_dist = ox.nearest_nodes(G, row["geometry"].x, row["geometry"].y, return_dist=True)
-                lv_loads_grid.at[building_node, 'nn'] = node_id
-                lv_loads_grid.at[building_node, 'nn_coords'] = Point(G.nodes[node_id]['x'], G.nodes[node_id]['y'])
-                lv_loads_grid.at[building_node, 'nn_dist'] = nn_dist
+            # nearest neighbours of station for all buildings at once
+            tree = NodeTree(full_graph, nodes=station_nbs)
+            xy = point_coords(station_as_nn["geometry"])
+            pos, dist = tree.query(xy[:, 0], xy[:, 1])
+            lv_loads_grid.loc[station_as_nn.index, 'nn'] = [tree.nodes[i] for i in pos]
+            lv_loads_grid.loc[station_as_nn.index, 'nn_coords'] = tree.node_points(pos)
+            lv_loads_grid.loc[station_as_nn.index, 'nn_dist'] = dist
 
     return lv_loads_grid
 
@@ -310,17 +309,14 @@ def reinforce_cable_type(lim_current, lvgd_cfg):
 
     # get static data on lv level
     lv_cable_lf = lvgd_cfg['lv_cable_lf']
-    lv_cables_df = lvgd_cfg['lv_cables_df']
+    lv_cables = sorted_equipment(lvgd_cfg['lv_cables_df'], 'I_max_th')
 
-    # find suitable cable types
-    suitable_cables = lv_cables_df[(lv_cables_df['I_max_th'] * lv_cable_lf) > lim_current]
+    # find minimum required cable
+    cable_type = lv_cables.select(lim_current, factor=lv_cable_lf)
     reinforcable = True
 
-    # find minimum required cable
-    if len(suitable_cables):
-        cable_type = suitable_cables.loc[suitable_cables['I_max_th'].idxmin(), :]
-    else: # TODO: what happens if no cable suitable because current limit / voltage drop too high
-        cable_type = lv_cables_df.iloc[-1]
+    if cable_type is None: # TODO: what happens if no cable suitable because current limit / voltage drop too high
+        cable_type = lv_cables.largest()
         reinforcable = False
 
     return cable_type, reinforcable
@@ -426,7 +422,7 @@ def build_branches_on_osm_ways(lvgd):
     lvgd_cfg['cos_phi_load'] = cfg_ding0.get('assumptions', 'cos_phi_load')
     lvgd_cfg['cos_phi_load_mode'] = cfg_ding0.get('assumptions', 'cos_phi_load_mode')
     lvgd_cfg['lv_cable_lf'] = cfg_ding0.get('assumptions', 'load_factor_lv_cable_lc_normal')
-    lvgd_cfg['lv_cables_df'] = lvgd.lv_grid.network.static_data['LV_cables'].sort_values('I_max_th')
+    lvgd_cfg['lv_cables_df'] = lvgd.lv_grid.network.static_data['LV_cables']
 
     # obtain shortest_tree_graph_district from graph_district
     # due to graph_district contains all osm ways in district
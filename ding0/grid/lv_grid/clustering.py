@@ -1,4 +1,3 @@
-from sklearn.cluster import AgglomerativeClustering
 import numpy as np
 import networkx as nx
 
@@ -38,6 +37,7 @@ def apply_AgglomerativeClustering(G, k, round_decimals=True):
     may be rounded in different ways, depending on ram/ hardware.
     return labels
     """
+    from sklearn.cluster import AgglomerativeClustering
 
     if len(G.nodes) > 1:
 
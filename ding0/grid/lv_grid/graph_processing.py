@@ -1,6 +1,7 @@
 """
 Graph processing.
 """
+from geoalchemy2.elements import WKBElement
 from geoalchemy2.shape import to_shape
 
 from ding0.config.config_lv_grids_osm import get_config_osm
@@ -11,15 +12,27 @@ import pandas as pd
 from itertools import combinations
 
 import networkx as nx
-import osmnx as ox
 
-import geopandas as gpd
 from shapely.geometry import LineString, Point, MultiLineString, Polygon
 from shapely.ops import linemerge
 
 from scipy.spatial.distance import cdist
 import numpy as np
 
+# geometries of many coordinates are parsed and created at once with
+# shapely >= 2.0
+try:
+    from shapely import from_wkb, get_coordinates, get_num_coordinates, \
+        linestrings
+except ImportError:
+    from_wkb = None
+    linestrings = None
+
+try:
+    from shapely import contains_xy
+except ImportError:
+    from shapely.vectorized import contains as contains_xy
+
 # src: https://stackoverflow.com/questions/28246425/python-convert-a-list-of-nested-tuples-into-a-dict
 flatten = lambda *n: (e for a in n for e in (flatten(*a) if isinstance(a, (tuple, list)) else (a,)))
 
@@ -36,47 +49,126 @@ def update_ways_geo_to_shape(ways_sql_df):
     """
     update_ways_geo_to_shape
     after loading from DB
+
+    Replaces the geometries of the ways by arrays of their coordinates
+    of shape (n, 2). With shapely >= 2.0, the geometries of all ways are
+    parsed at once.
     """
 
-    ways_sql_df['geometry'] = ways_sql_df.apply(lambda way: to_shape(way.geometry).coords, axis=1)
+    geometries = ways_sql_df['geometry'].tolist()
+    if from_wkb is not None and all(isinstance(geometry, WKBElement)
+                                    for geometry in geometries):
+        geometries = from_wkb([geometry.data if isinstance(geometry.data, str)
+                               else bytes(geometry.data)
+                               for geometry in geometries])
+        coords = np.split(get_coordinates(geometries),
+                          np.cumsum(get_num_coordinates(geometries))[:-1])
+    else:
+        coords = [np.asarray(to_shape(geometry).coords)[:, :2]
+                  for geometry in geometries]
+    ways_sql_df['geometry'] = pd.Series(coords, index=ways_sql_df.index,
+                                        dtype=object)
 
     return ways_sql_df
 
 
+def explode_ways(ways_df):
+    """
+    Explodes osm ways into arrays of their segments and nodes
+
+    Parameters
+    ----------
+    ways_df : :pandas:`pandas.DataFrame<DataFrame>`
+        Ways with columns `osm_id`, `nodes`, `geometry`, `highway` and
+        `length_segments`, see :func:`update_ways_geo_to_shape`.
+
+    Returns
+    -------
+    :pandas:`pandas.DataFrame<DataFrame>`
+        Segments of all ways with start node `u`, end node `v` and the
+        columns `length`, `osmid` and `highway`
+    :pandas:`pandas.DataFrame<DataFrame>`
+        Coordinates `x` and `y` of all nodes of the ways, nodes occurring in
+        multiple ways are contained multiple times
+    """
+    n_nodes = ways_df['nodes'].map(len).to_numpy()
+    nodes = ways_df['nodes'].explode().infer_objects().to_numpy()
+    coords = np.concatenate(
+        [np.asarray(geometry, dtype=float).reshape(-1, 2)
+         for geometry in ways_df['geometry']]) \
+        if len(ways_df) else np.empty((0, 2))
+
+    # segments connect consecutive nodes except last node of each way
+    is_start = np.ones(len(nodes), dtype=bool)
+    is_start[np.cumsum(n_nodes) - 1] = False
+    start = np.flatnonzero(is_start)
+    segments = pd.DataFrame({
+        'u': nodes[start],
+        'v': nodes[start + 1],
+        'length': ways_df['length_segments'].explode().infer_objects()
+            .to_numpy(),
+        'osmid': np.repeat(ways_df['osm_id'].to_numpy(), n_nodes - 1),
+        'highway': np.repeat(ways_df['highway'].to_numpy(), n_nodes - 1),
+    })
+    node_coords = pd.DataFrame(coords, index=nodes, columns=['x', 'y'])
+
+    return segments, node_coords
+
+
 def build_graph_from_ways(ways_df):
 
     """ 
     Build graph based on osm ways
     Based on this graph, the routing will be implemented.
+
+    Ways are exploded into segments, which are added in both directions to
+    a directed graph at once. Nodes, edges, their keys and their order are
+    the same as for an undirected graph built segment by segment and
+    converted by :meth:`networkx.MultiGraph.to_directed`.
     """
     # init a graph and set srid.
-    graph = nx.MultiGraph()
+    graph = nx.MultiDiGraph()
     graph.graph["crs"] = 'epsg:' + str(get_config_osm('srid'))
     graph.graph["source"] = 'osm'
 
-    for index, osm_id, nodes, geometry, highway, length_segments in ways_df.itertuples():
-        # add edges
-        ix = 0
-        for node in nodes[:-1]:
-            graph.add_edge(nodes[ix],
-                           nodes[ix + 1],
-                           length=length_segments[ix],
-                           osmid=osm_id,
-                           highway=highway)
-            ix += 1
-
-        # add coords
-        ix = 0
-        coords_list = list(geometry)
-        for node in nodes:
-            graph.nodes[node]['x'] = coords_list[ix][0]
-            graph.nodes[node]['y'] = coords_list[ix][1]
-            graph.nodes[node]['node_type'] = 'non_synthetic'
-
-            ix += 1
-
-    # convert undirected graph to digraph due to truncate_graph_polygon
-    graph = graph.to_directed()
+    segments, node_coords = explode_ways(ways_df)
+
+    # nodes are ordered by first occurrence in the segments
+    codes, nodes = pd.factorize(
+        np.column_stack([segments.u.to_numpy(),
+                         segments.v.to_numpy()]).ravel())
+    u_code, v_code = codes[0::2], codes[1::2]
+    # coordinates of the way processed last are kept for each node
+    node_coords = node_coords[
+        ~node_coords.index.duplicated(keep='last')].reindex(nodes)
+    graph.add_nodes_from(
+        (node, {'x': x, 'y': y, 'node_type': 'non_synthetic'})
+        for node, x, y in zip(nodes.tolist(), node_coords.x.tolist(),
+                              node_coords.y.tolist()))
+
+    # parallel segments between the same nodes are distinguished by their
+    # key; neighbors of each node are ordered by the first segment
+    # connecting them
+    pair_id = pd.factorize(np.minimum(u_code, v_code).astype(np.int64)
+                           * len(nodes) + np.maximum(u_code, v_code))[0]
+    key = pd.Series(pair_id).groupby(pair_id).cumcount().to_numpy()
+    # self loops are added once
+    backward = np.flatnonzero(u_code != v_code)
+    segment = np.concatenate([np.arange(len(segments)), backward])
+    source = np.concatenate([u_code, v_code[backward]])
+    target = np.concatenate([v_code, u_code[backward]])
+    order = np.lexsort((key[segment], pair_id[segment], source))
+    segment, source, target = segment[order], source[order], target[order]
+
+    nodes = nodes.tolist()
+    length = segments.length.to_numpy()[segment].tolist()
+    osmid = segments.osmid.to_numpy()[segment].tolist()
+    highway = segments.highway.to_numpy()[segment].tolist()
+    graph.add_edges_from(
+        (nodes[u], nodes[v], k,
+         {'length': length[i], 'osmid': osmid[i], 'highway': highway[i]})
+        for i, (u, v, k) in enumerate(zip(source.tolist(), target.tolist(),
+                                          key[segment].tolist())))
 
     return graph
 
@@ -116,30 +208,57 @@ def create_buffer_polygons(polygon):
     return buffer_poly_list
 
 
-def graph_nodes_outside_buffer_polys(graph, ways_sql_df, buffer_poly_list):
-    
-    """
-    src: https://www.matecdev.com/posts/point-in-polygon.html
-    For each buffer polygon identify graph nodes outside buffer polygon
-    Return nested node list of nodes to remove.
+def buffer_poly_index(x, y, buffer_poly_list):
     """
+    Returns index of smallest buffer polygon containing each point
 
-    nodes = flatten(ways_sql_df.nodes.tolist())
-    points = flatten(ways_sql_df.geometry.tolist())
+    Buffer polygons are nested as created by :func:`create_buffer_polygons`,
+    points are therefore only tested against a polygon if they are within
+    the next larger one.
 
-    nodes_list = list(nodes)
-    points_list = [list(p) for p in list(points)]
-    points_list = [Point(item) for sublist in points_list for item in sublist]
+    Parameters
+    ----------
+    x, y : :obj:`numpy.ndarray`
+        Coordinates of points
+    buffer_poly_list : :obj:`list` of :shapely:`Shapely Polygon object<polygons>`
+        Nested buffer polygons, ordered from smallest to largest
 
-    nodes = pd.DataFrame(points_list, index=nodes_list, columns=['geometry'])
-    nodes_gdf = gpd.GeoDataFrame(nodes, geometry='geometry', crs=graph.graph["crs"])
+    Returns
+    -------
+    :obj:`numpy.ndarray`
+        Index of smallest buffer polygon per point, points outside of all
+        buffer polygons get `len(buffer_poly_list)`
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    index = np.full(len(x), len(buffer_poly_list))
+    for poly_idx in reversed(range(len(buffer_poly_list))):
+        candidates = np.flatnonzero(index == poly_idx + 1)
+        within = contains_xy(buffer_poly_list[poly_idx],
+                             x[candidates], y[candidates])
+        index[candidates[within]] = poly_idx
+    return index
 
-    polys_df = pd.DataFrame(buffer_poly_list, index=[i for i in range(len(buffer_poly_list))], columns=['geometry'])
-    polys_gdf = gpd.GeoDataFrame(polys_df, geometry='geometry', crs=graph.graph["crs"])
 
-    PointsInPolys = gpd.tools.sjoin(nodes_gdf, polys_gdf, op="within", how='left')
+def graph_nodes_outside_buffer_polys(graph, ways_sql_df, buffer_poly_list):
     
-    nodes_to_remove = [list(set(nodes_list) - set(PointsInPolys.loc[PointsInPolys['index_right'] == poly].index.tolist())) for poly in range(len(buffer_poly_list))]
+    """
+    For each buffer polygon identify graph nodes outside buffer polygon
+    Return nested node list of nodes to remove.
+
+    Nodes of the ways are classified by the smallest buffer polygon
+    containing them, see :func:`buffer_poly_index`.
+    """
+    _, node_coords = explode_ways(ways_sql_df)
+    index = pd.Series(
+        buffer_poly_index(node_coords.x.to_numpy(), node_coords.y.to_numpy(),
+                          buffer_poly_list),
+        index=node_coords.index)
+    # nodes occurring in multiple ways are kept if any of them is within
+    index = index.groupby(level=0, sort=False).min()
+
+    nodes_to_remove = [index.index[index.to_numpy() > poly_idx].tolist()
+                       for poly_idx in range(len(buffer_poly_list))]
 
     return nodes_to_remove
 
@@ -148,10 +267,11 @@ def truncate_graph_nodes(graph, nested_node_list, poly_idx):
     """
     Remove nodes from buffer graphs based on nested node list
     and index of buffer polygon
+
+    Returns a read-only view of `graph` without copying it, the view
+    follows later changes of `graph`.
     """
-    G = graph.copy()
-    G.remove_nodes_from(nested_node_list[poly_idx])
-    return G
+    return nx.restricted_view(graph, nested_node_list[poly_idx], [])
 
 
 def compose_graph(outer_graph, graph_subdiv):
@@ -162,6 +282,7 @@ def compose_graph(outer_graph, graph_subdiv):
     compose conn_graph with graph_subdiv_directed to have subdivides edges of
     graph_subdiv_directed in conn_graph
     """
+    import osmnx as ox
     composed_graph = nx.compose(outer_graph, graph_subdiv)
 
     if not nx.is_weakly_connected(composed_graph):
@@ -262,10 +383,11 @@ def get_fully_conn_graph(G, nlist): #nested_node_list
 
     if nx.number_weakly_connected_components(G_min) > 1:
 
+        # G_min is a view of G, get its component before connecting G
+        G_c = nodes_connected_component(G_min, G_min.nodes())
         G, synthetic_edges = connect_graph_components(G, synthetic_edges, method='major_ccs')
         G_c_max = nodes_connected_component(G, G_min.nodes())
         nodes_to_connect = set(G_c_max.nodes) & set(G_min.nodes)
-        G_c = nodes_connected_component(G_min, G_min.nodes())
 
         while not all(node in G_c.nodes for node in nodes_to_connect):
 
@@ -293,7 +415,7 @@ def get_fully_conn_graph(G, nlist): #nested_node_list
     else:
 
         logger.debug(f'Graph already fully connected.')
-        G_c = G_min
+        G_c = G_min.copy()
 
     return G_c, synthetic_edges
 
@@ -358,6 +480,7 @@ def _get_paths_to_simplify(G, nodes_to_keep, strict=True):
     ------
     path_to_simplify : list
     """    
+    import osmnx as ox
     
     # for each endpoint node, look at each of its successor nodes
     for endpoint in nodes_to_keep:
@@ -400,6 +523,7 @@ def simplify_graph_adv(G, street_load_nodes, strict=True, remove_rings=True):
         topologically simplified graph, with a new `geometry` attribute on
         each simplified edge
     """
+    import osmnx as ox
     ### PAUL
     #if "simplified" in G.graph and G.graph["simplified"]:  # pragma: no cover
         #raise Exception("This graph has already been simplified, cannot simplify it again.")
@@ -676,6 +800,54 @@ def remove_unloaded_loops(G, nodes_of_interest):
     return G
 
 
+def interpolate_segments(start, end, dist):
+    """
+    Interpolates evenly spaced points along straight segments
+
+    Points of all segments are computed at once. They equal the points of
+    :func:`osmnx.utils_geo.interpolate_points` for each two-point
+    LineString, i.e. round(length / dist) parts per segment (at least one)
+    and the GEOS arithmetic of interpolating along a segment.
+
+    Parameters
+    ----------
+    start: :obj:`numpy.ndarray`
+        Coordinates of start points of segments, shape (n, 2)
+    end: :obj:`numpy.ndarray`
+        Coordinates of end points of segments, shape (n, 2)
+    dist: :obj:`float`
+        Spacing distance between interpolated points
+
+    Returns
+    -------
+    :obj:`numpy.ndarray`
+        Coordinates of points of all segments including start and end
+        points, shape (m, 2)
+    :obj:`numpy.ndarray`
+        Number of parts of each segment, points of segment i are
+        ``parts[i] + 1`` rows starting at ``sum(parts[:i] + 1)``
+    """
+    delta = end - start
+    length = np.sqrt(delta[:, 0] * delta[:, 0] + delta[:, 1] * delta[:, 1])
+    parts = np.maximum(np.rint(length / dist), 1).astype(int)
+
+    # segment and part number of each point
+    segment = np.repeat(np.arange(len(parts)), parts + 1)
+    offsets = np.cumsum(parts + 1) - (parts + 1)
+    part = np.arange(len(segment)) - offsets[segment]
+
+    # distance along segment as fraction of its length, as done by GEOS
+    length = length[segment]
+    with np.errstate(invalid='ignore'):
+        frac = np.where(length > 0, part / parts[segment] * length / length,
+                        0.)[:, None]
+    points = np.where(
+        frac <= 0, start[segment],
+        np.where(frac >= 1, end[segment],
+                 (end[segment] - start[segment]) * frac + start[segment]))
+    return points, parts
+
+
 def subdivide_graph_edges(inner_graph): #(inner_graph, inner_node_list):
 
     """
@@ -684,75 +856,83 @@ def subdivide_graph_edges(inner_graph): #(inner_graph, inner_node_list):
     TODO: keep information about edge name
           ensure edge name does not exist when adding
     """ 
-
     graph_subdiv = inner_graph.copy()
-    edges = inner_graph.edges()
-    edge_data = []
-    node_data = []
-    unique_syn_nodes = []
-    origin_vertices = []
-
-    for u,v in edges:
-
-        origin_vertices.append((v,u))
-
-        if (u,v) in origin_vertices:
-            pass
-        else:
-
-            linestring = line_shp_from_node_pair(inner_graph, u, v)
-            vertices_gen = ox.utils_geo.interpolate_points(linestring, get_config_osm('dist_edge_segments')) #### config
-            vertices = list(vertices_gen) 
-            highway = inner_graph.edges[u,v,0]['highway']
-            osmid = inner_graph.edges[u,v,0]['osmid']
-            # fromid = graph.edges[u,v,0]['from'] ### PAUL
-            # toid = graph.edges[u,v,0]['to'] ### PAUL
-            edge_id = u + v
-            vertex_node_id = []
-
-            for num,node in enumerate(list(vertices)[1:-1], start=1):
-                x,y = node[0],node[1] ###
-
-                # ensure synthetic node id does not exist in graph.
-                # increment name by 1 if exist and check again
-                skip_num_by=0
-                while True:
-
-                    # first name edge_id + 0 + 1(=num) + 0(=skip_num_by)
-                    concat_0 = 0 # todo: check concat_0 is to change. check if node name needs to be str
-                    name = int(str(edge_id) + str(concat_0) + str(num+skip_num_by))
-                    if name in unique_syn_nodes: #graph_subdiv.nodes():
-
-                        skip_num_by +=1
-                        name = int(str(edge_id) + str(concat_0) + str(num+skip_num_by)) ####
-
-                    else:
-
-                        break
-
-                node_data.append([name,x,y,(u,v)])
-                vertex_node_id.append(name)
-                unique_syn_nodes.append(name)
-
-            if vertices[0] == (inner_graph.nodes[v]['x'],inner_graph.nodes[v]['y']): ###
-                vertex_node_id.insert(0, v)
-                vertex_node_id.append(u)
-            else:
-                vertex_node_id.insert(0, u)
-                vertex_node_id.append(v)
-
-            for i,j in zip(range(len(list(vertices))-1), range(len(vertex_node_id)-1)):
-                line = LineString([vertices[i], vertices[i+1]])
-                edge_data.append([vertex_node_id[j], vertex_node_id[j+1], line, line.length, highway, osmid])
+    edges = list(inner_graph.edges())
+
+    # edges are subdivided once for both directions
+    reverse_edges = set()
+    edges_subdiv = []
+    for u, v in edges:
+        reverse_edges.add((v, u))
+        if (u, v) not in reverse_edges:
+            edges_subdiv.append((u, v))
+
+    nodes = inner_graph.nodes
+    start = np.array([(nodes[u]['x'], nodes[u]['y']) for u, v in edges_subdiv],
+                     dtype=float).reshape(-1, 2)
+    end = np.array([(nodes[v]['x'], nodes[v]['y']) for u, v in edges_subdiv],
+                   dtype=float).reshape(-1, 2)
+    vertices, parts = interpolate_segments(
+        start, end, get_config_osm('dist_edge_segments'))
+
+    # segments between consecutive vertices of each edge
+    last_vertices = np.cumsum(parts + 1) - 1
+    is_segment = np.ones(len(vertices), dtype=bool)
+    is_segment[last_vertices] = False
+    segments_start = vertices[:-1][is_segment[:-1]]
+    segments_end = vertices[1:][is_segment[:-1]]
+    delta = segments_end - segments_start
+    segments_length = np.sqrt(
+        delta[:, 0] * delta[:, 0] + delta[:, 1] * delta[:, 1]).tolist()
+    if linestrings is not None:
+        lines = linestrings(np.stack([segments_start, segments_end], axis=1))
+    else:
+        lines = [LineString(coords) for coords in
+                 np.stack([segments_start, segments_end], axis=1)]
+    vertices = vertices.tolist()
 
-    #build new graph 
+    # synthetic node ids are edge_id + 0 + number of vertex, the number is
+    # incremented while the id is taken by a synthetic node of another edge
+    synthetic_nodes = set()
+    node_data = []
+    edge_data = []
+    vertex = 0
+    segment = 0
+    for (u, v), n_parts in zip(edges_subdiv, parts.tolist()):
+        edge = inner_graph[u][v][0]
+        highway = edge['highway']
+        osmid = edge['osmid']
+        edge_id = u + v
+
+        vertex_node_id = [u]
+        for num in range(1, n_parts):
+            skip_num_by = 0
+            while True:
+                name = int(str(edge_id) + '0' + str(num + skip_num_by))
+                if name not in synthetic_nodes:
+                    break
+                skip_num_by += 1
+            synthetic_nodes.add(name)
+            x, y = vertices[vertex + num]
+            node_data.append((name, {'x': x, 'y': y, 'node_type': 'synthetic'}))
+            vertex_node_id.append(name)
+        vertex_node_id.append(v)
+
+        # zero length edges start at node v
+        if vertices[vertex] == [nodes[v]['x'], nodes[v]['y']]:
+            vertex_node_id[0], vertex_node_id[-1] = v, u
+
+        for node0, node1 in zip(vertex_node_id[:-1], vertex_node_id[1:]):
+            data = {'geometry': lines[segment], 'length': segments_length[segment],
+                    'highway': highway, 'osmid': osmid}
+            edge_data.append((node0, node1, data))
+            edge_data.append((node1, node0, data))
+            segment += 1
+        vertex += n_parts + 1
+
+    #build new graph
     graph_subdiv.remove_edges_from(edges)
-
-    for u,v,line,leng,highway,osmid in edge_data:
-        graph_subdiv.add_edge(u,v,geometry=line,length=leng,highway=highway,osmid=osmid)
-        graph_subdiv.add_edge(v,u,geometry=line,length=leng,highway=highway,osmid=osmid)
-
-    for name,x,y,pos in node_data:
-        graph_subdiv.add_node(name,x=x,y=y,node_type='synthetic')
+    graph_subdiv.add_edges_from(edge_data)
+    graph_subdiv.add_nodes_from(node_data)
 
     return graph_subdiv #graph_subdiv, edges
@@ -3,7 +3,8 @@ Routing based on ways from OSM.
 TODO: Separate routing.py to graph_processing.py
 """
 
-import osmnx as ox
+import weakref
+
 import networkx as nx
 
 #from pyproj import CRS
@@ -33,13 +34,14 @@ try:
     from scipy.spatial import cKDTree
 except ImportError:  # pragma: no cover
     cKDTree = None
-    
 
-# scikit-learn is optional dependency for unprojected nearest-neighbor search
+# coordinates and points of many geometries are handled at once with
+# shapely >= 2.0
 try:
-    from sklearn.neighbors import BallTree
-except ImportError:  # pragma: no cover
-    BallTree = None
+    from shapely import get_coordinates, points
+except ImportError:
+    get_coordinates = None
+    points = None
 
 
 ## https://stackoverflow.com/questions/28246425/python-convert-a-list-of-nested-tuples-into-a-dict
@@ -48,19 +50,214 @@ flatten = lambda *n: (e for a in n for e in (flatten(*a) if isinstance(a, (tuple
 
 
 
+class NodeTree:
+    """
+    KD-tree of node coordinates of a projected street graph
+
+    Finds nearest nodes of many points at once by euclidean distance,
+    the same as :func:`osmnx.distance.nearest_nodes` does for projected
+    graphs, without building the spatial index on every call. Trees of
+    whole graphs are kept by :func:`node_tree`.
+
+    Parameters
+    ----------
+    graph: :networkx:`NetworkX Graph Obj< >`
+        Graph with node attributes `x` and `y`
+    nodes: :obj:`list`, optional
+        Nodes of graph to search in, defaults to all nodes
+
+    Attributes
+    ----------
+    nodes: :obj:`list`
+        Nodes of tree, positions returned by :meth:`query` refer to them
+    coords: :obj:`numpy.ndarray`
+        Coordinates of nodes, shape (n, 2)
+    """
+
+    def __init__(self, graph, nodes=None):
+        if cKDTree is None:  # pragma: no cover
+            raise ImportError('scipy must be installed to search nearest '
+                              'nodes of a graph')
+        self.nodes = list(graph.nodes if nodes is None else nodes)
+        node_data = graph.nodes
+        self.coords = np.array(
+            [(node_data[node]['x'], node_data[node]['y'])
+             for node in self.nodes], dtype=float).reshape(-1, 2)
+        self.tree = cKDTree(self.coords)
+        self._points = None
+        self._node_set = None
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def has_nodes_of(self, graph):
+        """
+        Checks if tree holds exactly the nodes of graph
+
+        Parameters
+        ----------
+        graph: :networkx:`NetworkX Graph Obj< >`
+            Graph to compare nodes with
+
+        Returns
+        -------
+        :obj:`bool`
+            True if nodes of tree and graph are the same
+        """
+        if len(self.nodes) != len(graph):
+            return False
+        if self._node_set is None:
+            self._node_set = set(self.nodes)
+        # same number of nodes, all nodes of graph are in tree
+        return self._node_set.issuperset(graph)
+
+    def query(self, x, y, exclude=None):
+        """
+        Returns positions of nearest nodes of points and their distances
+
+        Parameters
+        ----------
+        x: :obj:`float` or array-like
+            x coordinates of points
+        y: :obj:`float` or array-like
+            y coordinates of points
+        exclude: :obj:`set`, optional
+            Nodes not to be returned, e.g. nodes of stations
+
+        Returns
+        -------
+        :obj:`numpy.ndarray`
+            Positions of nearest nodes in :attr:`nodes`
+        :obj:`numpy.ndarray`
+            Distances to nearest nodes
+        """
+        xy = np.column_stack([np.atleast_1d(np.asarray(x, dtype=float)),
+                              np.atleast_1d(np.asarray(y, dtype=float))])
+        excluded = (np.array([node in exclude for node in self.nodes],
+                             dtype=bool)
+                    if exclude else np.zeros(len(self.nodes), dtype=bool))
+        if excluded.all():
+            raise ValueError('No node left to search in.')
+
+        if not excluded.any():
+            dist, pos = self.tree.query(xy, k=1)
+            return pos, dist
+
+        # one of the k nearest nodes is not excluded
+        k = min(int(excluded.sum()) + 1, len(self.nodes))
+        dist, pos = self.tree.query(xy, k=k)
+        first_valid = np.argmax(~excluded[pos], axis=1)
+        rows = np.arange(len(xy))
+        return pos[rows, first_valid], dist[rows, first_valid]
+
+    def nearest_nodes(self, x, y, exclude=None, return_dist=False):
+        """
+        Returns nearest nodes of points, see :meth:`query`
+
+        Returns
+        -------
+        node or :obj:`list`
+            Nearest node, a list of nearest nodes if arrays of coordinates
+            are passed
+        :obj:`float` or :obj:`list`
+            Distances to nearest nodes, only if `return_dist` is True
+        """
+        pos, dist = self.query(x, y, exclude=exclude)
+        nn = [self.nodes[i] for i in pos]
+        dist = dist.tolist()
+        if np.ndim(x) == 0:
+            nn, dist = nn[0], dist[0]
+        return (nn, dist) if return_dist else nn
+
+    def node_points(self, positions):
+        """
+        Returns points of nodes at positions
+
+        Points are created once per node and shared by all positions.
+
+        Parameters
+        ----------
+        positions: array-like
+            Positions of nodes in :attr:`nodes`
+
+        Returns
+        -------
+        :obj:`numpy.ndarray`
+            Array of :shapely:`Shapely Point objects<points>`
+        """
+        if self._points is None:
+            if points is not None:
+                self._points = points(self.coords)
+            else:
+                # points can't be passed to np.array, as it converts them to
+                # coordinate arrays with shapely < 2.0
+                self._points = np.empty(len(self.nodes), dtype=object)
+                for i, (x, y) in enumerate(self.coords):
+                    self._points[i] = Point(x, y)
+        return self._points[np.asarray(positions, dtype=int)]
+
+
+def point_coords(geometries):
+    """
+    Returns coordinates of points as array of shape (n, 2)
+
+    Parameters
+    ----------
+    geometries: iterable of :shapely:`Shapely Point objects<points>`
+        Points, e.g. column of a DataFrame
+
+    Returns
+    -------
+    :obj:`numpy.ndarray`
+        x and y coordinates of points
+    """
+    if get_coordinates is not None:
+        return get_coordinates(np.array(list(geometries), dtype=object))
+    # one access of coords per point, x and y access them separately
+    return np.array([point.coords[0][:2] for point in geometries],
+                    dtype=float).reshape(-1, 2)
+
+
+# trees of graphs, dropped along with their graph
+_node_trees = weakref.WeakKeyDictionary()
+
+
+def node_tree(graph):
+    """
+    Returns KD-tree of node coordinates kept for graph
+
+    The tree is rebuilt once the nodes of the graph differ from the nodes of
+    the tree, see :meth:`NodeTree.has_nodes_of`. Coordinates of nodes are
+    assumed to be unchanged.
+
+    Parameters
+    ----------
+    graph: :networkx:`NetworkX Graph Obj< >`
+        Projected graph with node attributes `x` and `y`
+
+    Returns
+    -------
+    :class:`NodeTree`
+        Tree of all nodes of graph
+    """
+    tree = _node_trees.get(graph)
+    if tree is None or not tree.has_nodes_of(graph):
+        tree = _node_trees[graph] = NodeTree(graph)
+    return tree
+
+
 def assign_nearest_nodes_to_buildings(graph_subdiv, buildings_w_loads_df):
     
     """
     assign nearest nodes of graph to buildings by euclidean distance.
     """
+    tree = node_tree(graph_subdiv)
+    xy = point_coords(buildings_w_loads_df["geometry"])
+    pos, dist = tree.query(xy[:, 0], xy[:, 1])
 
-    X = buildings_w_loads_df["geometry"].apply(lambda point: point.x)
-    Y = buildings_w_loads_df["geometry"].apply(lambda point: point.y)
-
-    buildings_w_loads_df['nn'], buildings_w_loads_df['nn_dist'] = ox.nearest_nodes(
-        graph_subdiv, X, Y, return_dist=True)
-    buildings_w_loads_df['nn_coords'] = buildings_w_loads_df['nn'].apply(
-        lambda row : Point(graph_subdiv.nodes[row]['x'], graph_subdiv.nodes[row]['y']))
+    buildings_w_loads_df['nn'] = [tree.nodes[i] for i in pos]
+    buildings_w_loads_df['nn_dist'] = dist
+    buildings_w_loads_df['nn_coords'] = tree.node_points(pos)
 
     return buildings_w_loads_df
 
@@ -94,6 +291,7 @@ def get_cluster_graph_and_nodes(simp_graph, labels):
     """
     assign cluster Id to graph nodes
     """
+    import osmnx as ox
 
     # assign cluster Id to graph nodes
     node_cluster_dict = dict(zip(list(simp_graph.nodes), labels))
@@ -155,7 +353,8 @@ def get_mvlv_subst_loc_list(cluster_graph, nodes, street_loads_df, labels, n_clu
                 valid_cluster_distance = False
                 return mvlv_subst_list, valid_cluster_distance
 
-        mvlv_subst_loc = cluster_graph.nodes[osmid]
+        # copy of node data, the cluster graph must not hold subgraph views
+        mvlv_subst_loc = dict(cluster_graph.nodes[osmid])
         mvlv_subst_loc['osmid'] = osmid
         mvlv_subst_loc['graph_district'] = cluster_subgraph
         mvlv_subst_list.append(mvlv_subst_loc)
@@ -63,20 +63,25 @@ def get_load_specific_results(nd):
 
     las_urban_isolated = []
     las_rural_isolated = []
+    # graphs released by NetworkDing0.release_osm_data are empty, isolation
+    # of load areas is unknown then
+    osm_data_released = False
 
     for mvgd in nd.mv_grid_districts():
         for la in mvgd._lv_load_areas:
             las.append(la)
             las_area.append(la.geo_area.area)
+            released = la.load_area_graph.graph.get('released', False)
+            osm_data_released |= released
             if la.is_aggregated:
                 las_urban.append(la)
                 las_area_urban.append(la.geo_area.area)
-                if nx.is_empty(la.load_area_graph):
+                if not released and nx.is_empty(la.load_area_graph):
                     las_urban_isolated.append(la)
             else:
                 las_rural.append(la)
                 las_area_rural.append(la.geo_area.area)
-                if nx.is_empty(la.load_area_graph):
+                if not released and nx.is_empty(la.load_area_graph):
                     las_rural_isolated.append(la)
 
     la_no_total = len(las)
@@ -89,12 +94,16 @@ def get_load_specific_results(nd):
     la_rural_area_total = sum(las_area_rural)
     la_rural_area_mean = np.mean(las_area_rural)
     
-    if la_urban_no_total == 0:
+    if osm_data_released:
+        la_urban_isolated_tot_rate = np.nan
+    elif la_urban_no_total == 0:
         la_urban_isolated_tot_rate = 0
     else:
         la_urban_isolated_tot_rate = len(las_urban_isolated) / la_urban_no_total * 100
         
-    if la_rural_no_total == 0:
+    if osm_data_released:
+        la_rural_isolated_tot_rate = np.nan
+    elif la_rural_no_total == 0:
         la_rural_isolated_tot_rate = 0
     else:
         la_rural_isolated_tot_rate = len(las_rural_isolated) / la_rural_no_total * 100
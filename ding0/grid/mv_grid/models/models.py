@@ -20,7 +20,8 @@ __author__     = "nesnoj, gplssm"
 
 
 from ding0.tools import config as cfg_ding0
-from ding0.tools.pypsa_io import q_sign
+from ding0.core.powerflow import q_sign
+from ding0.grid.mv_grid.util.util import calc_half_ring_differences
 
 from math import pi, tan, acos
 
@@ -299,26 +300,18 @@ class Route(object):
         """
         # TODO: add references (Tao)
 
-        # set init value
-        demand_diff_min = 10e6
+        # split route at every possible position and calc demand difference
+        demands = [node.demand() for node in self._nodes]
+        demand_diffs = calc_half_ring_differences(demands)
 
-        # check possible positions in route
-        for ctr in range(len(self._nodes)):
-            # split route and calc demand difference
-            route_demand_part1 = sum([node.demand() for node in self._nodes[0:ctr]])
-            route_demand_part2 = sum([node.demand() for node in self._nodes[ctr:len(self._nodes)]])
-            demand_diff = abs(route_demand_part1 - route_demand_part2)
-
-            if demand_diff < demand_diff_min:
-                demand_diff_min = demand_diff
-                position = ctr
+        # first position with minimal difference
+        position = min(range(len(self._nodes)), key=demand_diffs.__getitem__)
+        demand_diff_min = demand_diffs[position]
 
         if debug:
-            logger.debug('sum 1={}'.format(
-                sum([node.demand() for node in self._nodes[0:position]])))
-            logger.debug('sum 2={}'.format(sum([node.demand() for node in
-                                                self._nodes[
-                                                position:len(self._nodes)]])))
+            logger.debug('sum 1={}'.format(sum(demands[0:position])))
+            logger.debug('sum 2={}'.format(
+                sum(demands[position:len(self._nodes)])))
             logger.debug(
                 'Position of circuit breaker: {0}-{1} (sumdiff={2})'.format(
                     self._nodes[position - 1], self._nodes[position],
@@ -355,31 +348,25 @@ class Route(object):
         """
 
         # load parameters
-        load_area_count_per_ring = float(cfg_ding0.get('mv_routing',
-                                                       'load_area_count_per_ring'))
-
-        max_half_ring_length = float(cfg_ding0.get('mv_routing',
-                                                   'max_half_ring_length'))
+        cfg = cfg_ding0.snapshot()
+        load_area_count_per_ring = float(cfg.mv_routing.load_area_count_per_ring)
+        max_half_ring_length = float(cfg.mv_routing.max_half_ring_length)
 
         if self._problem._branch_kind == 'line':
-            load_factor_normal = float(cfg_ding0.get('assumptions',
-                                                     'load_factor_mv_line_lc_normal'))
-            load_factor_malfunc = float(cfg_ding0.get('assumptions',
-                                                      'load_factor_mv_line_lc_malfunc'))
+            load_factor_normal = float(cfg.assumptions.load_factor_mv_line_lc_normal)
+            load_factor_malfunc = float(cfg.assumptions.load_factor_mv_line_lc_malfunc)
         elif self._problem._branch_kind == 'cable':
-            load_factor_normal = float(cfg_ding0.get('assumptions',
-                                                     'load_factor_mv_cable_lc_normal'))
-            load_factor_malfunc = float(cfg_ding0.get('assumptions',
-                                                      'load_factor_mv_cable_lc_malfunc'))
+            load_factor_normal = float(cfg.assumptions.load_factor_mv_cable_lc_normal)
+            load_factor_malfunc = float(cfg.assumptions.load_factor_mv_cable_lc_malfunc)
         else:
             raise ValueError('Grid\'s _branch_kind is invalid, could not use branch parameters.')
 
-        mv_max_v_level_lc_diff_normal = float(cfg_ding0.get('mv_routing_tech_constraints',
-                                                            'mv_max_v_level_lc_diff_normal'))
-        mv_max_v_level_lc_diff_malfunc = float(cfg_ding0.get('mv_routing_tech_constraints',
-                                                             'mv_max_v_level_lc_diff_malfunc'))
-        cos_phi_load = cfg_ding0.get('assumptions', 'cos_phi_load')
-        cos_phi_load_mode = cfg_ding0.get('assumptions', 'cos_phi_load_mode')
+        mv_max_v_level_lc_diff_normal = float(
+            cfg.mv_routing_tech_constraints.mv_max_v_level_lc_diff_normal)
+        mv_max_v_level_lc_diff_malfunc = float(
+            cfg.mv_routing_tech_constraints.mv_max_v_level_lc_diff_malfunc)
+        cos_phi_load = cfg.assumptions.cos_phi_load
+        cos_phi_load_mode = cfg.assumptions.cos_phi_load_mode
 
 
         # step 0: check if route has got more nodes than allowed
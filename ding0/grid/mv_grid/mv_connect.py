@@ -77,7 +77,7 @@ def find_nearest_conn_objects(node_shp, branches, proj, conn_dist_weight, debug,
     """
 
     # threshold which is used to determine if 2 objects are on the same position (see below for details on usage)
-    conn_diff_tolerance = cfg_ding0.get('mv_routing', 'conn_diff_tolerance')
+    conn_diff_tolerance = cfg_ding0.snapshot().mv_routing.conn_diff_tolerance
 
     conn_objects_min_stack = []
 
@@ -1148,7 +1148,7 @@ def find_nearest_conn_objects_settle(supply_node, branches, lv_load_area_supply_
                                      path_passed_osmids, conn_dist_weight, debug, branches_only=False):
 
     # threshold which is used to determine if 2 objects are on the same position (see below for details on usage)
-    conn_diff_tolerance = cfg_ding0.get('mv_routing', 'conn_diff_tolerance')
+    conn_diff_tolerance = cfg_ding0.snapshot().mv_routing.conn_diff_tolerance
 
     conn_node = supply_node
     conn_node_shp = conn_node.geo_data
@@ -20,7 +20,6 @@ __author__     = "nesnoj, gplssm"
 
 
 import networkx as nx
-import matplotlib.pyplot as plt
 
 
 class BaseSolution(object):
@@ -169,6 +168,7 @@ class BaseSolution(object):
             AnimationDing0 object
             
         """
+        import matplotlib.pyplot as plt
 
         g = nx.Graph()
         ntemp = []
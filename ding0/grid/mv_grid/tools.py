@@ -17,6 +17,8 @@ from ding0.core.network.stations import LVStationDing0
 from ding0.core.network.loads import MVLoadDing0
 from ding0.core import MVCableDistributorDing0
 from ding0.core.network import CableDistributorDing0, GeneratorDing0, LoadDing0
+from ding0.grid.mv_grid.util.util import calc_half_ring_differences
+from ding0.grid.lv_grid.routing import node_tree
 from ding0.tools.geo import calc_geo_centre_point
 from ding0.tools import config as cfg_ding0
 import logging
@@ -87,8 +89,7 @@ def set_circuit_breakers(mv_grid, mode='load', debug=False):
         if position < len(ring):
             # check which branch to disconnect by determining load difference
             # of neighboring nodes
-            diff2 = abs(sum(node_peak_data[0:position+1]) -
-                        sum(node_peak_data[position+1:len(node_peak_data)]))
+            diff2 = diffs[position+1]
             if diff2 < diff_min or position == 0:
                 node2 = ring[position+1]
             else:
@@ -184,16 +185,16 @@ def set_circuit_breakers(mv_grid, mode='load', debug=False):
             logging.debug(f"Ring {ring} does not have a LV station. "
                           f"Switch disconnecter is installed at arbitrary node.")
 
+        # split route at every position and calc demand difference
+        diffs = calc_half_ring_differences(node_peak_data)
+
         # check where difference of demand/generation in two half-rings is minimal
         for ctr in range(len(node_peak_data)):
             # check if node that owns the switch disconnector is of type
             # LVStation
             if isinstance(ring[ctr], LVStationDing0) or not has_lv_station:
-                # split route and calc demand difference
-                route_data_part1 = sum(node_peak_data[0:ctr])
-                route_data_part2 = sum(node_peak_data[ctr:len(node_peak_data)])
-                diff = abs(route_data_part1 - route_data_part2)
-    
+                diff = diffs[ctr]
+
                 # equality has to be respected, otherwise comparison stops when demand/generation=0
                 if diff <= diff_min:
                     diff_min = diff
@@ -343,7 +344,6 @@ def conn_ding0_obj_to_osm_graph(osm_graph, ding0_obj, search_shp=None):
     create new node and edges
     osm_graph is of type MultiDiGraph
     '''
-
     # search_shp is None, take ding0 objects' shp
     if not search_shp:
         x,y = ding0_obj.geo_data.x, ding0_obj.geo_data.y
@@ -351,7 +351,7 @@ def conn_ding0_obj_to_osm_graph(osm_graph, ding0_obj, search_shp=None):
     else:
         x,y = search_shp.x, search_shp.y
 
-    nn = ox.distance.nearest_nodes(osm_graph, x, y, return_dist=False)
+    nn = node_tree(osm_graph).nearest_nodes(x, y)
     line_shp = LineString([(osm_graph.nodes[nn]['x'], osm_graph.nodes[nn]['y']),
                            (ding0_obj.geo_data.x, ding0_obj.geo_data.y)])
     osm_graph.add_node(str(ding0_obj), x=ding0_obj.geo_data.x, y=ding0_obj.geo_data.y, node_type='synthetic')
@@ -365,6 +365,7 @@ def conn_ding0_obj_to_osm_graph(osm_graph, ding0_obj, search_shp=None):
 # graph processing
 
 def get_core_graph(G):
+    import osmnx as ox
     C = ox.utils_graph.get_digraph(G, weight='length')
     C.remove_edges_from(nx.selfloop_edges(C))
     C = nx.k_core(C, k=3, core_number=None)
@@ -383,6 +384,7 @@ def get_stub_graph(osm_graph_red, core_graph):
 
 def split_graph_by_core(street_graph, depot):
 
+    import osmnx as ox
     G = ox.utils_graph.get_digraph(street_graph, weight='length')
     G.remove_edges_from(nx.selfloop_edges(G))
 
@@ -561,13 +563,13 @@ def update_stub_dict(stub_dict, mod_stubs_list, node_list):
     return stub_dict
 
 
-import geopandas as gpd
-from requests import get
 from shapely import wkb, wkt
-import osmnx as ox
 
 def get_mvgd_ids_for_city(osm_city_name):
-    
+    import geopandas as gpd
+    from requests import get
+    import osmnx as ox
+
     version='v0.4.5'
 
     mvgds = get('https://openenergy-platform.org/api/v0/schema/grid/tables/ego_dp_mv_griddistrict/rows/?where=version='+version,)#+'&where=subst_id='+subst_id,)
@@ -608,16 +610,15 @@ def relocate_cable_dists_settle(load_area, branches):
 
         for cd in cable_dist_settle:
 
-            # get copy of street graph and remove locked osm ids
-            G = load_area.load_area_graph.copy()
-            G.remove_nodes_from(locked_osm_ids)
+            # street graph without locked osm ids
+            G = load_area.load_area_graph
 
             # get cable dists point geometry
             cd_shp = cd.geo_data
 
             # osm nodes are available for relocalisation
-            if not nx.is_empty(G):
-                osm_id = ox.nearest_nodes(G, cd_shp.x, cd_shp.y, return_dist=False)
+            if any(u not in locked_osm_ids and v not in locked_osm_ids for u, v in G.edges()):
+                osm_id = node_tree(G).nearest_nodes(cd_shp.x, cd_shp.y, exclude=locked_osm_ids)
                 osm_node_shp = Point([(G.nodes[osm_id]['x'], G.nodes[osm_id]['y'])])
             # nos osm node available, add synthetic node to graph instead by using
             # original cable distributor coordinates
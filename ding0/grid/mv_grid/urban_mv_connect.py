@@ -26,7 +26,6 @@ import logging
 from ding0.grid.mv_grid.tools import cut_line_by_distance, get_shortest_path_shp_multi_target
 from shapely.ops import linemerge, split
 import networkx as nx
-import osmnx as ox
 from shapely.geometry import LineString, Point
 
 
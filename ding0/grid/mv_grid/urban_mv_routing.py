@@ -32,7 +32,6 @@ calc_street_dist_matrix, conn_ding0_obj_to_osm_graph, get_shortest_path_shp_sing
 update_graphs, create_stub_dict, check_stub_criterion, update_stub_dict, split_graph_by_core, relabel_graph_nodes
 from shapely.ops import linemerge
 import networkx as nx
-import osmnx as ox
 from shapely.geometry import LineString
 #from ding0.tools.plots import plot_mv_topology
 from ding0.grid.mv_grid.urban_mv_connect import mv_urban_connect
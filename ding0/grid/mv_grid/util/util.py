@@ -19,6 +19,9 @@ __url__        = "https://github.com/openego/ding0/blob/master/LICENSE"
 __author__     = "nesnoj, gplssm"
 
 
+from itertools import accumulate
+
+
 def print_upper_triangular_matrix(matrix):
     """Prints a CVRP data dict matrix
     
@@ -101,3 +104,27 @@ def print_solution(solution):
         print('{}: {}'.format(solution, cost))
         #print('xxx')
     print('Total cost: {}'.format(total_cost))
+
+
+def calc_half_ring_differences(node_data):
+    """Calculates difference of demand (or generation) of both half-rings for every position of circuit breaker
+
+    Sums of half-rings are derived from one prefix sum over the ring, all
+    positions are evaluated in linear time.
+
+    Parameters
+    ----------
+    node_data: :obj:`list` of :obj:`float`
+        Demand (or generation) of nodes in order of ring
+
+    Returns
+    -------
+    :obj:`list` of :obj:`float`
+        Absolute difference of sums of first half-ring (nodes before
+        position) and second half-ring (nodes from position on) for every
+        position 0, ..., len(`node_data`)
+    """
+    prefix_sums = list(accumulate(node_data, initial=0))
+    total = prefix_sums[-1]
+    return [abs(prefix_sum - (total - prefix_sum))
+            for prefix_sum in prefix_sums]
@@ -48,6 +48,120 @@ logger = logging.getLogger(__name__)
 
 cfg = cp.RawConfigParser()
 _loaded = False
+_snapshot = None
+
+
+class ConfigSection:
+    """Immutable, typed view on one section of the loaded config.
+
+    Options are available as attributes (``section.cos_phi_load``) and by
+    key (``section['cos_phi_load']``). Values are cast once in the same way
+    as :func:`get` does it.
+
+    Parameters
+    ----------
+    name : :obj:`str`
+        Name of the section.
+    values : :obj:`dict`
+        Typed option values of the section keyed by option name.
+    """
+
+    def __init__(self, name, values):
+        self.__dict__.update(values)
+        self.__dict__['_name'] = name
+
+    def __setattr__(self, key, value):
+        raise AttributeError(
+            "Config snapshot is read-only, use ding0.tools.config.set() "
+            "to change '{}.{}'.".format(self._name, key))
+
+    def __getitem__(self, key):
+        try:
+            return self.__dict__[key]
+        except KeyError:
+            raise cp.NoOptionError(key, self._name)
+
+    def __contains__(self, key):
+        return key in self.__dict__ and key != '_name'
+
+    def __repr__(self):
+        return 'ConfigSection({})'.format(self._name)
+
+
+class ConfigSnapshot:
+    """Immutable, typed snapshot of all loaded config files.
+
+    The snapshot is built once by :func:`snapshot` and is meant to be used in
+    frequently called functions instead of :func:`get`, e.g.::
+
+        assumptions = cfg_ding0.snapshot().assumptions
+        cos_phi_load = assumptions.cos_phi_load
+
+    Parameters
+    ----------
+    sections : :obj:`dict`
+        :class:`ConfigSection` objects keyed by section name.
+    """
+
+    def __init__(self, sections):
+        self.__dict__.update(sections)
+
+    def __setattr__(self, key, value):
+        raise AttributeError(
+            "Config snapshot is read-only, use ding0.tools.config.set().")
+
+    def __getitem__(self, section):
+        try:
+            return self.__dict__[section]
+        except KeyError:
+            raise cp.NoSectionError(section)
+
+    def __contains__(self, section):
+        return section in self.__dict__
+
+
+def _cast(section, key):
+    """Returns the value of `key` in `section` casted to float, int or
+    boolean (in this order), the raw string is returned if no cast is
+    successful.
+    """
+    try:
+        return cfg.getfloat(section, key)
+    except Exception:
+        try:
+            return cfg.getint(section, key)
+        except:
+            try:
+                return cfg.getboolean(section, key)
+            except:
+                return cfg.get(section, key)
+
+
+def snapshot():
+    """Returns the typed config snapshot, builds it on first use.
+
+    The snapshot is invalidated by :func:`load_config` and :func:`set`, the
+    next call rebuilds it from the current state of the config.
+
+    Returns
+    -------
+    :class:`ConfigSnapshot`
+        Immutable snapshot of all loaded config values.
+    """
+    global _snapshot
+    if _snapshot is None:
+        _snapshot = ConfigSnapshot(
+            {section: ConfigSection(
+                section, {key: _cast(section, key)
+                          for key in cfg.options(section)})
+             for section in cfg.sections()})
+    return _snapshot
+
+
+def invalidate_snapshot():
+    """Drops the cached config snapshot, see :func:`snapshot`."""
+    global _snapshot
+    _snapshot = None
 
 
 def load_config(filename):
@@ -78,6 +192,8 @@ def load_config(filename):
     except:
         logger.exception("configfile not found.")
 
+    invalidate_snapshot()
+
 
 def get(section, key):
     """Returns the value of a given key of a given section of the main
@@ -99,19 +215,13 @@ def get(section, key):
     See Also
     --------
     set :
+    snapshot : typed access without parsing, use it in hot loops
     """
-    if not _loaded:
-        pass
     try:
-        return cfg.getfloat(section, key)
-    except Exception:
-        try:
-            return cfg.getint(section, key)
-        except:
-            try:
-                return cfg.getboolean(section, key)
-            except:
-                return cfg.get(section, key)
+        return snapshot().__dict__[section].__dict__[key]
+    except KeyError:
+        # raise the errors of configparser for unknown sections/options
+        return _cast(section, key)
 
 
 def set(section, key, value):
@@ -128,18 +238,19 @@ def set(section, key, value):
     value: float, int, str
         the value.
         
+    Note
+    ----
+    The value is set for the current process only, the config files are
+    not changed.
+
     See Also
     --------
     get :
     """
 
-    if not _loaded:
-        init()
-
     if not cfg.has_section(section):
         cfg.add_section(section)
 
     cfg.set(section, key, value)
 
-    with open(FILE, 'w') as configfile:
-        cfg.write(configfile)
+    invalidate_snapshot()
@@ -32,6 +32,7 @@ def get_engine(overwrite_database=None):
     """
     Engine for local database.
     """
+    ding0.register_numpy_adapter()
     if overwrite_database:
         database = overwrite_database
     else:
@@ -61,6 +62,7 @@ def session_scope(overwrite_database=None, engine=None):
     if engine is None:
         Session = sessionmaker(bind=get_engine(overwrite_database=database))
     else:
+        ding0.register_numpy_adapter()
         Session = sessionmaker(bind=engine)
 
     session = Session()
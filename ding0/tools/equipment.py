@@ -0,0 +1,392 @@
+"""This file is part of DING0, the DIstribution Network GeneratOr.
+DING0 is a tool to generate synthetic medium and low voltage power
+distribution grids based on open data.
+
+It is developed in the project open_eGo: https://openegoproject.wordpress.com
+
+DING0 lives at github: https://github.com/openego/ding0/
+The documentation is available on RTD: http://ding0.readthedocs.io
+
+Process-wide catalog of equipment data (transformers, lines, cables) and LV
+model grid tables.
+
+The CSV files are parsed once per process and shared by all
+:class:`~.ding0.core.NetworkDing0` instances, the tables must therefore be
+treated as read-only. Equipment is selected by binary search on tables
+sorted by their rating, see :func:`sorted_equipment`. Types of equipment
+assigned to branches are interned as immutable records shared by all
+branches of the same type, see :func:`equipment_type`.
+"""
+
+__copyright__  = "Reiner Lemoine Institut gGmbH"
+__license__    = "GNU Affero General Public License Version 3 (AGPL-3.0)"
+__url__        = "https://github.com/openego/ding0/blob/master/LICENSE"
+__author__     = "nesnoj, gplssm"
+
+
+import os
+from collections.abc import Mapping
+
+import numpy as np
+import pandas as pd
+
+import ding0
+from ding0.tools import config as cfg_ding0
+
+# parsed static data keyed by the names of the files it was read from
+_static_data = {}
+
+# sorted equipment tables keyed by id of source table, rating and filters
+_sorted_equipment = {}
+
+# interned equipment types keyed by name and parameters
+_equipment_types = {}
+
+# config options holding the file names of the static data
+STATIC_DATA_FILES = (('equipment', 'equipment_mv_parameters_trafos'),
+                     ('equipment', 'equipment_mv_parameters_lines'),
+                     ('equipment', 'equipment_mv_parameters_cables'),
+                     ('equipment', 'equipment_lv_parameters_cables'),
+                     ('equipment', 'equipment_lv_parameters_trafos'),
+                     ('model_grids', 'model_grids_lv_string_properties'),
+                     ('model_grids', 'model_grids_lv_apartment_string'))
+
+
+def load_static_data():
+    """Returns equipment data and LV model grid tables.
+
+    The files configured in section `equipment` and `model_grids` of
+    'config_files.cfg' are read on first call only, subsequent calls return
+    the cached tables.
+
+    Returns
+    -------
+    :obj:`dict`
+        Tables of equipment data and LV model grids as
+        :pandas:`pandas.DataFrame<dataframe>` keyed by 'MV_trafos',
+        'MV_overhead_lines', 'MV_cables', 'LV_cables', 'LV_trafos',
+        'LV_model_grids_strings' and 'LV_model_grids_strings_per_grid'.
+        The dict is a new one on every call, the tables are shared and must
+        not be modified.
+    """
+    files = tuple(cfg_ding0.get(section, option)
+                  for section, option in STATIC_DATA_FILES)
+    if files not in _static_data:
+        _static_data[files] = _read_static_data(*files)
+
+    return dict(_static_data[files])
+
+
+def _read_static_data(mv_trafos, mv_lines, mv_cables, lv_cables, lv_trafos,
+                      lv_string_properties, lv_apartment_string):
+    """Reads equipment data and LV model grid tables from the csv files in
+    ding0/data, see :func:`load_static_data`.
+    """
+    data_path = os.path.join(ding0.__path__[0], 'data')
+
+    static_data = {}
+
+    static_data['MV_trafos'] = pd.read_csv(os.path.join(data_path, mv_trafos),
+                                           comment='#',
+                                           delimiter=',',
+                                           decimal='.',
+                                           dtype={'S_nom': int})
+
+    static_data['MV_overhead_lines'] = pd.read_csv(os.path.join(data_path, mv_lines),
+                                                   comment='#',
+                                                   dtype={'I_max_th': int,
+                                                          'U_n': int,
+                                                          'reinforce_only': int})
+
+    static_data['MV_cables'] = pd.read_csv(os.path.join(data_path, mv_cables),
+                                           comment='#',
+                                           dtype={'I_max_th': int,
+                                                  'U_n': int,
+                                                  'reinforce_only': int})
+
+    static_data['LV_cables'] = pd.read_csv(os.path.join(data_path, lv_cables),
+                                           comment='#',
+                                           index_col='name',
+                                           dtype={'I_max_th': int, 'U_n': int})
+
+    static_data['LV_trafos'] = pd.read_csv(os.path.join(data_path, lv_trafos),
+                                           comment='#',
+                                           delimiter=',',
+                                           decimal='.',
+                                           dtype={'S_nom': int})
+    static_data['LV_trafos']['r_pu'] = static_data['LV_trafos']['P_k'] / (static_data['LV_trafos']['S_nom'] * 1000)
+    static_data['LV_trafos']['x_pu'] = np.sqrt(
+        (static_data['LV_trafos']['u_kr'] / 100) ** 2 - static_data['LV_trafos']['r_pu'] ** 2)
+
+    # LV model grids
+    static_data['LV_model_grids_strings'] = pd.read_csv(
+        os.path.join(data_path, lv_string_properties),
+        comment='#',
+        delimiter=',',
+        decimal='.',
+        index_col='string_id',
+        dtype={column: int for column in ['string_id',
+                                          'type',
+                                          'Kerber Original',
+                                          'count house branch',
+                                          'distance house branch',
+                                          'cable width',
+                                          'string length',
+                                          'length house branch A',
+                                          'length house branch B',
+                                          'cable width A',
+                                          'cable width B']})
+
+    # columns 1..46 hold the model grid ids
+    static_data['LV_model_grids_strings_per_grid'] = pd.read_csv(
+        os.path.join(data_path, lv_apartment_string),
+        comment='#',
+        delimiter=',',
+        decimal='.',
+        index_col='apartment_count',
+        dtype=dict({'apartment_count': int},
+                   **{str(id): int for id in range(1, 47)}))
+
+    return static_data
+
+
+class SortedEquipment:
+    """Equipment table sorted by rating for selection by binary search.
+
+    Use :func:`sorted_equipment` to obtain instances, they are cached per
+    table.
+
+    Parameters
+    ----------
+    data : :pandas:`pandas.DataFrame<dataframe>`
+        Equipment table, e.g. `static_data['LV_cables']`.
+    rating : :obj:`str`
+        Column the equipment is rated by, e.g. 'I_max_th' or 'S_nom'.
+
+    Attributes
+    ----------
+    data : :pandas:`pandas.DataFrame<dataframe>`
+        Equipment table sorted by `rating` in ascending order. Ties keep
+        the order of the source table.
+    ratings : :obj:`numpy.ndarray`
+        Sorted ratings.
+    """
+
+    def __init__(self, data, rating):
+        order = np.argsort(data[rating].to_numpy(), kind='mergesort')
+        self.source = data
+        self.data = data.iloc[order]
+        self.ratings = self.data[rating].to_numpy(dtype=float)
+        self._scaled_ratings = {1.: self.ratings}
+
+    def __len__(self):
+        return len(self.ratings)
+
+    def position(self, value, factor=1., inclusive=False):
+        """Returns position of smallest equipment with
+        `rating * factor > value` (`>=` if `inclusive`).
+
+        Parameters
+        ----------
+        value : :obj:`float`
+            Required rating, e.g. current in A or apparent power in kVA.
+        factor : :obj:`float`
+            Factor applied to the rating, e.g. a load factor.
+        inclusive : :obj:`bool`
+            If True, equipment with a rating equal to `value` is suitable.
+
+        Returns
+        -------
+        :obj:`int` or None
+            Position in :attr:`data`, None if no equipment is suitable.
+        """
+        ratings = self._scaled_ratings.get(factor)
+        if ratings is None:
+            ratings = self._scaled_ratings[factor] = self.ratings * factor
+        pos = int(np.searchsorted(ratings, value,
+                                  side='left' if inclusive else 'right'))
+        return pos if pos < len(ratings) else None
+
+    def select(self, value, factor=1., inclusive=False):
+        """Returns smallest suitable equipment, see :meth:`position`.
+
+        Returns
+        -------
+        :pandas:`pandas.Series<series>` or None
+            Parameters of selected equipment, None if no equipment is
+            suitable.
+        """
+        pos = self.position(value, factor=factor, inclusive=inclusive)
+        return None if pos is None else self.data.iloc[pos]
+
+    def smallest(self):
+        """Returns equipment with minimum rating"""
+        return self.data.iloc[0]
+
+    def largest(self):
+        """Returns equipment with maximum rating"""
+        return self.data.iloc[-1]
+
+
+def sorted_equipment(data, rating, **filters):
+    """Returns a cached :class:`SortedEquipment` for an equipment table.
+
+    Parameters
+    ----------
+    data : :pandas:`pandas.DataFrame<dataframe>`
+        Equipment table, e.g. `static_data['MV_cables']`.
+    rating : :obj:`str`
+        Column the equipment is rated by, e.g. 'I_max_th' or 'S_nom'.
+    **filters :
+        Column values the equipment is restricted to, e.g. `U_n=10`.
+
+    Returns
+    -------
+    :class:`SortedEquipment`
+    """
+    key = (id(data), rating, tuple(sorted(filters.items())))
+    equipment = _sorted_equipment.get(key)
+    # source is referenced by the cache entry, its id cannot be reused
+    if equipment is None or equipment.source is not data:
+        filtered = data
+        for column, value in filters.items():
+            filtered = filtered[filtered[column] == value]
+        equipment = SortedEquipment(filtered, rating)
+        equipment.source = data
+        _sorted_equipment[key] = equipment
+    return equipment
+
+
+class EquipmentType(Mapping):
+    """Immutable parameters of one type of equipment, e.g. a cable type.
+
+    Use :func:`equipment_type` or :meth:`interned` to obtain instances,
+    equal types are one shared object. Parameters are read like from the
+    rows of the equipment tables they are created from, e.g.
+    ``branch.type['I_max_th']``, ``branch.type.I_max_th`` or
+    ``'name' in branch.type``.
+
+    Parameters
+    ----------
+    name :
+        Label of the row in the equipment table, e.g. 'NAYY 4x1x150'.
+    parameters : :obj:`dict`
+        Parameters keyed by column of the equipment table.
+
+    Attributes
+    ----------
+    name :
+        Label of the row in the equipment table.
+    """
+
+    __slots__ = ('name', '_parameters')
+
+    def __init__(self, name, parameters):
+        object.__setattr__(self, 'name', name)
+        object.__setattr__(self, '_parameters', dict(parameters))
+
+    @classmethod
+    def interned(cls, name, parameters):
+        """Returns shared record of equipment type.
+
+        Parameters
+        ----------
+        name :
+            Label of the row in the equipment table.
+        parameters : :obj:`dict`
+            Parameters keyed by column of the equipment table.
+
+        Returns
+        -------
+        :class:`EquipmentType`
+        """
+        key = (name, tuple(parameters.items()))
+        try:
+            record = _equipment_types.get(key)
+        except TypeError:
+            # unhashable parameters are not shared
+            return cls(name, parameters)
+        if record is None:
+            record = _equipment_types[key] = cls(name, parameters)
+        return record
+
+    def __getitem__(self, key):
+        return self._parameters[key]
+
+    def __iter__(self):
+        return iter(self._parameters)
+
+    def __len__(self):
+        return len(self._parameters)
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        try:
+            return self._parameters[name]
+        except KeyError:
+            raise AttributeError(name)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('Equipment types are immutable.')
+
+    def __hash__(self):
+        return hash((self.name, tuple(self._parameters.items())))
+
+    def __eq__(self, other):
+        if not isinstance(other, EquipmentType):
+            return NotImplemented
+        return (self.name == other.name and
+                self._parameters == other._parameters)
+
+    def __reduce__(self):
+        return self.interned, (self.name, self._parameters)
+
+    def __repr__(self):
+        return 'EquipmentType({!r}, {!r})'.format(self.name,
+                                                  self._parameters)
+
+    def to_series(self):
+        """Returns parameters as row of equipment table.
+
+        Returns
+        -------
+        :pandas:`pandas.Series<series>`
+        """
+        return pd.Series(self._parameters, name=self.name)
+
+    def to_frame(self):
+        """Returns parameters as DataFrame with one column named like the
+        type, see :meth:`pandas.Series.to_frame`.
+
+        Returns
+        -------
+        :pandas:`pandas.DataFrame<dataframe>`
+        """
+        return self.to_series().to_frame()
+
+
+def equipment_type(data):
+    """Returns shared :class:`EquipmentType` for a row of an equipment table.
+
+    Numpy scalars are converted to Python scalars.
+
+    Parameters
+    ----------
+    data : :pandas:`pandas.Series<series>` or :class:`EquipmentType`
+        Row of equipment table, e.g. returned by
+        :meth:`SortedEquipment.select`. Other values, e.g. None, are
+        returned unchanged.
+
+    Returns
+    -------
+    :class:`EquipmentType`
+    """
+    if isinstance(data, pd.Series):
+        name = data.name.item() if isinstance(data.name, np.generic) \
+            else data.name
+        parameters = {key: value.item() if isinstance(value, np.generic)
+                      else value
+                      for key, value in zip(data.index, data.tolist())}
+        return EquipmentType.interned(name, parameters)
+    return data
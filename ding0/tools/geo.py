@@ -14,16 +14,25 @@ __author__     = "nesnoj, gplssm"
 
 
 import os
+from functools import lru_cache
 from geopy.distance import geodesic
 from pyproj import Transformer
+import numpy as np
 
 from ding0.tools import config as cfg_ding0
 import logging
 
 if not 'READTHEDOCS' in os.environ:
-    from shapely.geometry import LineString
+    from shapely.geometry import LineString, Point
     from shapely.ops import transform
 
+# coordinates of many geometries are accessed at once with shapely >= 2.0
+try:
+    from shapely import get_coordinates, set_coordinates
+except ImportError:
+    get_coordinates = None
+    set_coordinates = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -166,7 +175,7 @@ def calc_geo_dist(node_source, node_target, srid=3035):
         Distance in m
     """
 
-    branch_detour_factor = cfg_ding0.get('assumptions', 'branch_detour_factor')
+    branch_detour_factor = cfg_ding0.snapshot().assumptions.branch_detour_factor
 
     if srid == 4326:
         # notice: geodesic takes (lat,lon)
@@ -320,3 +329,81 @@ def calc_edge_geometry(node_source, node_target, srid=3035):
     # ===================================================================
 
     return branch_geometry, branch_length
+
+
+@lru_cache(maxsize=None)
+def get_crs_transformer(crs_from, crs_to):
+    """
+    Returns transformer between coordinate reference systems
+
+    Creating a :class:`pyproj.Transformer` is expensive, transformers are
+    therefore cached per pair of reference systems.
+
+    Parameters
+    ----------
+    crs_from, crs_to: :obj:`str`
+        Coordinate reference systems, e.g. 'EPSG:3035'
+
+    Returns
+    -------
+    :class:`pyproj.Transformer`
+        Transformer with axis order x, y (longitude, latitude)
+    """
+    return Transformer.from_crs(crs_from, crs_to, always_xy=True)
+
+
+def transform_geometries(geometries, transformer):
+    """
+    Transforms coordinates of geometries with one call of `transformer`
+
+    Coordinates of all geometries are collected in one array, transformed at
+    once and written back. With shapely < 2.0, this is done for points and
+    line strings, other geometries are transformed one by one.
+
+    Parameters
+    ----------
+    geometries: :obj:`list` of :shapely:`Shapely geometries<geometry>`
+        Geometries to transform, None is kept
+    transformer: :class:`pyproj.Transformer`
+        Transformer, see :func:`get_crs_transformer`
+
+    Returns
+    -------
+    :obj:`numpy.ndarray` of :shapely:`Shapely geometries<geometry>`
+        Transformed geometries as object array, it is assigned to DataFrame
+        columns without conversion of geometries to arrays
+    """
+    if set_coordinates is not None:
+        geometries = np.array(list(geometries), dtype=object)
+        coords = get_coordinates(geometries)
+        x, y = transformer.transform(coords[:, 0], coords[:, 1])
+        return set_coordinates(geometries.copy(), np.column_stack([x, y]))
+
+    transformed = np.empty(len(geometries), dtype=object)
+    positions = []
+    coords = []
+    for i, geom in enumerate(geometries):
+        if isinstance(geom, (LineString, Point)):
+            coord = geom.coords[:]
+            if coord:
+                positions.append((i, geom, len(coord)))
+                coords.extend(point[:2] for point in coord)
+                continue
+            transformed[i] = geom
+        elif geom is None:
+            transformed[i] = geom
+        else:
+            transformed[i] = transform(transformer.transform, geom)
+    if not positions:
+        return transformed
+    xy = np.array(coords, dtype=float)
+    x, y = transformer.transform(xy[:, 0], xy[:, 1])
+    xy = np.column_stack([x, y])
+    start = 0
+    for i, geom, length in positions:
+        if isinstance(geom, Point):
+            transformed[i] = Point(xy[start])
+        else:
+            transformed[i] = type(geom)(xy[start:start + length])
+        start += length
+    return transformed
@@ -0,0 +1,708 @@
+"""This file is part of DING0, the DIstribution Network GeneratOr.
+DING0 is a tool to generate synthetic medium and low voltage power
+distribution grids based on open data.
+
+It is developed in the project open_eGo: https://openegoproject.wordpress.com
+
+DING0 lives at github: https://github.com/openego/ding0/
+The documentation is available on RTD: http://ding0.readthedocs.io
+
+Columnar storage of networks as alternative to pickles.
+
+Objects of a grid district (grids, stations, branches, ...) are stored in one
+table per class with a row per object and a column per attribute. References
+between objects are stored as ids of the referenced objects, graphs of grids
+as edge lists. Tables are uncompressed Arrow IPC files partitioned by grid
+district like the datasets of :mod:`~.ding0.tools.parquet_io`::
+
+    <path>/BranchDing0/mv_grid_district=<id>/part-0.arrow
+    <path>/graph_edges/mv_grid_district=<id>/part-0.arrow
+
+Other than a pickle, single grid districts are loaded without reading the
+others and tables can be analyzed memory-mapped without reconstructing
+objects, see :func:`read_table`. Every table carries the version of the
+format it is written in.
+
+Several networks are concatenated by writing them to the same directory, see
+:func:`write_network`.
+"""
+
+__copyright__  = "Reiner Lemoine Institut gGmbH"
+__license__    = "GNU Affero General Public License Version 3 (AGPL-3.0)"
+__url__        = "https://github.com/openego/ding0/blob/master/LICENSE"
+__author__     = "nesnoj, gplssm"
+
+
+import importlib
+import json
+import logging
+import os
+import shutil
+from functools import lru_cache
+from numbers import Integral, Real
+
+import networkx as nx
+import numpy as np
+import pandas as pd
+from shapely import wkb
+from shapely.geometry.base import BaseGeometry
+
+from ding0.tools.equipment import EquipmentType
+from ding0.tools.parquet_io import PARTITION_COLUMN, _check_pyarrow, \
+    _partition_dir, pa
+
+logger = logging.getLogger(__name__)
+
+# version of format, increased on changes readers of older versions cannot
+# handle
+FORMAT_VERSION = 2
+
+TABLE_FILE = 'part-0.arrow'
+
+MANIFEST = 'ding0_network.json'
+GRAPH_NODES = 'graph_nodes'
+GRAPH_EDGES = 'graph_edges'
+
+# arrow types of columns by encoding of attribute values
+_ENCODING_TYPES = {'bool': pa.bool_(),
+                   'int': pa.int64(),
+                   'float': pa.float64(),
+                   'str': pa.string(),
+                   'ref': pa.int64(),
+                   'geometry': pa.binary(),
+                   'json': pa.string()} if pa is not None else {}
+
+
+def write_network(nd, path, mv_grid_districts=None):
+    """
+    Writes grid districts of network to columnar storage
+
+    Grid districts already stored in `path` are replaced, others are kept.
+    Networks are concatenated by writing them to the same `path`.
+
+    Parameters
+    ----------
+    nd: :class:`~.ding0.core.NetworkDing0`
+        Network
+    path: :obj:`str`
+        Directory of storage
+    mv_grid_districts: :obj:`list` of :obj:`int`
+        Ids of grid districts to write. Defaults to all.
+    """
+    _check_pyarrow()
+    os.makedirs(path, exist_ok=True)
+    for grid_district in nd.mv_grid_districts():
+        if (mv_grid_districts is None or
+                grid_district.id_db in mv_grid_districts):
+            write_mv_grid_district(path, grid_district)
+    with open(os.path.join(path, MANIFEST), 'w') as f:
+        json.dump({'format_version': FORMAT_VERSION,
+                   'name': nd.name,
+                   'run_id': nd._run_id}, f, indent=4)
+
+
+def write_mv_grid_district(path, grid_district):
+    """
+    Writes objects of one grid district to their tables
+
+    Parameters
+    ----------
+    path: :obj:`str`
+        Directory of storage
+    grid_district: :class:`~.ding0.core.structure.regions.MVGridDistrictDing0`
+        Grid district
+    """
+    _check_pyarrow()
+    objects = _collect_objects(grid_district)
+    encoder = _Encoder({id(obj): i for i, obj in enumerate(objects)})
+
+    tables = {}
+    objects_by_class = {}
+    for obj in objects:
+        objects_by_class.setdefault(type(obj), []).append(obj)
+    for cls, objs in objects_by_class.items():
+        tables[cls.__name__] = encoder.object_table(cls, objs)
+    tables[GRAPH_NODES], tables[GRAPH_EDGES] = encoder.graph_tables()
+
+    for dataset, table in tables.items():
+        partition_dir = _partition_dir(path, dataset, grid_district.id_db)
+        os.makedirs(partition_dir, exist_ok=True)
+        filename = os.path.join(partition_dir, TABLE_FILE)
+        # uncompressed, so that tables are read memory-mapped
+        with pa.ipc.new_file(filename + '.tmp', table.schema) as writer:
+            writer.write_table(table)
+        os.replace(filename + '.tmp', filename)
+    # remove tables of classes the grid district had when written before
+    for dataset in _datasets(path, grid_district.id_db):
+        if dataset not in tables:
+            shutil.rmtree(_partition_dir(path, dataset, grid_district.id_db))
+    logger.debug('Grid district {} with {} objects written to {}.'.format(
+        grid_district.id_db, len(objects), path))
+
+
+def read_network(path, mv_grid_districts=None, network=None):
+    """
+    Reads grid districts from columnar storage
+
+    Parameters
+    ----------
+    path: :obj:`str`
+        Directory of storage
+    mv_grid_districts: :obj:`list` of :obj:`int`
+        Ids of grid districts to read. Defaults to all stored ones.
+    network: :class:`~.ding0.core.NetworkDing0`
+        Network the grid districts are added to. Defaults to a new network
+        with name and run id of the stored one. Configuration and
+        equipment data of new networks are imported from the installed
+        ding0 package, as the database connection is not stored, it is not
+        available.
+
+    Returns
+    -------
+    :class:`~.ding0.core.NetworkDing0`
+        Network containing the grid districts
+    """
+    _check_pyarrow()
+    if network is None:
+        network = _new_network(path)
+    if mv_grid_districts is None:
+        mv_grid_districts = stored_mv_grid_districts(path)
+    for mv_grid_district in mv_grid_districts:
+        network.add_mv_grid_district(
+            read_mv_grid_district(path, mv_grid_district, network))
+    return network
+
+
+def read_mv_grid_district(path, mv_grid_district, network):
+    """
+    Reads objects of one grid district and restores references between them
+
+    Parameters
+    ----------
+    path: :obj:`str`
+        Directory of storage
+    mv_grid_district: :obj:`int`
+        Id of grid district
+    network: :class:`~.ding0.core.NetworkDing0`
+        Network grids of the grid district refer to
+
+    Returns
+    -------
+    :class:`~.ding0.core.structure.regions.MVGridDistrictDing0`
+        Grid district
+    """
+    _check_pyarrow()
+    datasets = _datasets(path, mv_grid_district)
+    if not datasets:
+        raise FileNotFoundError('Grid district {} is not stored in '
+                                '{}.'.format(mv_grid_district, path))
+    tables = {dataset: read_table(path, mv_grid_district, dataset)
+              for dataset in datasets}
+    decoder = _Decoder(network)
+    for dataset, table in tables.items():
+        if dataset not in (GRAPH_NODES, GRAPH_EDGES):
+            decoder.create_objects(table)
+    decoder.create_graphs(tables[GRAPH_NODES], tables[GRAPH_EDGES])
+    for dataset, table in tables.items():
+        if dataset not in (GRAPH_NODES, GRAPH_EDGES):
+            decoder.set_attributes(table)
+    decoder.fill_graphs()
+    logger.debug('Grid district {} with {} objects read from {}.'.format(
+        mv_grid_district, len(decoder.objects), path))
+    # grid district is the first object collected when written
+    return decoder.objects[0]
+
+
+def read_table(path, mv_grid_district, dataset, columns=None):
+    """
+    Reads table of one grid district memory-mapped
+
+    Tables can be analyzed without reconstructing objects, e.g. lengths of
+    branches are available as NumPy array by
+    ``read_table(path, 1, 'BranchDing0', ['length'])['length'].to_numpy()``.
+    Columns refer to the memory map of the file instead of being read into
+    memory, numeric columns without missing values convert to NumPy arrays
+    without copying. Columns of references hold the 'object_id' of the
+    referenced object, the encoding of all columns is given by
+    :func:`table_encodings`.
+
+    Parameters
+    ----------
+    path: :obj:`str`
+        Directory of storage
+    mv_grid_district: :obj:`int`
+        Id of grid district
+    dataset: :obj:`str`
+        Name of class, e.g. 'BranchDing0', or :data:`GRAPH_NODES` or
+        :data:`GRAPH_EDGES`
+    columns: :obj:`list` of :obj:`str`
+        Columns to read. Defaults to all.
+
+    Returns
+    -------
+    :class:`pyarrow.Table`
+        Table
+    """
+    _check_pyarrow()
+    filename = os.path.join(_partition_dir(path, dataset, mv_grid_district),
+                            TABLE_FILE)
+    if not os.path.exists(filename):
+        raise FileNotFoundError('Grid district {} has no table {} in '
+                                '{}.'.format(mv_grid_district, dataset, path))
+    table = pa.ipc.open_file(pa.memory_map(filename)).read_all()
+    if columns is not None:
+        table = table.select(columns)
+    format_version = table_encodings(table)['format_version']
+    if format_version > FORMAT_VERSION:
+        raise ValueError('{} is written in format version {}, this version of '
+                         'ding0 reads up to version {}.'.format(
+                             filename, format_version, FORMAT_VERSION))
+    return table
+
+
+def table_encodings(table):
+    """
+    Returns description of table written by :func:`write_mv_grid_district`
+
+    Parameters
+    ----------
+    table: :class:`pyarrow.Table`
+        Table
+
+    Returns
+    -------
+    :obj:`dict`
+        Format version, class of objects and encoding of attribute per
+        column, one of 'bool', 'int', 'float', 'str', 'ref' (id of object),
+        'geometry' (WKB) and 'json'
+    """
+    return json.loads(table.schema.metadata[b'ding0'])
+
+
+def stored_mv_grid_districts(path):
+    """
+    Returns ids of grid districts in storage
+
+    Parameters
+    ----------
+    path: :obj:`str`
+        Directory of storage
+
+    Returns
+    -------
+    :obj:`list` of :obj:`int`
+        Ids of grid districts
+    """
+    dataset_dir = os.path.join(path, GRAPH_NODES)
+    if not os.path.isdir(dataset_dir):
+        return []
+    prefix = PARTITION_COLUMN + '='
+    return sorted(int(name[len(prefix):]) for name in os.listdir(dataset_dir)
+                  if name.startswith(prefix))
+
+
+def _datasets(path, mv_grid_district):
+    """Returns names of tables stored for grid district"""
+    if not os.path.isdir(path):
+        return []
+    return sorted(
+        dataset for dataset in os.listdir(path)
+        if os.path.isdir(_partition_dir(path, dataset, mv_grid_district)))
+
+
+def _new_network(path):
+    """Returns network without grid districts as described in manifest"""
+    from ding0.core import NetworkDing0
+
+    manifest_file = os.path.join(path, MANIFEST)
+    manifest = {}
+    if os.path.exists(manifest_file):
+        with open(manifest_file) as f:
+            manifest = json.load(f)
+    # no database connection, the network is created like one unpickled
+    nd = NetworkDing0.__new__(NetworkDing0)
+    nd.name = manifest.get('name')
+    nd._run_id = manifest.get('run_id')
+    nd._mv_grid_districts = []
+    nd._config = nd.import_config()
+    nd._pf_config = nd.import_pf_config()
+    nd._static_data = nd.import_static_data()
+    nd.message = []
+    return nd
+
+
+def _is_ding0_object(value):
+    # graphs of grids and equipment types are stored as values, not as
+    # objects
+    return type(value).__module__.split('.')[0] == 'ding0' and (
+        hasattr(value, '__dict__') or hasattr(type(value), '__slots__')) and (
+        not isinstance(value, (nx.Graph, EquipmentType)))
+
+
+def _is_network(value):
+    return type(value).__name__ == 'NetworkDing0' and _is_ding0_object(value)
+
+
+@lru_cache(maxsize=None)
+def _slots(cls):
+    """Returns names of slots of class and its bases"""
+    names = []
+    for base in cls.__mro__:
+        slots = base.__dict__.get('__slots__', ())
+        for name in [slots] if isinstance(slots, str) else slots:
+            if name not in ('__dict__', '__weakref__') and name not in names:
+                names.append(name)
+    return tuple(names)
+
+
+def _object_state(obj):
+    """Returns attributes of object stored in slots or its __dict__"""
+    state = {name: getattr(obj, name) for name in _slots(type(obj))
+             if hasattr(obj, name)}
+    state.update(getattr(obj, '__dict__', {}))
+    return state
+
+
+def _collect_objects(grid_district):
+    """
+    Returns ding0 objects reachable from grid district in order of
+    breadth-first search, the grid district itself first
+
+    The network is not followed, it is replaced when objects are read.
+    """
+    objects = [grid_district]
+    seen = {id(grid_district)}
+
+    def visit(value):
+        if isinstance(value, (list, tuple, set, frozenset)):
+            for item in value:
+                visit(item)
+        elif isinstance(value, dict):
+            for key, item in value.items():
+                visit(key)
+                visit(item)
+        elif isinstance(value, nx.Graph):
+            for node, data in value.nodes(data=True):
+                visit(node)
+                visit(data)
+            for _, _, data in value.edges(data=True):
+                visit(data)
+        elif (_is_ding0_object(value) and not _is_network(value) and
+              id(value) not in seen):
+            seen.add(id(value))
+            objects.append(value)
+
+    position = 0
+    while position < len(objects):
+        for value in _object_state(objects[position]).values():
+            visit(value)
+        position += 1
+    return objects
+
+
+class _Encoder:
+    """
+    Encodes attributes of objects to arrow tables
+
+    Parameters
+    ----------
+    ids: :obj:`dict`
+        Ids of objects keyed by :func:`id` of object
+    """
+
+    def __init__(self, ids):
+        self.ids = ids
+        self.graphs = []
+
+    def object_table(self, cls, objs):
+        """Returns table of objects of class `cls` with column per
+        attribute"""
+        states = [_object_state(obj) for obj in objs]
+        names = []
+        for state in states:
+            names.extend(name for name in state if name not in names)
+
+        columns = {'object_id': pa.array([self.ids[id(obj)] for obj in objs],
+                                         type=pa.int64())}
+        encodings = {'object_id': 'int'}
+        missing = object()
+        for name in names:
+            values = [state.get(name, missing) for state in states]
+            # missing attributes are nulls of json columns, None is 'null'
+            encoding = 'json' if any(value is missing for value in values) \
+                else self._encoding(values)
+            encodings[name] = encoding
+            columns[name] = pa.array(
+                [None if value is missing else self._encode_value(value,
+                                                                  encoding)
+                 for value in values], type=_ENCODING_TYPES[encoding])
+
+        metadata = {'format_version': FORMAT_VERSION,
+                    'class': self._class_path(cls),
+                    'encodings': encodings}
+        return pa.table(columns).replace_schema_metadata(
+            {b'ding0': json.dumps(metadata).encode()})
+
+    def graph_tables(self):
+        """Returns tables of nodes and edges of all graphs encoded so far"""
+        nodes = {'graph': [], 'graph_class': [], 'node': [], 'data': []}
+        edges = {'graph': [], 'node0': [], 'node1': [], 'data': []}
+        for i, graph in enumerate(self.graphs):
+            for node, data in graph.nodes(data=True):
+                nodes['graph'].append(i)
+                nodes['graph_class'].append(self._class_path(type(graph)))
+                nodes['node'].append(self.ids[id(node)])
+                nodes['data'].append(json.dumps(self._encode(data)))
+            for node0, node1, data in graph.edges(data=True):
+                edges['graph'].append(i)
+                edges['node0'].append(self.ids[id(node0)])
+                edges['node1'].append(self.ids[id(node1)])
+                edges['data'].append(json.dumps(self._encode(data)))
+        # graphs without nodes are known by their class only
+        for i, graph in enumerate(self.graphs):
+            if not len(graph):
+                nodes['graph'].append(i)
+                nodes['graph_class'].append(self._class_path(type(graph)))
+                nodes['node'].append(None)
+                nodes['data'].append(None)
+
+        tables = []
+        for columns, encodings in [
+                (nodes, {'graph': 'int', 'graph_class': 'str',
+                         'node': 'ref', 'data': 'json'}),
+                (edges, {'graph': 'int', 'node0': 'ref', 'node1': 'ref',
+                         'data': 'json'})]:
+            metadata = {'format_version': FORMAT_VERSION, 'class': None,
+                        'encodings': encodings}
+            tables.append(pa.table(
+                {name: pa.array(values, type=_ENCODING_TYPES[encodings[name]])
+                 for name, values in columns.items()}).replace_schema_metadata(
+                {b'ding0': json.dumps(metadata).encode()}))
+        return tables
+
+    @staticmethod
+    def _class_path(cls):
+        return '{}.{}'.format(cls.__module__, cls.__qualname__)
+
+    def _encoding(self, values):
+        """Returns encoding of attribute values of all objects"""
+        values = [value for value in values if value is not None]
+        if not values:
+            return 'str'
+        if all(isinstance(value, (bool, np.bool_)) for value in values):
+            return 'bool'
+        if all(isinstance(value, Integral) and
+               not isinstance(value, (bool, np.bool_)) for value in values):
+            return 'int'
+        if all(isinstance(value, Real) and
+               not isinstance(value, (bool, np.bool_)) for value in values):
+            return 'float'
+        if all(isinstance(value, str) for value in values):
+            return 'str'
+        if all(_is_ding0_object(value) and not _is_network(value)
+               for value in values):
+            return 'ref'
+        if all(isinstance(value, BaseGeometry) for value in values):
+            return 'geometry'
+        return 'json'
+
+    def _encode_value(self, value, encoding):
+        if encoding == 'json':
+            return json.dumps(self._encode(value))
+        if value is None:
+            return None
+        if encoding == 'bool':
+            return bool(value)
+        if encoding == 'int':
+            return int(value)
+        if encoding == 'float':
+            return float(value)
+        if encoding == 'ref':
+            return self.ids[id(value)]
+        if encoding == 'geometry':
+            return wkb.dumps(value)
+        return value
+
+    def _encode(self, value):
+        """Returns value as JSON serializable object, objects other than
+        lists, dicts with string keys and scalars are tagged by '$' keys"""
+        if value is None or isinstance(value, (bool, str)):
+            return value
+        if isinstance(value, np.bool_):
+            return bool(value)
+        if isinstance(value, Integral):
+            return int(value)
+        if isinstance(value, Real):
+            return float(value)
+        if _is_network(value):
+            return {'$network': None}
+        if _is_ding0_object(value):
+            return {'$ref': self.ids[id(value)]}
+        if isinstance(value, BaseGeometry):
+            return {'$wkb': wkb.dumps(value, hex=True)}
+        if isinstance(value, list):
+            return [self._encode(item) for item in value]
+        if isinstance(value, tuple):
+            return {'$tuple': [self._encode(item) for item in value]}
+        if isinstance(value, (set, frozenset)):
+            return {'$set': [self._encode(item) for item in value]}
+        if isinstance(value, dict):
+            if all(isinstance(key, str) and not key.startswith('$')
+                   for key in value):
+                return {key: self._encode(item)
+                        for key, item in value.items()}
+            return {'$dict': [[self._encode(key), self._encode(item)]
+                              for key, item in value.items()]}
+        if isinstance(value, EquipmentType):
+            return {'$equipment': {'name': self._encode(value.name),
+                                   'parameters': self._encode(dict(value))}}
+        if isinstance(value, pd.Series):
+            return {'$series': {'name': self._encode(value.name),
+                                'dtype': str(value.dtype),
+                                'index': self._encode(list(value.index)),
+                                'values': self._encode(list(value))}}
+        if isinstance(value, np.ndarray):
+            return {'$array': {'dtype': str(value.dtype),
+                               'values': self._encode(value.tolist())}}
+        if isinstance(value, nx.Graph):
+            self.graphs.append(value)
+            return {'$graph': len(self.graphs) - 1}
+        raise TypeError('Objects of type {} cannot be stored.'.format(
+            type(value).__name__))
+
+
+class _Decoder:
+    """
+    Restores objects from tables written by :class:`_Encoder`
+
+    Equal Series and equipment types of branches are restored as one
+    object shared by all objects referring to it.
+
+    Parameters
+    ----------
+    network: :class:`~.ding0.core.NetworkDing0`
+        Network replacing references to network
+    """
+
+    def __init__(self, network):
+        self.network = network
+        self.objects = {}
+        self.graphs = {}
+        # nodes and edges of graphs, added once attributes are set
+        self.graph_data = {}
+        # equal equipment types are decoded once and shared by objects
+        self.series = {}
+
+    def create_objects(self, table):
+        """Creates objects of table without setting attributes"""
+        cls = self._class(table_encodings(table)['class'])
+        for object_id in table.column('object_id').to_pylist():
+            self.objects[object_id] = cls.__new__(cls)
+
+    def create_graphs(self, nodes, edges):
+        """Creates empty graphs and decodes their nodes and edges, see
+        :meth:`fill_graphs`"""
+        for graph, graph_class, node, data in zip(
+                *(nodes.column(name).to_pylist()
+                  for name in ['graph', 'graph_class', 'node', 'data'])):
+            if graph not in self.graphs:
+                self.graphs[graph] = self._class(graph_class)()
+                self.graph_data[graph] = ([], [])
+            if node is not None:
+                self.graph_data[graph][0].append(
+                    (self.objects[node], self._decode(json.loads(data))))
+        for graph, node0, node1, data in zip(
+                *(edges.column(name).to_pylist()
+                  for name in ['graph', 'node0', 'node1', 'data'])):
+            self.graph_data[graph][1].append(
+                (self.objects[node0], self.objects[node1],
+                 self._decode(json.loads(data))))
+
+    def fill_graphs(self):
+        """Adds nodes and edges to graphs
+
+        Grid graphs index their edges by names of nodes, nodes are added
+        after their attributes are set. Graphs are built at once, so the
+        index is built once per graph.
+        """
+        for graph, (nodes, edges) in self.graph_data.items():
+            self.graphs[graph].add_nodes_from(nodes)
+            self.graphs[graph].add_edges_from(edges)
+        self.graph_data = {}
+
+    def set_attributes(self, table):
+        """Sets attributes of objects of table"""
+        encodings = table_encodings(table)['encodings']
+        objects = [self.objects[object_id]
+                   for object_id in table.column('object_id').to_pylist()]
+        for name, encoding in encodings.items():
+            if name == 'object_id':
+                continue
+            for obj, value in zip(objects, table.column(name).to_pylist()):
+                if encoding == 'json':
+                    # null marks attribute the object does not have
+                    if value is None:
+                        continue
+                    if value in self.series:
+                        value = self.series[value]
+                    else:
+                        text = value
+                        value = self._decode(json.loads(text))
+                        if isinstance(value, (pd.Series, EquipmentType)):
+                            self.series[text] = value
+                elif value is not None and encoding == 'ref':
+                    value = self.objects[value]
+                elif value is not None and encoding == 'geometry':
+                    value = wkb.loads(value)
+                self._set_attribute(obj, name, value)
+
+    @staticmethod
+    def _set_attribute(obj, name, value):
+        # instance attributes are set without calling setters of properties
+        if name in _slots(type(obj)):
+            object.__setattr__(obj, name, value)
+        else:
+            obj.__dict__[name] = value
+
+    @staticmethod
+    def _class(path):
+        module, _, name = path.rpartition('.')
+        if module.split('.')[0] not in ('ding0', 'networkx'):
+            raise ValueError('Class {} is not part of ding0.'.format(path))
+        return getattr(importlib.import_module(module), name)
+
+    def _decode(self, value):
+        if isinstance(value, list):
+            return [self._decode(item) for item in value]
+        if not isinstance(value, dict):
+            return value
+        if len(value) == 1:
+            tag, item = next(iter(value.items()))
+            if tag == '$network':
+                return self.network
+            if tag == '$ref':
+                return self.objects[item]
+            if tag == '$wkb':
+                return wkb.loads(item, hex=True)
+            if tag == '$tuple':
+                return tuple(self._decode(item))
+            if tag == '$set':
+                return set(self._decode(item))
+            if tag == '$dict':
+                return {self._decode(key): self._decode(item)
+                        for key, item in item}
+            if tag == '$equipment':
+                return EquipmentType.interned(
+                    self._decode(item['name']),
+                    self._decode(item['parameters']))
+            if tag == '$series':
+                return pd.Series(self._decode(item['values']),
+                                 index=self._decode(item['index']),
+                                 name=self._decode(item['name']),
+                                 dtype=item['dtype'])
+            if tag == '$array':
+                return np.array(self._decode(item['values']),
+                                dtype=item['dtype'])
+            if tag == '$graph':
+                return self.graphs[item]
+        return {key: self._decode(item) for key, item in value.items()}
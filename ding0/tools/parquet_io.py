@@ -0,0 +1,232 @@
+"""This file is part of DING0, the DIstribution Network GeneratOr.
+DING0 is a tool to generate synthetic medium and low voltage power
+distribution grids based on open data.
+
+It is developed in the project open_eGo: https://openegoproject.wordpress.com
+
+DING0 lives at github: https://github.com/openego/ding0/
+The documentation is available on RTD: http://ding0.readthedocs.io
+
+Export of grid districts to partitioned Parquet datasets.
+
+Every component (buses, lines, ...) is one dataset, grid districts are hive
+partitions of it::
+
+    <path>/lines/mv_grid_district=<id>/part-0.parquet
+
+Grid districts are written independently of each other and can therefore be
+appended as they are finished. Geometries are stored as WKB with GeoParquet
+metadata. A single grid district is read without touching the files of
+others, all districts can be read as one dataset e.g. by
+:func:`pandas.read_parquet`.
+"""
+
+__copyright__  = "Reiner Lemoine Institut gGmbH"
+__license__    = "GNU Affero General Public License Version 3 (AGPL-3.0)"
+__url__        = "https://github.com/openego/ding0/blob/master/LICENSE"
+__author__     = "nesnoj, gplssm"
+
+
+import json
+import logging
+import os
+from numbers import Number
+
+import numpy as np
+import pandas as pd
+from shapely import wkb
+from shapely.geometry.base import BaseGeometry
+
+# pyarrow is optional dependency for parquet export
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover
+    pa = None
+    pq = None
+
+logger = logging.getLogger(__name__)
+
+# datasets named like the csv files of NetworkDing0.to_csv and the
+# component keys of pypsa_io.fill_mvgd_component_dataframes they are
+# created from
+DATASETS = {'network': 'Network',
+            'grids': 'Grids',
+            'transformers_hvmv': 'HVMV_Transformer',
+            'transformers': 'Transformer',
+            'buses': 'Bus',
+            'lines': 'Line',
+            'loads': 'Load',
+            'generators': 'Generator',
+            'switches': 'Switch'}
+
+PARTITION_COLUMN = 'mv_grid_district'
+
+# types of columns of the components created by pypsa_io, used for columns
+# without values in a grid district (e.g. all None or no rows), so that its
+# partitions have the type of districts having values; other columns
+# without values are stored as strings
+COLUMN_TYPES = {'geometry': 'geometry',
+                'grid_district_geom': 'geometry',
+                'mv_grid_district_geom': 'geometry',
+                'in_building': 'boolean',
+                **{column: 'float' for column in [
+                    'x', 'y', 'mv_grid_id', 'lv_grid_id', 'v_nom', 'length',
+                    'r', 's_nom', 'num_parallel', 'p_nom', 'p_set',
+                    'weather_cell_id', 'building_id', 'annual_consumption',
+                    'area', 'grid_district_population']}}
+
+
+def write_mv_grid_district(path, mv_grid_district, components):
+    """
+    Writes components of one grid district to their datasets
+
+    Existing data of the grid district is replaced. Files are written to a
+    temporary name first and renamed, readers never see partially written
+    files.
+
+    Parameters
+    ----------
+    path: :obj:`str`
+        Directory of the datasets
+    mv_grid_district: :obj:`int`
+        Id of grid district, value of partition column
+    components: dict of :pandas:`pandas.DataFrame<dataframe>`
+        DataFrames keyed like the values of :data:`DATASETS`
+    """
+    _check_pyarrow()
+    for dataset, key in DATASETS.items():
+        partition_dir = _partition_dir(path, dataset, mv_grid_district)
+        os.makedirs(partition_dir, exist_ok=True)
+        filename = os.path.join(partition_dir, 'part-0.parquet')
+        pq.write_table(_to_table(components[key]), filename + '.tmp')
+        os.replace(filename + '.tmp', filename)
+    logger.debug('Grid district {} written to {}.'.format(mv_grid_district,
+                                                          path))
+
+
+def read_mv_grid_district(path, mv_grid_district, datasets=None):
+    """
+    Reads components of one grid district
+
+    Only the partitions of the grid district are read.
+
+    Parameters
+    ----------
+    path: :obj:`str`
+        Directory of the datasets
+    mv_grid_district: :obj:`int`
+        Id of grid district
+    datasets: :obj:`list` of :obj:`str`
+        Names of datasets to read, see :data:`DATASETS`. Defaults to all.
+
+    Returns
+    -------
+    dict of :pandas:`pandas.DataFrame<dataframe>`
+        DataFrames keyed by dataset name and indexed by name of component,
+        geometries are shapely objects
+    """
+    _check_pyarrow()
+    components = {}
+    for dataset in datasets or DATASETS:
+        filename = os.path.join(
+            _partition_dir(path, dataset, mv_grid_district), 'part-0.parquet')
+        if not os.path.exists(filename):
+            raise FileNotFoundError('Grid district {} has no dataset {} in '
+                                    '{}.'.format(mv_grid_district, dataset,
+                                                 path))
+        components[dataset] = _from_table(pq.read_table(filename))
+    return components
+
+
+def write_metadata(path, metadata):
+    """
+    Writes metadata of run next to the datasets
+
+    Parameters
+    ----------
+    path: :obj:`str`
+        Directory of the datasets
+    metadata: :obj:`dict`
+        Metadata, see :attr:`~.ding0.core.NetworkDing0.metadata`
+    """
+    with open(os.path.join(path, 'Ding0_{}.meta'.format(metadata['run_id'])),
+              'w') as f:
+        json.dump(metadata, f, indent=4)
+
+
+def _partition_dir(path, dataset, mv_grid_district):
+    return os.path.join(path, dataset, '{}={}'.format(PARTITION_COLUMN,
+                                                      mv_grid_district))
+
+
+def _check_pyarrow():
+    if pa is None:
+        raise ImportError('Parquet export requires pyarrow.')
+
+
+def _to_table(df):
+    """
+    Converts DataFrame to arrow table with index as column 'name'
+
+    Geometries are encoded as WKB and described by GeoParquet metadata.
+    Object columns are converted to a single type, so that partitions of
+    different grid districts share their schema: strings, floats for
+    numbers or booleans. Columns without values get their type from
+    :data:`COLUMN_TYPES`.
+    """
+    df = df.rename_axis(df.index.name or 'name').reset_index()
+    geometry_columns = []
+    for column in df.columns:
+        if df[column].dtype != object:
+            continue
+        values = df[column].dropna()
+        if not len(values):
+            column_type = COLUMN_TYPES.get(column)
+            if column_type == 'geometry':
+                df[column] = None
+                geometry_columns.append(column)
+            elif column_type == 'boolean':
+                df[column] = df[column].astype('boolean')
+            elif column_type == 'float':
+                df[column] = df[column].astype(float)
+        elif all(isinstance(value, BaseGeometry) for value in values):
+            df[column] = [None if pd.isna(geom) else wkb.dumps(geom)
+                          for geom in df[column]]
+            geometry_columns.append(column)
+        elif all(isinstance(value, (bool, np.bool_)) for value in values):
+            df[column] = df[column].astype('boolean')
+        elif all(isinstance(value, Number) for value in values):
+            df[column] = df[column].astype(float)
+        else:
+            df[column] = df[column].where(df[column].isna(),
+                                          df[column].astype(str))
+
+    schema = pa.Schema.from_pandas(df, preserve_index=False)
+    # columns without values have no type, store geometries as WKB and
+    # others as strings
+    schema = pa.schema([field.with_type(pa.binary()
+                                        if field.name in geometry_columns
+                                        else pa.string())
+                        if pa.types.is_null(field.type) else field
+                        for field in schema], metadata=schema.metadata)
+    if geometry_columns:
+        geo = {'version': '1.0.0',
+               'primary_column': geometry_columns[0],
+               'columns': {column: {'encoding': 'WKB',
+                                    'geometry_types': []}
+                           for column in geometry_columns}}
+        schema = schema.with_metadata({**(schema.metadata or {}),
+                                       b'geo': json.dumps(geo).encode()})
+    return pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+
+
+def _from_table(table):
+    """Converts arrow table written by :func:`_to_table` to DataFrame"""
+    metadata = table.schema.metadata or {}
+    geo = json.loads(metadata[b'geo']) if b'geo' in metadata else {}
+    df = table.to_pandas()
+    for column in geo.get('columns', {}):
+        df[column] = [None if value is None else wkb.loads(value)
+                      for value in df[column]]
+    return df.set_index('name')
@@ -24,16 +24,16 @@ from ding0.core.network import LoadDing0, CircuitBreakerDing0, \
 from ding0.core.structure.regions import LVLoadAreaCentreDing0, \
     LVGridDistrictDing0, LVLoadAreaDing0
 from ding0.core.powerflow import q_sign
+from ding0.core.powerflow.radial import run_radial_powerflow
+from ding0.core.powerflow.timeseries import run_timeseries_powerflow
 from ding0.core.network.cable_distributors import LVCableDistributorDing0, MVCableDistributorDing0
 from ding0.core import network as ding0_nw
-from ding0.tools.tools import merge_two_dicts_of_dataframes
+from ding0.tools.tools import concat_dicts_of_dataframes
 from ding0.grid.lv_grid.build_grid import select_transformers
 
 from geoalchemy2.shape import from_shape
 from math import tan, acos, pi, sqrt
 from pandas import Series, DataFrame, date_range
-from pypsa.io import import_series_from_dataframe
-from pypsa import Network
 from shapely.geometry import Point
 
 from datetime import datetime
@@ -55,6 +55,79 @@ logger = logging.getLogger(__name__)
 # dataset do not contain consumptional data
 consider_consumption = False
 
+
+class ComponentTable:
+    """
+    Collects components column-wise and creates their DataFrame at once
+
+    Appending single rows to a DataFrame copies the whole frame, collecting
+    the values in lists keeps the export linear in the size of the grid.
+    Rows may contain columns that were not seen before, missing values are
+    filled with NaN as :meth:`pandas.DataFrame.append` does.
+
+    Parameters
+    ----------
+    data: :pandas:`pandas.DataFrame<dataframe>`
+        Table the rows are appended to, usually an empty one created by
+        :func:`initialize_component_dataframes`. Its columns come first in
+        the created DataFrame.
+    """
+
+    def __init__(self, data):
+        self._columns = {column: data[column].tolist()
+                         for column in data.columns}
+        self._length = len(data)
+        self._names = set(self._columns.get('name', []))
+
+    def __len__(self):
+        return self._length
+
+    def __contains__(self, name):
+        """Checks if a row of component `name` was appended"""
+        return name in self._names
+
+    def append(self, row):
+        """
+        Appends component
+
+        Parameters
+        ----------
+        row: :obj:`dict`
+            Attributes of component keyed by column
+        """
+        for column in row:
+            if column not in self._columns:
+                self._columns[column] = [np.NaN] * self._length
+        for column, values in self._columns.items():
+            values.append(row.get(column, np.NaN))
+        self._length += 1
+        if 'name' in row:
+            self._names.add(row['name'])
+
+    def to_dataframe(self):
+        """
+        Returns DataFrame of appended components
+
+        Returns
+        -------
+        :pandas:`pandas.DataFrame<dataframe>`
+            Components, columns holding floats only are of type float, all
+            others of type object as if appended row by row
+        """
+        columns = {}
+        for column, values in self._columns.items():
+            if values and all(isinstance(value, float) for value in values):
+                columns[column] = np.array(values, dtype=float)
+                continue
+            # fill element-wise, list-like values (e.g. p_set of both
+            # cases or geometries) must not be expanded by numpy
+            array = np.empty(self._length, dtype=object)
+            for i, value in enumerate(values):
+                array[i] = value
+            columns[column] = array
+        return pd.DataFrame(columns, columns=list(columns))
+
+
 def export_to_dir(network, export_dir):
     """
     Exports PyPSA network as CSV files to directory
@@ -216,7 +289,10 @@ def fill_mvgd_component_dataframes(
         str(mv_grid_district.id_db))
     )
     if not only_export_mv:
-        # add lv grid components
+        # add lv grid components, concatenated at once after all lv grids
+        # are exported
+        components = [mv_components]
+        component_data = [mv_component_data]
         for lv_load_area in mv_grid_district.lv_load_areas():
             for lv_grid_district in lv_load_area.lv_grid_districts():
                 lv_grid = lv_grid_district.lv_grid
@@ -230,17 +306,13 @@ def fill_mvgd_component_dataframes(
                     only_export_mv,
                     return_time_varying_data
                 )
-                mv_components = merge_two_dicts_of_dataframes(
-                    mv_components,
-                    lv_components_tmp
-                )
-                mv_component_data = merge_two_dicts_of_dataframes(
-                    mv_component_data,
-                    lv_component_data
-                )
+                components.append(lv_components_tmp)
+                component_data.append(lv_component_data)
                 logger.info('LV grid {} exported to pypsa format.'.format(
                     str(lv_grid.id_db))
                 )
+        mv_components = concat_dicts_of_dataframes(components)
+        mv_component_data = concat_dicts_of_dataframes(component_data)
     return mv_components, network_df, grids_df, mv_component_data
 
 
@@ -302,41 +374,35 @@ def fill_component_dataframes(
     # get all grid nodes
     nodes = grid.graph.nodes()
     # get all grid edges
-    edges = [
-        edge for edge in list(grid.graph_edges())
-        if (
-                   edge['adj_nodes'][0] in nodes
-                   and not isinstance(edge['adj_nodes'][0], LVLoadAreaCentreDing0)
-           )
-           and
-           (
-                   edge['adj_nodes'][1] in nodes
-                   and not isinstance(edge['adj_nodes'][1], LVLoadAreaCentreDing0)
-           )
-    ]
-    # add station transformers to respective dataframe
+    edges = edges_to_export(grid)
+    # collect components in tables, dataframes are created once all
+    # components are appended
+    buses = ComponentTable(buses_df)
+    generators = ComponentTable(generators_df)
+    loads = ComponentTable(loads_df)
+    transformers = ComponentTable(transformer_df)
+    lines = ComponentTable(lines_df)
+    # add station transformers to respective table
     for trafo in grid.station()._transformers:
         if trafo.x_pu == None:
             type = '{} MVA 110/{} kV'.format(int(trafo.s_max_a/1e3), grid.v_level)
-            transformer_df = append_transformers_df(
-                transformer_df,trafo, type
-            )
+            append_transformers_df(transformers, trafo, type)
         else:
-            transformer_df = append_transformers_df(transformer_df, trafo)
-    # handle all nodes and append to respective dataframes
+            append_transformers_df(transformers, trafo)
+    # handle all nodes and append to respective tables
     node_components, component_data = nodes_to_dict_of_dataframes(
         grid,
         nodes,
-        buses_df,
-        generators_df,
-        loads_df,
-        transformer_df,
+        buses,
+        generators,
+        loads,
+        transformers,
         only_export_mv,
         return_time_varying_data
     )
-    # handle all edges and append to respective dataframe
+    # handle all edges and append to respective table
     branch_components = edges_to_dict_of_dataframes(
-        edges, lines_df, node_components['Bus']
+        edges, lines, node_components['Bus']
     )
     # merge node and edges
     components = merge_two_dicts(node_components, branch_components)
@@ -346,8 +412,51 @@ def fill_component_dataframes(
     return components, component_data
 
 
-def nodes_to_dict_of_dataframes(grid, nodes, buses_df, generators_df, loads_df,
-                                transformer_df, only_export_mv=False,
+def edges_to_export(grid):
+    """
+    Returns edges of grid that are exported, edges connecting aggregated
+    load areas (LVLoadAreaCentreDing0) are omitted
+
+    Parameters
+    ----------
+    grid: :class:`~.ding0.core.network.GridDing0`
+
+    Returns
+    -------
+    :obj:`list` of :obj:`dict`
+        Edges as returned by
+        :meth:`~.ding0.core.network.GridDing0.graph_edges`
+    """
+    nodes = grid.graph.nodes()
+    return [
+        edge for edge in list(grid.graph_edges())
+        if (
+                   edge['adj_nodes'][0] in nodes
+                   and not isinstance(edge['adj_nodes'][0], LVLoadAreaCentreDing0)
+           )
+           and
+           (
+                   edge['adj_nodes'][1] in nodes
+                   and not isinstance(edge['adj_nodes'][1], LVLoadAreaCentreDing0)
+           )
+    ]
+
+
+def _line_name(edge):
+    """
+    Returns name of the line of an edge, which is the representation of its
+    branch
+
+    The representation of a branch looks up its nodes in the whole graph, the
+    adjacent nodes of the edge are used instead to keep the export of large
+    grids linear.
+    """
+    return '_'.join(['Branch'] + sorted(repr(node)
+                                        for node in edge['adj_nodes']))
+
+
+def nodes_to_dict_of_dataframes(grid, nodes, buses, generators, loads,
+                                transformers, only_export_mv=False,
                                 return_time_varying_data=False):
     """
     Creates dictionary of dataframes containing grid nodes and transformers
@@ -357,17 +466,17 @@ def nodes_to_dict_of_dataframes(grid, nodes, buses_df, generators_df, loads_df,
     grid: :class:`~.ding0.core.network.GridDing0`
     nodes: :obj:`list` of ding0 grid components objects
         Nodes of the grid graph
-    buses_df: :pandas:`pandas.DataFrame<dataframe>`
-            Dataframe of buses with entries name, v_nom, geom, mv_grid_id,
+    buses: :class:`ComponentTable`
+            Table of buses with entries name, v_nom, geom, mv_grid_id,
             lv_grid_id, in_building
-    generators_df: :pandas:`pandas.DataFrame<dataframe>`
-        Dataframe of generators with entries name, bus, control, p_nom, type,
+    generators: :class:`ComponentTable`
+        Table of generators with entries name, bus, control, p_nom, type,
         weather_cell_id, subtype
-    loads_df: :pandas:`pandas.DataFrame<dataframe>`
-        Dataframe of loads with entries name,bus,p_set, building_id,
+    loads: :class:`ComponentTable`
+        Table of loads with entries name,bus,p_set, building_id,
         annual_consumption,sector
-    transformer_df: :pandas:`pandas.DataFrame<dataframe>`
-        Dataframe of trafos with entries name, bus0, bus1, x, r, s_nom, type
+    transformers: :class:`ComponentTable`
+        Table of trafos with entries name, bus0, bus1, x, r, s_nom, type
     only_export_mv: :obj:`bool`
         Bool that indicates whether only mv grid should be exported,
         per default lv grids are exported too
@@ -414,7 +523,8 @@ def nodes_to_dict_of_dataframes(grid, nodes, buses_df, generators_df, loads_df,
     srid = int(cfg_ding0.get('geo', 'srid'))
     # check if there are islanded nodes which do not belong to aggregated
     # load area
-    for isl_node in grid.graph_isolated_nodes():
+    isolated_nodes = grid.graph_isolated_nodes()
+    for isl_node in isolated_nodes:
         if isinstance(isl_node, CircuitBreakerDing0):
             continue
         elif isl_node.lv_load_area.is_aggregated: #TODO consider aggregated
@@ -424,15 +534,14 @@ def nodes_to_dict_of_dataframes(grid, nodes, buses_df, generators_df, loads_df,
             #  build_grid.py line 800). Aim should be to solve the issue
             #  there and remove this exception here afterwards
             if not only_export_mv:
-                buses_df = append_buses_df(buses_df, isl_node.grid,
-                                           isl_node)
+                append_buses_df(buses, isl_node.grid, isl_node)
             else:
                 continue
         else:
             raise Exception("{} is isolated node. Please check.".
                             format(repr(isl_node)))
 
-    # initialise DataFrames for time varying elements, load all necessary
+    # initialise tables for time varying elements, load all necessary
     # values
     if return_time_varying_data:
         conf = {}
@@ -454,48 +563,43 @@ def nodes_to_dict_of_dataframes(grid, nodes, buses_df, generators_df, loads_df,
 
         voltage_set_slack = cfg_ding0.get("mv_routing_tech_constraints",
                                           "mv_station_v_level_operation")
-        bus_v_mag_set_df = pd.DataFrame(columns=['name', 'temp_id',
-                                                 'v_mag_pu_set'])
-        generator_pq_set_df = pd.DataFrame(columns=['name', 'temp_id',
-                                                    'p_set', 'q_set'])
-        load_pq_set_df = pd.DataFrame(columns=['name', 'temp_id',
-                                               'p_set', 'q_set'])
-
+        bus_v_mag_set = ComponentTable(pd.DataFrame(
+            columns=['name', 'temp_id', 'v_mag_pu_set']))
+        generator_pq_set = ComponentTable(pd.DataFrame(
+            columns=['name', 'temp_id', 'p_set', 'q_set']))
+        load_pq_set = ComponentTable(pd.DataFrame(
+            columns=['name', 'temp_id', 'p_set', 'q_set']))
+
+    isolated_nodes = set(isolated_nodes)
     for node in nodes:
-        if node not in grid.graph_isolated_nodes():
+        if node not in isolated_nodes:
             # buses only
             if isinstance(node, CableDistributorDing0):
-                buses_df = append_buses_df(buses_df, grid, node)
+                append_buses_df(buses, grid, node)
                 # add time varying elements
                 if return_time_varying_data:
-                    bus_v_mag_set_df = append_bus_v_mag_set_df(bus_v_mag_set_df, node)
-      
+                    append_bus_v_mag_set_df(bus_v_mag_set, node)
+
             # slack generator
             elif isinstance(node, MVStationDing0):
                 # add dummy generator
-                slack = pd.Series({'name': ('_'.join(['MV', str(grid.id_db), 'slack'])),
+                generators.append({'name': ('_'.join(['MV', str(grid.id_db), 'slack'])),
                                    'bus': node.pypsa_bus_id,
                                    'control': 'Slack',
                                    'p_nom': 0,
                                    'type': 'station',
                                    'subtype': 'mv_station'})
-                generators_df = generators_df.append(slack, ignore_index=True)
                 # add MV side bus
-                buses_df = append_buses_df(buses_df, grid, node)
+                append_buses_df(buses, grid, node)
                 # add time varying elements
                 if return_time_varying_data:
-                    slack_v_mag = pd.Series({
-                        'name':node.pypsa_bus0_id,
-                        'temp_id':1,
-                        'v_mag_pu_set': [voltage_set_slack,  voltage_set_slack]
-                    })
-                    bus_v_mag_set_df = bus_v_mag_set_df.append(
-                        slack_v_mag, ignore_index=True
-                    )
-                    slack_v_mag['name'] = node.pypsa_bus_id
-                    bus_v_mag_set_df = bus_v_mag_set_df.append(
-                        slack_v_mag, ignore_index=True
-                    )
+                    for bus_name in [node.pypsa_bus0_id, node.pypsa_bus_id]:
+                        bus_v_mag_set.append({
+                            'name': bus_name,
+                            'temp_id': 1,
+                            'v_mag_pu_set': [voltage_set_slack,
+                                             voltage_set_slack]
+                        })
 
             # other generators
             elif isinstance(node, GeneratorDing0):
@@ -509,21 +613,14 @@ def nodes_to_dict_of_dataframes(grid, nodes, buses_df, generators_df, loads_df,
                     bus_name = neighbor.pypsa_bus_id
                 else:
                     bus_name = node.pypsa_bus_id
-                    buses_df = append_buses_df(buses_df, grid, node)
+                    append_buses_df(buses, grid, node)
                     if return_time_varying_data:
-                        bus_v_mag_set_df = append_bus_v_mag_set_df(
-                            bus_v_mag_set_df, node, node_name=bus_name
-                        )
-                generators_df = append_generators_df(
-                    generators_df,
-                    node,
-                    name_bus=bus_name
-                )
+                        append_bus_v_mag_set_df(bus_v_mag_set, node,
+                                                node_name=bus_name)
+                append_generators_df(generators, node, name_bus=bus_name)
                 # add time varying elements
                 if return_time_varying_data:
-                    generator_pq_set_df = append_generator_pq_set_df(
-                        conf, generator_pq_set_df, node
-                    )
+                    append_generator_pq_set_df(conf, generator_pq_set, node)
 
             elif isinstance(node, LoadDing0):
                 # egon data buildings do not contain consumptional data
@@ -547,11 +644,10 @@ def nodes_to_dict_of_dataframes(grid, nodes, buses_df, generators_df, loads_df,
                     bus_name = neighbor.pypsa_bus_id
                 else:
                     bus_name = node.pypsa_bus_id
-                    buses_df = append_buses_df(buses_df, grid, node)
+                    append_buses_df(buses, grid, node)
                     if return_time_varying_data:
-                        bus_v_mag_set_df = append_bus_v_mag_set_df(
-                            bus_v_mag_set_df, node, node_name=bus_name
-                        )
+                        append_bus_v_mag_set_df(bus_v_mag_set, node,
+                                                node_name=bus_name)
 
                 # add load
                 for sector in ["residential", "cts", "industrial"]:
@@ -561,20 +657,19 @@ def nodes_to_dict_of_dataframes(grid, nodes, buses_df, generators_df, loads_df,
                         number_households = 0
                     sector_peak_load = getattr(node, f"peak_load_{sector}")
                     if sector_peak_load:
-                        load = pd.Series({'name': f"{repr(node)}_{sector}",
-                                          'bus': bus_name,
-                                          'p_set': sector_peak_load/1e3,
-                                          'number_households': int(number_households),
-                                          'building_id': node.building_id,
-                                          'annual_consumption': annual_consumption,
-                                          'sector': sector,
-                                          'type': node.type})
-                        loads_df = loads_df.append(load, ignore_index=True)
+                        loads.append({'name': f"{repr(node)}_{sector}",
+                                      'bus': bus_name,
+                                      'p_set': sector_peak_load/1e3,
+                                      'number_households': int(number_households),
+                                      'building_id': node.building_id,
+                                      'annual_consumption': annual_consumption,
+                                      'sector': sector,
+                                      'type': node.type})
                         # add time varying elements
                         if return_time_varying_data:
-                            load_pq_set_df = append_load_pq_set_df(
+                            append_load_pq_set_df(
                                 conf,
-                                load_pq_set_df,
+                                load_pq_set,
                                 node,
                                 node_name=f"{repr(node)}_{sector}"
                             )
@@ -584,30 +679,25 @@ def nodes_to_dict_of_dataframes(grid, nodes, buses_df, generators_df, loads_df,
                 # Todo: change to list of generators and loads?
                 if node.lv_load_area.peak_load != 0:
                     node_name = 'BusBar_lac_' + str(node.lv_load_area.id_db)
-                    buses_df = append_buses_df(buses_df, node.lv_load_area, 
-                                               node, node_name)
+                    append_buses_df(buses, node.lv_load_area, node, node_name)
                     if return_time_varying_data:
-                        bus_v_mag_set_df = \
-                            append_bus_v_mag_set_df(bus_v_mag_set_df, node,
-                                                    node_name)
-                    transformer_df = \
-                        select_and_append_load_area_trafos(node.lv_load_area,
-                                                           node_name,
-                                                           transformer_df)
+                        append_bus_v_mag_set_df(bus_v_mag_set, node,
+                                                node_name)
+                    select_and_append_load_area_trafos(node.lv_load_area,
+                                                       node_name,
+                                                       transformers)
                     if return_time_varying_data:
-                        loads_df, generators_df, load_pq_set_df, \
-                        generator_pq_set_df = append_load_areas_to_df(
-                                loads_df, generators_df,
+                        append_load_areas_to_df(
+                                loads, generators,
                                 node,
                                 return_time_varying_data,
                                 conf=conf,
-                                load_pq_set_df=load_pq_set_df,
-                                generator_pq_set_df=generator_pq_set_df,
+                                load_pq_set_df=load_pq_set,
+                                generator_pq_set_df=generator_pq_set,
                         )
                     else:
-                        loads_df, generators_df = \
-                            append_load_areas_to_df(loads_df, generators_df,
-                                                    node, node_name=node_name)
+                        append_load_areas_to_df(loads, generators,
+                                                node, node_name=node_name)
 
             # bus + aggregate load of lv grids (at mv/ls substation)
             elif isinstance(node, LVStationDing0):
@@ -617,37 +707,29 @@ def nodes_to_dict_of_dataframes(grid, nodes, buses_df, generators_df, loads_df,
                     # only needed when LV_grids are not exported
                     if only_export_mv:
                         if return_time_varying_data:
-                            loads_df, generators_df, load_pq_set_df, \
-                            generator_pq_set_df = append_load_areas_to_df(
-                                loads_df, generators_df, node,
+                            append_load_areas_to_df(
+                                loads, generators, node,
                                 return_time_varying_data, conf=conf,
-                                load_pq_set_df=load_pq_set_df,
-                                generator_pq_set_df=generator_pq_set_df)
-                            bus_v_mag_set_df = append_bus_v_mag_set_df(
-                                bus_v_mag_set_df,node)
+                                load_pq_set_df=load_pq_set,
+                                generator_pq_set_df=generator_pq_set)
+                            append_bus_v_mag_set_df(bus_v_mag_set, node)
                         else:
-                            loads_df, generators_df = \
-                                append_load_areas_to_df(loads_df,
-                                                        generators_df, node)
+                            append_load_areas_to_df(loads, generators, node)
                         for trafo in node.transformers():
-                            transformer_df = \
-                                append_transformers_df(transformer_df, trafo)
+                            append_transformers_df(transformers, trafo)
                         # bus at secondary MV-LV transformer side
-                        buses_df = append_buses_df(buses_df, node.grid, node)
+                        append_buses_df(buses, node.grid, node)
                     # bus at primary MV-LV transformer side
-                    buses_df = append_buses_df(buses_df, grid, node,
-                                               node.pypsa_bus0_id)
+                    append_buses_df(buses, grid, node, node.pypsa_bus0_id)
                     if return_time_varying_data:
-                        bus_v_mag_set_df = \
-                            append_bus_v_mag_set_df(bus_v_mag_set_df, node,
-                                                   node.pypsa_bus0_id)
+                        append_bus_v_mag_set_df(bus_v_mag_set, node,
+                                                node.pypsa_bus0_id)
                 elif isinstance(grid, ding0_nw.grids.LVGridDing0):
                     # bus at secondary MV-LV transformer side
-                    buses_df = append_buses_df(buses_df, grid, node)
+                    append_buses_df(buses, grid, node)
                     if return_time_varying_data:
-                        bus_v_mag_set_df = \
-                            append_bus_v_mag_set_df(bus_v_mag_set_df,node)
-                else: 
+                        append_bus_v_mag_set_df(bus_v_mag_set, node)
+                else:
                     raise TypeError('Something went wrong. '
                                     'Only LVGridDing0 or MVGridDing0 can '
                                     'be handled as grid.')
@@ -660,15 +742,15 @@ def nodes_to_dict_of_dataframes(grid, nodes, buses_df, generators_df, loads_df,
         else:
             continue
 
-    nodal_components = {'Bus': buses_df.set_index('name'),
-                        'Generator': generators_df.set_index('name'),
-                        'Load': loads_df.set_index('name'),
-                        'Transformer': transformer_df.set_index('name')}
+    nodal_components = {'Bus': buses.to_dataframe().set_index('name'),
+                        'Generator': generators.to_dataframe().set_index('name'),
+                        'Load': loads.to_dataframe().set_index('name'),
+                        'Transformer': transformers.to_dataframe().set_index('name')}
 
     if return_time_varying_data:
-        components_data = {'Bus': bus_v_mag_set_df.set_index('name'),
-                           'Generator': generator_pq_set_df.set_index('name'),
-                           'Load': load_pq_set_df.set_index('name')}
+        components_data = {'Bus': bus_v_mag_set.to_dataframe().set_index('name'),
+                           'Generator': generator_pq_set.to_dataframe().set_index('name'),
+                           'Load': load_pq_set.to_dataframe().set_index('name')}
     else:
         components_data = {}
 
@@ -676,10 +758,10 @@ def nodes_to_dict_of_dataframes(grid, nodes, buses_df, generators_df, loads_df,
 
 
 def select_and_append_load_area_trafos(aggregated_load_area, node_name,
-                                       transformer_df):
+                                       transformers):
     """
     Selects the right trafos for aggregrated load areas and appends them to
-    the transformer dataframe.
+    the transformer table.
 
     Parameters
     ----------
@@ -687,13 +769,8 @@ def select_and_append_load_area_trafos(aggregated_load_area, node_name,
         Aggregated load area to be appended
     node_name: str
         Name of LV side bus for appending LV load area
-    transformer_df: :pandas:`pandas.DataFrame<dataframe>`
-        Transformer dataframe of network
-
-    Returns
-    -------
-    :pandas:`pandas.DataFrame<dataframe>`
-        Transformer dataframe of network with appended transformers
+    transformers: :class:`ComponentTable`
+        Transformer table of network
     """
     if aggregated_load_area.peak_generation > \
             aggregated_load_area.peak_load:
@@ -716,12 +793,11 @@ def select_and_append_load_area_trafos(aggregated_load_area, node_name,
         mv_station_bus = \
             aggregated_load_area.mv_grid_district.\
                 mv_grid.station().pypsa_bus_id
-        transformer_df = append_transformers_df(
-            transformer_df, lv_transformer, bus0=mv_station_bus, bus1=node_name)
-    return transformer_df
+        append_transformers_df(transformers, lv_transformer,
+                               bus0=mv_station_bus, bus1=node_name)
 
 
-def append_generator_pq_set_df(conf, generator_pq_set_df, node):
+def append_generator_pq_set_df(conf, generator_pq_set, node):
     """
     Fills generator pq_set data needed for power flow calculation
 
@@ -729,14 +805,9 @@ def append_generator_pq_set_df(conf, generator_pq_set_df, node):
     ----------
     conf: :obj:`dict`
         dictionary with technical constants
-    generator_pq_set_df: :pandas:`pandas.DataFrame<dataframe>`
-        Dataframe of generators with entries name, temp_id, p_set and q_set
+    generator_pq_set: :class:`ComponentTable`
+        Table of generators with entries name, temp_id, p_set and q_set
     node: obj:node object of generator
-
-    Returns
-    -------
-    generator_pq_set_df: :pandas:`pandas.DataFrame<dataframe>`
-        Dataframe of generators with entries name, temp_id, p_set and q_set
     """
     # active and reactive power of generator in load and generation case
     p_set = [node.capacity * node.capacity_factor * conf['kw2mw'] *
@@ -746,13 +817,11 @@ def append_generator_pq_set_df(conf, generator_pq_set_df, node):
              conf['Q_factor_generation'] * conf['generation_in_load_case'],
              node.capacity * node.capacity_factor * conf['kw2mw'] *
              conf['Q_factor_generation']]
-    generator_pq_set_df = generator_pq_set_df.append(
-        pd.Series({'name': repr(node), 'temp_id': 1, 'p_set': p_set,
-                   'q_set': q_set}), ignore_index=True)
-    return generator_pq_set_df
+    generator_pq_set.append({'name': repr(node), 'temp_id': 1,
+                             'p_set': p_set, 'q_set': q_set})
 
 
-def append_load_pq_set_df(conf, load_pq_set_df, node, node_name = None,
+def append_load_pq_set_df(conf, load_pq_set, node, node_name = None,
                           peak_load = None):
     """
     Fills load pq_set data needed for power flow calculation
@@ -761,18 +830,13 @@ def append_load_pq_set_df(conf, load_pq_set_df, node, node_name = None,
     ----------
     conf: :obj:`dict`
         dictionary with technical constants
-    load_pq_set_df: :pandas:`pandas.DataFrame<dataframe>`
-        Dataframe of loads with entries name, temp_id, p_set and q_set
+    load_pq_set: :class:`ComponentTable`
+        Table of loads with entries name, temp_id, p_set and q_set
     node: obj:node object of generator
     node_name: :obj:`str`
         Optional parameter for name of load
     p_set: :obj:`float`
         Optional parameter for peak_load
-
-    Returns
-    -------
-    load_pq_set_df: :pandas:`pandas.DataFrame<dataframe>`
-        Dataframe of loads with entries name, temp_id, p_set and q_set
     """
     if node_name is None:
         node_name = repr(node)
@@ -784,43 +848,33 @@ def append_load_pq_set_df(conf, load_pq_set_df, node, node_name = None,
     q_set = [peak_load * conf['kw2mw'] * conf['Q_factor_load'],
              peak_load * conf['kw2mw'] * conf['Q_factor_load'] *
              conf['load_in_generation_case']]
-    load_pq_set_df = load_pq_set_df.append(
-        pd.Series({'name': node_name, 'temp_id': 1,
-                   'p_set': p_set, 'q_set': q_set}), ignore_index=True)
-    return load_pq_set_df
+    load_pq_set.append({'name': node_name, 'temp_id': 1,
+                        'p_set': p_set, 'q_set': q_set})
 
 
-def append_bus_v_mag_set_df(bus_v_mag_set_df, node, node_name = None):
+def append_bus_v_mag_set_df(bus_v_mag_set, node, node_name = None):
     """
     Fills bus v_mag_set data needed for power flow calculation
 
     Parameters
     ----------
-    bus_v_mag_set_df: :pandas:`pandas.DataFrame<dataframe>`
-        Dataframe of buses with entries name, temp_id, v_mag_pu_set
+    bus_v_mag_set: :class:`ComponentTable`
+        Table of buses with entries name, temp_id, v_mag_pu_set
     node: obj:node object of generator
     node_name: :obj:`str`
         Optional parameter for name of bus
-
-    Returns
-    -------
-    bus_v_mag_set_df: :pandas:`pandas.DataFrame<dataframe>`
-        Dataframe of buses with entries name, temp_id, v_mag_pu_set
     """
     if node_name is None:
         node_name = node.pypsa_bus_id
 
     # due to lv loads may have same connection bus, just append once
-    if node_name not in bus_v_mag_set_df['name'].tolist():
-        bus_v_mag_set_df = bus_v_mag_set_df.append(pd.Series({'name': node_name,
-                                                              'temp_id': 1,
-                                                              'v_mag_pu_set':
-                                                              [1, 1]}),
-                                                   ignore_index=True)
-    return bus_v_mag_set_df
+    if node_name not in bus_v_mag_set:
+        bus_v_mag_set.append({'name': node_name,
+                              'temp_id': 1,
+                              'v_mag_pu_set': [1, 1]})
 
 
-def append_load_areas_to_df(loads_df, generators_df, node,
+def append_load_areas_to_df(loads, generators, node,
                             return_time_varying_data=False, **kwargs):
     """
     Appends lv load area (or single lv grid district) to dataframe of loads
@@ -834,11 +888,11 @@ def append_load_areas_to_df(loads_df, generators_df, node,
 
     Parameters
     ----------
-    loads_df: :pandas:`pandas.DataFrame<dataframe>`
-        Dataframe of loads with entries name, bus, p_set,
+    loads: :class:`ComponentTable`
+        Table of loads with entries name, bus, p_set,
         annual_consumption, sector
-    generators_df: :pandas:`pandas.DataFrame<dataframe>`
-        Dataframe of generators with entries name, bus, control, p_nom, type,
+    generators: :class:`ComponentTable`
+        Table of generators with entries name, bus, control, p_nom, type,
         weather_cell_id, subtype
     node: :obj: ding0 grid components object
         Node, which is either LVStationDing0 or LVLoadAreaCentreDing0
@@ -846,22 +900,8 @@ def append_load_areas_to_df(loads_df, generators_df, node,
         Determines whether data for power flow calculation is exported as well
     kwargs: list of conf, load_pq_set_df, generator_pq_set_df
         All three arguments have to be inserted if return_time_varying_data is
-        True.
-
-    Returns
-    -------
-    loads_df: :pandas:`pandas.DataFrame<dataframe>`
-        Dataframe of loads with entries name, bus, p_set,
-        annual_consumption, sector
-    generators_df: :pandas:`pandas.DataFrame<dataframe>`
-        Dataframe of generators with entries name, bus, control, p_nom, type,
-        weather_cell_id, subtype
-    load_pq_set_df: :pandas:`pandas.DataFrame<dataframe>`
-        Dataframe of loads with entries name, temp_id, p_set and q_set,
-        only exported if return_time_varying_data is True
-    generator_pq_set_df: :pandas:`pandas.DataFrame<dataframe>`
-        Dataframe of generators with entries name, temp_id, p_set and q_set,
-        only exported if return_time_varying_data is True
+        True. The pq_set tables are :class:`ComponentTable` with entries
+        name, temp_id, p_set and q_set.
     """
     # set name of bus, name of load and handles load area and grid districts
     if isinstance(node,LVStationDing0):
@@ -891,12 +931,10 @@ def append_load_areas_to_df(loads_df, generators_df, node,
     # Handling of generators
     for lvgd in grid_districts:
         for gen in lvgd.lv_grid.generators():
-            generators_df = append_generators_df(generators_df, gen,
-                                                 name_bus=name_bus)
+            append_generators_df(generators, gen, name_bus=name_bus)
             # add time varying elements
             if return_time_varying_data:
-                generator_pq_set_df = \
-                    append_generator_pq_set_df(conf, generator_pq_set_df, gen)
+                append_generator_pq_set_df(conf, generator_pq_set_df, gen)
 
 
     # Handling of loads
@@ -911,41 +949,32 @@ def append_load_areas_to_df(loads_df, generators_df, node,
         if sector:
             if (getattr(load_area, '_'.join(['peak_load', sector]))!= 0):
                 if return_time_varying_data:
-                    loads_df, load_pq_set_df = \
-                        append_load_area_to_load_df(sector, load_area, loads_df,
-                                                    name_bus, name_load,
-                                                    return_time_varying_data,
-                                                    conf=conf,
-                                                    load_pq_set_df=load_pq_set_df)
-                else:
-                    loads_df = \
-                        append_load_area_to_load_df(sector, load_area,
-                                                    loads_df, name_bus, name_load)
-        # return data without sector specific resolution (egon data buildings)
-        else:
-            if return_time_varying_data:
-                loads_df, load_pq_set_df = \
-                    append_load_area_to_load_df(sector, load_area, loads_df,
+                    append_load_area_to_load_df(sector, load_area, loads,
                                                 name_bus, name_load,
                                                 return_time_varying_data,
                                                 conf=conf,
                                                 load_pq_set_df=load_pq_set_df)
-            else:
-                loads_df = \
+                else:
                     append_load_area_to_load_df(sector, load_area,
-                                                loads_df, name_bus, name_load)
-
-    if return_time_varying_data:
-        return loads_df, generators_df, load_pq_set_df, generator_pq_set_df
-    else:
-        return loads_df, generators_df
+                                                loads, name_bus, name_load)
+        # return data without sector specific resolution (egon data buildings)
+        else:
+            if return_time_varying_data:
+                append_load_area_to_load_df(sector, load_area, loads,
+                                            name_bus, name_load,
+                                            return_time_varying_data,
+                                            conf=conf,
+                                            load_pq_set_df=load_pq_set_df)
+            else:
+                append_load_area_to_load_df(sector, load_area,
+                                            loads, name_bus, name_load)
 
 
-def append_load_area_to_load_df(sector, load_area, loads_df, name_bus,
+def append_load_area_to_load_df(sector, load_area, loads, name_bus,
                                 name_load, return_time_varying_data = False,
                                 **kwargs):
     """
-    Appends LVLoadArea or LVGridDistrict to dataframe of loads in pypsa format.
+    Appends LVLoadArea or LVGridDistrict to table of loads in pypsa format.
 
     Parameters
     ----------
@@ -954,8 +983,8 @@ def append_load_area_to_load_df(sector, load_area, loads_df, name_bus,
     load_area: :obj: ding0 region
         LVGridDistrictDing0 or LVLoadAreaDing0, load area of which load is to
         be aggregated and added
-    loads_df: :pandas:`pandas.DataFrame<dataframe>`
-        Dataframe of loads with entries name, bus, p_set,
+    loads: :class:`ComponentTable`
+        Table of loads with entries name, bus, p_set,
         annual_consumption and sector
     name_bus: :obj:`str`
         name of bus to which load is connected
@@ -965,16 +994,8 @@ def append_load_area_to_load_df(sector, load_area, loads_df, name_bus,
         Determines whether data for power flow calculation is exported as well
     kwargs: list of conf, load_pq_set_df
         Both arguments have to be inserted if return_time_varying_data is
-        True.
-
-    Returns
-    -------
-    loads_df: :pandas:`pandas.DataFrame<dataframe>`
-        Dataframe of loads with entries name, bus, p_set,
-        annual_consumption and sector
-    load_pq_set_df: :pandas:`pandas.DataFrame<dataframe>`
-        Dataframe of loads with entries name, temp_id, p_set and q_set,
-        only exported if return_time_varying_data is True
+        True. load_pq_set_df is a :class:`ComponentTable` with entries name,
+        temp_id, p_set and q_set.
     """
     # if egon data buildings used, no sector-specific consumptional data are available
     # consumption is set to None
@@ -982,20 +1003,15 @@ def append_load_area_to_load_df(sector, load_area, loads_df, name_bus,
 
         consumption = None
         peak_load = load_area.peak_load
-        load = pd.Series(
-            {'name': name_load, 'bus': name_bus,
-             'p_set': peak_load / 1e3,
-             'annual_consumption': consumption, 'sector': sector})
-        loads_df = loads_df.append(load, ignore_index=True)
+        loads.append({'name': name_load, 'bus': name_bus,
+                      'p_set': peak_load / 1e3,
+                      'annual_consumption': consumption, 'sector': sector})
         # handle time varying data
         if return_time_varying_data:
             conf = kwargs.get('conf', None)
             load_pq_set_df = kwargs.get('load_pq_set_df', None)
-            load_pq_set_df = append_load_pq_set_df(conf, load_pq_set_df,
-                                                   None, name_load, peak_load)
-            return loads_df, load_pq_set_df
-        else:
-            return loads_df
+            append_load_pq_set_df(conf, load_pq_set_df, None, name_load,
+                                  peak_load)
 
     else:
         # get annual consumption
@@ -1010,41 +1026,30 @@ def append_load_area_to_load_df(sector, load_area, loads_df, name_bus,
         # create and append load to df
         name_load = '_'.join([name_load, sector])
         peak_load = getattr(load_area, '_'.join(['peak_load', sector])) # TODO change sctor specific load allocation
-        load = pd.Series(
-            {'name': name_load, 'bus': name_bus,
-             'p_set': peak_load/1e3,
-             'annual_consumption': consumption/1e3, 'sector': sector})
-        loads_df = loads_df.append(load, ignore_index=True)
+        loads.append({'name': name_load, 'bus': name_bus,
+                      'p_set': peak_load/1e3,
+                      'annual_consumption': consumption/1e3, 'sector': sector})
         # handle time varying data
         if return_time_varying_data:
             conf = kwargs.get('conf', None)
             load_pq_set_df = kwargs.get('load_pq_set_df', None)
-            load_pq_set_df = append_load_pq_set_df(conf, load_pq_set_df,
-                                                   None, name_load, peak_load)
-            return loads_df, load_pq_set_df
-        else:
-            return loads_df
+            append_load_pq_set_df(conf, load_pq_set_df, None, name_load,
+                                  peak_load)
 
 
-def append_generators_df(generators_df, node, name_bus = None):
+def append_generators_df(generators, node, name_bus = None):
     """
-    Appends generator to dataframe of generators in pypsa format.
+    Appends generator to table of generators in pypsa format.
 
     Parameters
     ----------
-    generators_df: :pandas:`pandas.DataFrame<dataframe>`
-        Dataframe of generators with entries name, bus, control, p_nom, type,
+    generators: :class:`ComponentTable`
+        Table of generators with entries name, bus, control, p_nom, type,
         weather_cell_id, subtype
     node: :obj: ding0 grid components object
         GeneratorDing0
     name_bus: :obj:`str`
         Optional parameter for name of bus
-
-    Returns
-    -------
-    generators_df: :pandas:`pandas.DataFrame<dataframe>`
-        Dataframe of generators with entries name, bus, control, p_nom, type,
-        weather_cell_id, subtype
     """
     if isinstance(node,GeneratorFluctuatingDing0):
         weather_cell_id = node.weather_cell_id
@@ -1052,7 +1057,7 @@ def append_generators_df(generators_df, node, name_bus = None):
         weather_cell_id = np.NaN
     if name_bus is None:
         name_bus = node.pypsa_bus_id
-    generator = pd.Series(
+    generators.append(
         {
             'name': repr(node),
             'bus': name_bus,
@@ -1064,29 +1069,21 @@ def append_generators_df(generators_df, node, name_bus = None):
             "source_id": node.gens_id
         }
     )
-    generators_df = generators_df.append(generator, ignore_index=True)
-    return generators_df
 
 
-def append_buses_df(buses_df, grid, node, node_name =''):
+def append_buses_df(buses, grid, node, node_name =''):
     """
-    Appends buses to dataframe of buses in pypsa format.
+    Appends buses to table of buses in pypsa format.
 
     Parameters
     ----------
-    buses_df: :pandas:`pandas.DataFrame<dataframe>`
-        Dataframe of buses with entries name, v_nom, geom, mv_grid_id,
+    buses: :class:`ComponentTable`
+        Table of buses with entries name, v_nom, geom, mv_grid_id,
         lv_grid_id, in_building
     grid: :class:`~.ding0.core.network.GridDing0`
     node: :obj: ding0 grid components object
     node_name: :obj:`str`
         name of node, per default is set to node.pypsa_bus_id
-
-    Returns
-    -------
-    buses_df: :pandas:`pandas.DataFrame<dataframe>`
-        Dataframe of buses with entries name, v_nom, geom, mv_grid_id,
-        lv_grid_id, in_building
     """
     # set default name of node
     if node_name == '':
@@ -1124,23 +1121,21 @@ def append_buses_df(buses_df, grid, node, node_name =''):
     else:
         raise TypeError('Something went wrong, only MVGridDing0 and '
                         'LVGridDing0 should be inserted as grid.')
-    # create bus dataframe
-    bus = pd.Series({'name': node_name,'v_nom':v_nom, 'x':x, 'y':y,
-                     'mv_grid_id':mv_grid_id,'lv_grid_id':lv_grid_id,
-                     'in_building': in_building})
-    buses_df = buses_df.append(bus, ignore_index=True)
-    return buses_df
+    # append bus
+    buses.append({'name': node_name,'v_nom':v_nom, 'x':x, 'y':y,
+                  'mv_grid_id':mv_grid_id,'lv_grid_id':lv_grid_id,
+                  'in_building': in_building})
 
 
-def append_transformers_df(transformers_df, trafo, type = np.NaN,
+def append_transformers_df(transformers, trafo, type = np.NaN,
                            bus0=None, bus1=None):
     """
-    Appends transformer to dataframe of buses in pypsa format.
+    Appends transformer to table of transformers in pypsa format.
 
     Parameters
     ----------
-    transformers_df: :pandas:`pandas.DataFrame<dataframe>`
-        Dataframe of trafos with entries name, bus0, bus1, x, r, s_nom, type
+    transformers: :class:`ComponentTable`
+        Table of trafos with entries name, bus0, bus1, x, r, s_nom, type
     trafo: :obj:TransformerDing0
         Transformer to be added
     type: :obj:`str`
@@ -1151,11 +1146,6 @@ def append_transformers_df(transformers_df, trafo, type = np.NaN,
     bus1: :obj:`str`
         Name of secondary side bus. Defaults to None and is set to secondary
         side of transformer station by default.
-
-    Returns
-    -------
-    transformers_df: :pandas:`pandas.DataFrame<dataframe>`
-        Dataframe of trafos with entries name, bus0, bus1, x, r, s_nom, type
     """
     if isinstance(type, str):
         type_info = type
@@ -1177,18 +1167,16 @@ def append_transformers_df(transformers_df, trafo, type = np.NaN,
     if bus1 is None:
         bus1 = trafo.grid.station().pypsa_bus_id
 
-    trafo_tmp = pd.Series({'name': repr(trafo),
-                           'bus0': bus0,
-                           'bus1': bus1,
-                           'x': trafo.x_pu, 'r': trafo.r_pu,
-                           's_nom': trafo.s_max_a/1e3,
-                           'type': type,
-                           'type_info': type_info})
-    transformers_df = transformers_df.append(trafo_tmp, ignore_index=True)
-    return transformers_df
+    transformers.append({'name': repr(trafo),
+                         'bus0': bus0,
+                         'bus1': bus1,
+                         'x': trafo.x_pu, 'r': trafo.r_pu,
+                         's_nom': trafo.s_max_a/1e3,
+                         'type': type,
+                         'type_info': type_info})
 
 
-def edges_to_dict_of_dataframes(edges, lines_df, buses_df):
+def edges_to_dict_of_dataframes(edges, lines, buses_df):
     """
     Export edges to DataFrame
 
@@ -1196,8 +1184,8 @@ def edges_to_dict_of_dataframes(edges, lines_df, buses_df):
     ----------
     edges: :obj:`list`
         Edges of Ding0.Network graph
-    lines_df: :pandas:`pandas.DataFrame<dataframe>`
-            Dataframe of lines with entries name, bus0, bus1, length, x, r,
+    lines: :class:`ComponentTable`
+            Table of lines with entries name, bus0, bus1, length, x, r,
             s_nom, num_parallel, type
     buses_df: :pandas:`pandas.DataFrame<dataframe>`
         Dataframe of buses with entries name, v_nom, geom, mv_grid_id,
@@ -1211,96 +1199,104 @@ def edges_to_dict_of_dataframes(edges, lines_df, buses_df):
     # iterate over edges and add them one by one
     for edge in edges:
         if not edge['branch'].connects_aggregated: #TODO
-            lines_df = append_lines_df(edge, lines_df, buses_df)
+            append_lines_df(edge, lines, buses_df)
 
-    return {'Line': lines_df.set_index('name')}
+    return {'Line': lines.to_dataframe().set_index('name')}
 
 
-def append_lines_df(edge, lines_df, buses_df):
+def append_lines_df(edge, lines, buses_df):
     """
-    Append edge to lines_df
+    Append edge to table of lines
 
     Parameters
     ----------
     edge:
         Edge of Ding0.Network graph
-    lines_df: :pandas:`pandas.DataFrame<dataframe>`
-            Dataframe of lines with entries name, bus0, bus1, length, x, r,
+    lines: :class:`ComponentTable`
+            Table of lines with entries name, bus0, bus1, length, x, r,
             s_nom, num_parallel, type, geometry
     buses_df: :pandas:`pandas.DataFrame<dataframe>`
         Dataframe of buses with entries name, v_nom, geom, mv_grid_id,
         lv_grid_id, in_building
+    """
+    if edge["branch"].helper_component:
+        return
+
+    # make sure right side of station is appended
+    is_mv = isinstance(edge['branch'].grid, ding0_nw.grids.MVGridDing0)
+    if isinstance(edge['adj_nodes'][0], LVStationDing0) and is_mv:
+        name_bus0 = edge['adj_nodes'][0].pypsa_bus0_id
+    else:
+        name_bus0 = edge['adj_nodes'][0].pypsa_bus_id
+    if isinstance(edge['adj_nodes'][1], LVStationDing0) and is_mv:
+        name_bus1 = edge['adj_nodes'][1].pypsa_bus0_id
+    else:
+        name_bus1 = edge['adj_nodes'][1].pypsa_bus_id
+
+    line = {'name': _line_name(edge),
+            'bus0': name_bus0,
+            'bus1': name_bus1}
+    line.update(line_parameters(edge['branch']))
+    line['geometry'] = edge['branch'].geometry
+    lines.append(line)
+
+
+def line_parameters(branch):
+    """
+    Returns electrical parameters of branch in pypsa format
+
+    Parameters
+    ----------
+    branch: :class:`~.ding0.core.network.BranchDing0`
+        Branch of MV or LV grid
 
     Returns
     -------
-    lines_df: :pandas:`pandas.DataFrame<dataframe>`
-            Dataframe of lines with entries name, bus0, bus1, length, x, r,
-            s_nom, num_parallel, type
+    :obj:`dict`
+        Entries x, r, s_nom, length, num_parallel, kind and type_info of line
     """
-    if edge["branch"].helper_component:
-        return lines_df
-
     freq = cfg_ding0.get('assumptions', 'frequency')
     omega = 2 * pi * freq
     # set grid_ids
-    if isinstance(edge['branch'].grid, ding0_nw.grids.MVGridDing0):
+    if isinstance(branch.grid, ding0_nw.grids.MVGridDing0):
         unitconversion = 1e3
-        is_mv = True
-    elif isinstance(edge['branch'].grid, ding0_nw.grids.LVGridDing0):
+    elif isinstance(branch.grid, ding0_nw.grids.LVGridDing0):
         unitconversion = 1e6
-        is_mv = False
     else:
         raise TypeError('Something went wrong, only MVGridDing0 and '
                         'LVGridDing0 should be inserted as grid.')
     # TODO: find the real cause for being L, C, I_th_max type of Series
-    if (isinstance(edge['branch'].type['L_per_km'], Series)):
-        x_per_km = omega * edge['branch'].type['L_per_km'].values[0] * 1e-3
+    if (isinstance(branch.type['L_per_km'], Series)):
+        x_per_km = omega * branch.type['L_per_km'].values[0] * 1e-3
     else:
-        x_per_km = omega * edge['branch'].type['L_per_km'] * 1e-3
-    if isinstance(edge['branch'].type['R_per_km'], Series):
-        r_per_km = edge['branch'].type['R_per_km'].values[0]
+        x_per_km = omega * branch.type['L_per_km'] * 1e-3
+    if isinstance(branch.type['R_per_km'], Series):
+        r_per_km = branch.type['R_per_km'].values[0]
     else:
-        r_per_km = edge['branch'].type['R_per_km']
-    if (isinstance(edge['branch'].type['I_max_th'], Series) or
-            isinstance(edge['branch'].type['U_n'], Series)):
-        s_nom = sqrt(3) * edge['branch'].type['I_max_th'].values[0] * \
-                edge['branch'].type['U_n'].values[0]/unitconversion
+        r_per_km = branch.type['R_per_km']
+    if (isinstance(branch.type['I_max_th'], Series) or
+            isinstance(branch.type['U_n'], Series)):
+        s_nom = sqrt(3) * branch.type['I_max_th'].values[0] * \
+                branch.type['U_n'].values[0]/unitconversion
     else:
-        s_nom = sqrt(3) * edge['branch'].type['I_max_th'] * \
-                edge['branch'].type['U_n']/unitconversion
+        s_nom = sqrt(3) * branch.type['I_max_th'] * \
+                branch.type['U_n']/unitconversion
     # get lengths of line
-    length = edge['branch'].length / 1e3
+    length = branch.length / 1e3
     # Add minimal length of 1m
     if length < 0.001:
         length = 0.001
     #Todo: change into same format
-    if 'name' in edge['branch'].type:
-        type = edge['branch'].type['name']
-    else:
-        type = edge['branch'].type.name
-    
-    # make sure right side of station is appended
-    if isinstance(edge['adj_nodes'][0], LVStationDing0) and is_mv:
-        name_bus0 = edge['adj_nodes'][0].pypsa_bus0_id
-    else:
-        name_bus0 = edge['adj_nodes'][0].pypsa_bus_id
-    if isinstance(edge['adj_nodes'][1], LVStationDing0) and is_mv:
-        name_bus1 = edge['adj_nodes'][1].pypsa_bus0_id
+    if 'name' in branch.type:
+        type = branch.type['name']
     else:
-        name_bus1 = edge['adj_nodes'][1].pypsa_bus_id
-
-    line = pd.Series({'name': repr(edge['branch']),
-                      'bus0': name_bus0,
-                      'bus1': name_bus1,
-                      'x': x_per_km * length, 'r':r_per_km * length,
-                      's_nom': s_nom, 'length': length,
-                      'num_parallel': edge['branch'].num_parallel,
-                      'kind': edge['branch'].kind,
-                      'type_info': type,
-                      'geometry': edge['branch'].geometry})
-    lines_df = lines_df.append(line, ignore_index=True)
+        type = branch.type.name
 
-    return lines_df
+    return {'x': x_per_km * length, 'r':r_per_km * length,
+            's_nom': s_nom, 'length': length,
+            'num_parallel': branch.num_parallel,
+            'kind': branch.kind,
+            'type_info': type}
 
 
 def _check_branch_for_in_building_buses(buses_df, edge, name_bus0, name_bus1):
@@ -1380,10 +1376,10 @@ def circuit_breakers_to_df(grid, components, component_data,
         needed for power flow calculations    
     """
     if hasattr(grid, '_circuit_breakers'):
-        # initialise dataframe for circuit breakers
-        circuit_breakers_df = pd.DataFrame(columns=['name', 'bus_closed', 
-                                                    'bus_open','branch', 
-                                                    'type_info'])
+        # initialise table for circuit breakers and virtual buses
+        circuit_breakers = ComponentTable(pd.DataFrame(
+            columns=['name', 'bus_closed', 'bus_open', 'branch', 'type_info']))
+        open_buses = []
         for circuit_breaker in grid.circuit_breakers():
             if circuit_breaker.switch_node is not None:
                 if isinstance(circuit_breaker.switch_node, LVStationDing0):
@@ -1393,7 +1389,7 @@ def circuit_breakers_to_df(grid, components, component_data,
             else:
                 # get secondary bus of opened branch
                 name_bus_closed = \
-                    components['Line'].T[repr(circuit_breaker.branch)].bus1
+                    components['Line'].at[repr(circuit_breaker.branch), 'bus1']
             # create virtual bus and append to components['Bus']
             name_bus_open = 'virtual_' + name_bus_closed
             # if circuit breaker was open, change bus1 of branch to new 
@@ -1415,33 +1411,36 @@ def circuit_breakers_to_df(grid, components, component_data,
                         repr(circuit_breaker), name_bus_closed
                     ))
                 
-                bus_open = components['Bus'].T[name_bus_closed]
+                bus_open = components['Bus'].loc[name_bus_closed].copy()
                 bus_open.name = name_bus_open
-                components['Bus'] = components['Bus'].append(bus_open)
-                if return_time_varying_data:
-                    component_data['Bus'] = \
-                        component_data['Bus'].append(
-                            pd.DataFrame({'name': [name_bus_open], 
-                                          'temp_id': [1],
-                                          'v_mag_pu_set': [[1, 1]]}).
-                            set_index('name'))
-            # append circuit breaker to dataframe
-            circuit_breakers_df = \
-                circuit_breakers_df.append(
-                    pd.Series({'name': repr(circuit_breaker), 
-                               'bus_closed': name_bus_closed,
-                               'bus_open': name_bus_open,
-                               'branch': repr(circuit_breaker.branch), 
-                               'type_info': 'Switch Disconnector'}),
-                    ignore_index=True)
+                open_buses.append(bus_open)
+            # append circuit breaker to table
+            circuit_breakers.append({'name': repr(circuit_breaker),
+                                     'bus_closed': name_bus_closed,
+                                     'bus_open': name_bus_open,
+                                     'branch': repr(circuit_breaker.branch),
+                                     'type_info': 'Switch Disconnector'})
+        # add virtual buses of open circuit breakers
+        if open_buses:
+            components['Bus'] = pd.concat(
+                [components['Bus'], pd.DataFrame(open_buses)],
+                sort=False)
+            if return_time_varying_data:
+                component_data['Bus'] = pd.concat(
+                    [component_data['Bus'],
+                     pd.DataFrame({'name': [bus.name for bus in open_buses],
+                                   'temp_id': 1,
+                                   'v_mag_pu_set': [[1, 1]] * len(open_buses)}
+                                  ).set_index('name')],
+                    sort=False)
         # add switches to components
-        components['Switch'] = circuit_breakers_df.set_index('name')
+        components['Switch'] = circuit_breakers.to_dataframe().set_index('name')
     return components, component_data
 
 
 def run_powerflow_onthefly(components, components_data, grid, 
                            export_pypsa_dir=None, debug=False, 
-                           export_result_dir=None):
+                           export_result_dir=None, only_calc_mv=True):
     """
     Run powerflow to test grid stability
 
@@ -1461,7 +1460,40 @@ def run_powerflow_onthefly(components, components_data, grid,
     export_result_dir: :obj:`str`
         Directory where csv Files of power flow results are exported to.
         Export is omitted if argument is empty.
+    only_calc_mv: :obj:`bool`
+        If False, results are assigned to the lv grids of the grid district
+        as well, see :func:`assign_pf_results`
+    """
+    network, snapshots = prepare_powerflow_problem(components,
+                                                   components_data,
+                                                   debug=debug)
+    solve_powerflow_problem(network, snapshots, grid,
+                            export_pypsa_dir=export_pypsa_dir,
+                            export_result_dir=export_result_dir,
+                            only_calc_mv=only_calc_mv)
+
+
+def prepare_powerflow_problem(components, components_data, debug=False,
+                              n_sub_networks=1):
     """
+    Creates PyPSA network of load case and feed-in case, see
+    :func:`run_powerflow_onthefly`
+
+    Parameters
+    ----------
+    components: dict of :pandas:`pandas.DataFrame<dataframe>`
+    components_data: dict of :pandas:`pandas.DataFrame<dataframe>`
+    debug: :obj:`bool`
+    n_sub_networks: :obj:`int`
+        Number of grids contained in components
+
+    Returns
+    -------
+    network: PyPSA powerflow problem object
+    snapshots: iterable
+        Snapshots of load case and feed-in case
+    """
+    from pypsa.io import import_series_from_dataframe
 
     # choose temp_id
     timesteps = 2
@@ -1506,8 +1538,33 @@ def run_powerflow_onthefly(components, components_data, grid,
                                  'v_mag_pu_set')
 
     # check if network is created in a correct way
-    _check_integrity_of_pypsa(network)
+    _check_integrity_of_pypsa(network, n_sub_networks=n_sub_networks)
+
+    return network, snapshots
+
 
+def solve_powerflow_problem(network, snapshots, grid, export_pypsa_dir=None,
+                            export_result_dir=None, only_calc_mv=True):
+    """
+    Runs power flow of PyPSA network and assigns results to grid, see
+    :func:`run_powerflow_onthefly`
+
+    Parameters
+    ----------
+    network: PyPSA powerflow problem object
+    snapshots: iterable
+        Snapshots of load case and feed-in case
+    grid: :class:`~.ding0.core.network.GridDing0`
+    export_pypsa_dir: :obj:`str`
+        Sub-directory in output/debug/grid/ where csv Files of PyPSA network
+        are exported to. Export is omitted if argument is empty.
+    export_result_dir: :obj:`str`
+        Directory where csv Files of power flow results are exported to.
+        Export is omitted if argument is empty.
+    only_calc_mv: :obj:`bool`
+        If False, results are assigned to the lv grids of the grid district
+        as well, see :func:`assign_pf_results`
+    """
     # start powerflow calculations
     network.pf(snapshots)
 
@@ -1520,16 +1577,355 @@ def run_powerflow_onthefly(components, components_data, grid,
 
     # process results
     bus_data, line_data = process_pf_results(network)
+    assign_pf_results(grid, bus_data, line_data,
+                      export_result_dir=export_result_dir,
+                      only_calc_mv=only_calc_mv)
+
+    # export network if directory is specified
+    if export_pypsa_dir:
+        export_to_dir(network, export_dir=export_pypsa_dir)
+
+
+def run_powerflow_radial(components, components_data, grid,
+                         export_result_dir=None, only_calc_mv=True):
+    """
+    Run backward/forward sweep power flow of radial grid for load case and
+    feed-in case, see :mod:`~.ding0.core.powerflow.radial`
+
+    Parameters
+    ----------
+    components: dict of :pandas:`pandas.DataFrame<dataframe>`
+    components_data: dict of :pandas:`pandas.DataFrame<dataframe>`
+    grid: :class:`~.ding0.core.network.GridDing0`
+    export_result_dir: :obj:`str`
+        Directory where csv Files of power flow results are exported to.
+        Export is omitted if argument is empty.
+    only_calc_mv: :obj:`bool`
+        If False, results are assigned to the lv grids of the grid district
+        as well, see :func:`assign_pf_results`
+    """
+    bus_data, line_data = run_radial_powerflow(components, components_data)
+    assign_pf_results(grid, bus_data, line_data,
+                      export_result_dir=export_result_dir,
+                      only_calc_mv=only_calc_mv)
+
+
+def run_powerflow_timeseries(mv_grid, load_profiles, generator_profiles,
+                             only_calc_mv=True, chunk_size=168,
+                             v_limits=(0.9, 1.1), export_result_dir=None):
+    """
+    Runs power flow of MV grid district for time series of loads and
+    generators, see :func:`~.ding0.core.powerflow.timeseries.run_timeseries_powerflow`
+
+    Only results aggregated over all snapshots are returned, they are not
+    assigned to the grid. Grids must be radial, open circuit breakers of
+    rings beforehand.
+
+    Parameters
+    ----------
+    mv_grid: :class:`~.ding0.core.network.grids.MVGridDing0`
+    load_profiles: :pandas:`pandas.DataFrame<dataframe>` or :obj:`numpy.ndarray` or :obj:`str`
+        Profiles of loads in p.u. of their peak load
+    generator_profiles: :pandas:`pandas.DataFrame<dataframe>` or :obj:`numpy.ndarray` or :obj:`str`
+        Profiles of generators in p.u. of their nominal power
+    only_calc_mv: :obj:`bool`
+        If True, lv grids are aggregated at their stations and profiles are
+        given for the aggregated loads and generators
+    chunk_size: :obj:`int`
+        Number of snapshots solved at once
+    v_limits: :obj:`tuple` of :obj:`float`
+        Minimum and maximum admissible voltage in p.u.
+    export_result_dir: :obj:`str`
+        Directory where csv Files of aggregated results are exported to.
+        Export is omitted if argument is empty.
+
+    Returns
+    -------
+    bus_data: :pandas:`pandas.DataFrame<dataframe>`
+        Minimum and maximum voltage and number of voltage violations of buses
+    line_data: :pandas:`pandas.DataFrame<dataframe>`
+        Maximum apparent power, loading and number of overloadings of lines
+    """
+    buses_df, generators_df, lines_df, loads_df, transformer_df = \
+        initialize_component_dataframes()
+    components, _, _, components_data = fill_mvgd_component_dataframes(
+        mv_grid.grid_district, buses_df, generators_df, lines_df, loads_df,
+        transformer_df, only_export_mv=only_calc_mv,
+        return_time_varying_data=True)
+    results = run_timeseries_powerflow(components, components_data,
+                                       load_profiles, generator_profiles,
+                                       chunk_size=chunk_size,
+                                       v_limits=v_limits)
+    bus_data, line_data = results.bus_data(), results.line_data()
+    if export_result_dir:
+        bus_data.to_csv(os.path.join(export_result_dir,
+                                     'bus_data_timeseries.csv'))
+        line_data.to_csv(os.path.join(export_result_dir,
+                                      'line_data_timeseries.csv'))
+    return bus_data, line_data
+
+
+def run_powerflow_batch(mv_grids, method='onthefly', only_calc_mv=True,
+                        debug=False, export_result_dir=None):
+    """
+    Runs power flow of several MV grids as one problem
+
+    The grids are exported to one set of component DataFrames and solved in
+    a single call, PyPSA treats them as disjoint sub-networks. This saves
+    the overhead of creating and solving a problem per grid. Results are
+    assigned to the grids they belong to.
+
+    Parameters
+    ----------
+    mv_grids: :obj:`list` of :class:`~.ding0.core.network.grids.MVGridDing0`
+        Grids to calculate power flow for
+    method: :obj:`str`
+        'onthefly' to solve with PyPSA, 'radial' to solve with
+        :func:`run_powerflow_radial`
+    only_calc_mv: :obj:`bool`
+        If True, lv grids are aggregated at their stations, otherwise they
+        are part of the problem and results are assigned to them as well
+    debug: :obj:`bool`
+        If True, grid data is checked for integrity
+    export_result_dir: :obj:`str`
+        Directory where csv Files of power flow results of the grids are
+        exported to. Export is omitted if argument is empty.
+    """
+    components = []
+    components_data = []
+    for mv_grid in mv_grids:
+        buses_df, generators_df, lines_df, loads_df, transformer_df = \
+            initialize_component_dataframes()
+        grid_components, _, _, grid_components_data = \
+            fill_mvgd_component_dataframes(
+                mv_grid.grid_district, buses_df, generators_df, lines_df,
+                loads_df, transformer_df, only_export_mv=only_calc_mv,
+                return_time_varying_data=True)
+        components.append(grid_components)
+        components_data.append(grid_components_data)
+    components = concat_dicts_of_dataframes(components)
+    components_data = concat_dicts_of_dataframes(components_data)
+    for key in ['Bus', 'Line', 'Transformer', 'Generator', 'Load']:
+        df = components[key]
+        if not df.index.is_unique:
+            raise ValueError('Names of {} components are not unique across '
+                             'grids: {}'.format(key, sorted(set(
+                df.index[df.index.duplicated()]))))
+
+    if method == 'onthefly':
+        network, snapshots = prepare_powerflow_problem(
+            components, components_data, debug=debug,
+            n_sub_networks=len(mv_grids))
+        network.pf(snapshots)
+        bus_data, line_data = process_pf_results(network)
+    elif method == 'radial':
+        bus_data, line_data = run_radial_powerflow(components,
+                                                   components_data)
+    else:
+        raise ValueError('Sorry, this power flow method does not exist!')
+
+    if export_result_dir:
+        bus_data.to_csv(os.path.join(export_result_dir, 'bus_data.csv'))
+        line_data.to_csv(os.path.join(export_result_dir, 'line_data.csv'))
+    for mv_grid in mv_grids:
+        assign_pf_results(mv_grid, bus_data, line_data,
+                          only_calc_mv=only_calc_mv)
+
+
+def assign_pf_results(grid, bus_data, line_data, export_result_dir=None,
+                      only_calc_mv=True):
+    """
+    Writes results obtained from PF to graph and exports them to csv
+
+    Parameters
+    ----------
+    grid: :class:`~.ding0.core.network.grids.MVGridDing0`
+    bus_data: :pandas:`pandas.DataFrame<dataframe>`
+        Voltage level results at buses, see :func:`process_pf_results`
+    line_data: :pandas:`pandas.DataFrame<dataframe>`
+        Resulting apparent power at lines, see :func:`process_pf_results`
+    export_result_dir: :obj:`str`
+        Directory where csv Files of power flow results are exported to.
+        Export is omitted if argument is empty.
+    only_calc_mv: :obj:`bool`
+        If False, the lv grids of the grid district were part of the power
+        flow problem and results are assigned to their nodes and branches as
+        well, see :func:`powerflow_grids`
+    """
     if export_result_dir:
         bus_data.to_csv(os.path.join(export_result_dir,'bus_data.csv'))
         line_data.to_csv(os.path.join(export_result_dir, 'line_data.csv'))
     # assign results data to graph
-    assign_bus_results(grid, bus_data)
-    assign_line_results(grid, line_data)
+    for pf_grid in powerflow_grids(grid, only_calc_mv=only_calc_mv):
+        assign_bus_results(pf_grid, bus_data)
+        assign_line_results(pf_grid, line_data)
 
-    # export network if directory is specified
-    if export_pypsa_dir:
-        export_to_dir(network, export_dir=export_pypsa_dir)
+
+def powerflow_grids(mv_grid, only_calc_mv=True):
+    """
+    Returns grids contained in the power flow problem of a MV grid district
+
+    Parameters
+    ----------
+    mv_grid: :class:`~.ding0.core.network.grids.MVGridDing0`
+    only_calc_mv: :obj:`bool`
+        If True, lv grids are aggregated at their stations and only the mv
+        grid is returned
+
+    Returns
+    -------
+    :obj:`list` of :class:`~.ding0.core.network.GridDing0`
+        MV grid followed by the lv grids of the grid district
+    """
+    grids = [mv_grid]
+    if not only_calc_mv:
+        for lv_load_area in mv_grid.grid_district.lv_load_areas():
+            for lv_grid_district in lv_load_area.lv_grid_districts():
+                grids.append(lv_grid_district.lv_grid)
+    return grids
+
+
+class PowerFlowSession:
+    """
+    Power flow problem of a MV grid district kept for repeated calculations
+
+    Exporting the grid district and creating the PyPSA network takes most of
+    the time of :func:`run_powerflow_onthefly`. Grid reinforcement only
+    changes line types and transformers, the network is therefore created on
+    first :meth:`run` only. Subsequent runs update r, x and s_nom of changed
+    lines and transformers in place and solve the network again. If lines or
+    transformers were added or removed, the network is created anew.
+
+    Parameters
+    ----------
+    mv_grid: :class:`~.ding0.core.network.grids.MVGridDing0`
+        Grid the power flow is calculated for
+    only_calc_mv: :obj:`bool`
+        If True, lv grids are aggregated at their stations, see
+        :func:`fill_mvgd_component_dataframes`
+    debug: :obj:`bool`
+        If True, grid data is checked for integrity on creation of network
+
+    Attributes
+    ----------
+    network: PyPSA powerflow problem object
+        None until first run
+    """
+
+    def __init__(self, mv_grid, only_calc_mv=True, debug=False):
+        self.mv_grid = mv_grid
+        self.only_calc_mv = only_calc_mv
+        self.debug = debug
+        self.network = None
+        self.snapshots = None
+        self._branches = {}
+        self._transformers = {}
+
+    def grids(self):
+        """Returns grids contained in the power flow problem"""
+        return powerflow_grids(self.mv_grid, only_calc_mv=self.only_calc_mv)
+
+    def _collect_components(self):
+        """Returns exported branches and station transformers of grids keyed
+        by their name"""
+        branches = {}
+        transformers = {}
+        for grid in self.grids():
+            for edge in edges_to_export(grid):
+                branch = edge['branch']
+                if not (branch.connects_aggregated or
+                        branch.helper_component):
+                    branches[_line_name(edge)] = branch
+            for node in grid.graph.nodes():
+                if isinstance(node, LVStationDing0):
+                    for trafo in node.transformers():
+                        transformers[repr(trafo)] = trafo
+        return branches, transformers
+
+    def build(self):
+        """Exports grid district and creates PyPSA network"""
+        buses_df, generators_df, lines_df, loads_df, transformer_df = \
+            initialize_component_dataframes()
+        components, _, _, components_data = fill_mvgd_component_dataframes(
+            self.mv_grid.grid_district, buses_df, generators_df, lines_df,
+            loads_df, transformer_df, only_export_mv=self.only_calc_mv,
+            return_time_varying_data=True)
+        self.network, self.snapshots = prepare_powerflow_problem(
+            components, components_data, debug=self.debug)
+        self._branches, self._transformers = self._collect_components()
+
+    def update(self):
+        """
+        Updates parameters of changed lines and transformers in network
+
+        Returns
+        -------
+        :obj:`bool`
+            False if lines or transformers were added or removed, the network
+            has to be created anew then
+        """
+        branches, transformers = self._collect_components()
+        if (branches.keys() != self._branches.keys() or
+                transformers.keys() != self._transformers.keys()):
+            return False
+        self._branches, self._transformers = branches, transformers
+
+        lines = self.network.lines
+        names = [name for name in branches if name in lines.index]
+        line_data = DataFrame([line_parameters(branches[name])
+                               for name in names], index=names,
+                              columns=['r', 'x', 's_nom', 'length',
+                                       'num_parallel'])
+        changed_lines = _update_changed_rows(lines, line_data)
+
+        trafos = self.network.transformers
+        names = [name for name in transformers if name in trafos.index]
+        trafo_data = DataFrame(
+            [{'r': transformers[name].r_pu, 'x': transformers[name].x_pu,
+              's_nom': transformers[name].s_max_a / 1e3} for name in names],
+            index=names, columns=['r', 'x', 's_nom'])
+        changed_trafos = _update_changed_rows(trafos, trafo_data)
+
+        logger.debug('Power flow problem of {} updated: {} lines and {} '
+                     'transformers changed.'.format(
+            repr(self.mv_grid), changed_lines, changed_trafos))
+        return True
+
+    def run(self, export_pypsa_dir=None, export_result_dir=None):
+        """
+        Runs power flow and assigns results to grid, see
+        :func:`solve_powerflow_problem`
+        """
+        if self.network is None or not self.update():
+            self.build()
+        solve_powerflow_problem(self.network, self.snapshots, self.mv_grid,
+                                export_pypsa_dir=export_pypsa_dir,
+                                export_result_dir=export_result_dir,
+                                only_calc_mv=self.only_calc_mv)
+
+
+def _update_changed_rows(df, data):
+    """
+    Overwrites rows of `df` whose values differ from `data`
+
+    Parameters
+    ----------
+    df: :pandas:`pandas.DataFrame<dataframe>`
+        Component DataFrame of PyPSA network
+    data: :pandas:`pandas.DataFrame<dataframe>`
+        New values, index and columns must be contained in `df`
+
+    Returns
+    -------
+    :obj:`int`
+        Number of changed rows
+    """
+    if data.empty:
+        return 0
+    changed = (df.loc[data.index, data.columns] != data).any(axis=1)
+    if changed.any():
+        df.loc[changed.index[changed], data.columns] = data.loc[changed]
+    return int(changed.sum())
 
 
 def data_integrity(components, components_data):
@@ -1573,13 +1969,15 @@ def data_integrity(components, components_data):
                                      no_data=len(components_data[comp])))
 
 
-def _check_integrity_of_pypsa(pypsa_network):
+def _check_integrity_of_pypsa(pypsa_network, n_sub_networks=1):
     """
     Checks if pypsa network fulfills certain requirements
 
     Parameters
     ----------
     pypsa_network: PyPSA powerflow problem object
+    n_sub_networks: :obj:`int`
+        Number of grids in network, each grid has to be connected
     """
 
     # check for sub-networks
@@ -1587,7 +1985,8 @@ def _check_integrity_of_pypsa(pypsa_network):
                      connected_components(pypsa_network.graph()))
     pypsa_network.determine_network_topology()
 
-    if len(subgraphs) > 1 or len(pypsa_network.sub_networks) > 1:
+    if (len(subgraphs) > n_sub_networks or
+            len(pypsa_network.sub_networks) > n_sub_networks):
         raise ValueError("The graph has isolated nodes or edges")
 
     # check consistency of topology and time series data
@@ -1714,25 +2113,19 @@ def process_pf_results(network):
     line_data: :pandas:`pandas.DataFrame<dataframe>`
         Resulting apparent power at lines
     """
+    # results are stored per snapshot in rows, transpose to lists of
+    # results of all snapshots per bus and line
+    v_mag_pu = network.buses_t.v_mag_pu
+    bus_data = DataFrame({'v_mag_pu': v_mag_pu.to_numpy().T.tolist()},
+                         index=pd.Index(v_mag_pu.columns, name='bus_id'))
 
-    bus_data = {'bus_id': [], 'v_mag_pu': []}
-    line_data = {'line_id': [], 'p0': [], 'p1': [], 'q0': [], 'q1': []}
-
-    # create dictionary of bus results data
-    for col in list(network.buses_t.v_mag_pu.columns):
-        bus_data['bus_id'].append(col)
-        bus_data['v_mag_pu'].append(network.buses_t.v_mag_pu[col].tolist())
+    lines_t = network.lines_t
+    line_data = DataFrame(
+        {attr: getattr(lines_t, attr).to_numpy().T.tolist()
+         for attr in ['p0', 'p1', 'q0', 'q1']},
+        index=pd.Index(lines_t.p0.columns, name='line_id'))
 
-    # create dictionary of line results data
-    for col in list(network.lines_t.p0.columns):
-        line_data['line_id'].append(col)
-        line_data['p0'].append(network.lines_t.p0[col].tolist())
-        line_data['p1'].append(network.lines_t.p1[col].tolist())
-        line_data['q0'].append(network.lines_t.q0[col].tolist())
-        line_data['q1'].append(network.lines_t.q1[col].tolist())
-
-    return DataFrame(bus_data).set_index('bus_id'), \
-           DataFrame(line_data).set_index('line_id')
+    return bus_data, line_data
 
 
 def assign_bus_results(grid, bus_data):
@@ -1745,24 +2138,24 @@ def assign_bus_results(grid, bus_data):
     bus_data: :pandas:`pandas.DataFrame<dataframe>`
         DataFrame containing voltage levels obtained from PF analysis
     """
-
-    # iterate of nodes and assign voltage obtained from power flow analysis
+    # collect nodes connected to graph, buses may be shared by nodes
+    isolated_nodes = set(grid.graph_isolated_nodes())
+    nodes = []
     for node in grid.graph.nodes():
-        # check if node is connected to graph
-        if (node not in grid.graph_isolated_nodes()
-            and not isinstance(node,
-                               LVLoadAreaCentreDing0)):
-            if isinstance(node, LVStationDing0):
-                node.voltage_res = bus_data.loc[node.pypsa_bus_id, 'v_mag_pu']
-            elif isinstance(node, (LVStationDing0, LVLoadAreaCentreDing0)):
-                if node.lv_load_area.is_aggregated:
-                    node.voltage_res = bus_data.loc[node.pypsa_bus_id, 
-                                                    'v_mag_pu']
-            elif not isinstance(node, CircuitBreakerDing0):
-                node.voltage_res = bus_data.loc[node.pypsa_bus_id, 'v_mag_pu']
-            else:
-                logger.warning("Object {} has been skipped while importing "
-                               "results!")
+        if node in isolated_nodes or isinstance(node, LVLoadAreaCentreDing0):
+            continue
+        if isinstance(node, CircuitBreakerDing0):
+            logger.warning("Object {} has been skipped while importing "
+                           "results!".format(repr(node)))
+            continue
+        nodes.append(node)
+
+    # assign voltage obtained from power flow analysis
+    voltages = bus_data['v_mag_pu'].to_numpy()
+    positions = _positions(bus_data.index,
+                           [_pf_bus_id(grid, node) for node in nodes])
+    for node, pos in zip(nodes, positions):
+        node.voltage_res = voltages[pos]
 
 
 def assign_line_results(grid, line_data):
@@ -1775,32 +2168,56 @@ def assign_line_results(grid, line_data):
     line_data: :pandas:`pandas.DataFrame<dataframe>`
         DataFrame containing active/reactive at nodes obtained from PF analysis
     """
+    # apparent power per line and snapshot from maximum of active and
+    # reactive power at both ends
+    def results(attr):
+        return np.abs(np.array(line_data[attr].tolist(), dtype=float))
 
-    package_path = ding0.__path__[0]
+    p = np.maximum(results('p0'), results('p1'))
+    q = np.maximum(results('q0'), results('q1'))
+    decimal_places = 6
+    s_res = np.round(np.sqrt(p ** 2 + q ** 2), decimal_places)
 
-    edges = [edge for edge in grid.graph_edges()
-             if (edge['adj_nodes'][0] in grid.graph.nodes() and
-                 not isinstance(edge['adj_nodes'][0], LVLoadAreaCentreDing0))
-             and (edge['adj_nodes'][1] in grid.graph.nodes() and
-                  not isinstance(edge['adj_nodes'][1], LVLoadAreaCentreDing0))]
+    # helper components of in-building loads and generators are not
+    # exported as lines
+    edges = [edge for edge in edges_to_export(grid)
+             if not (edge['branch'].helper_component or
+                     edge['branch'].connects_aggregated)]
+    positions = _positions(line_data.index,
+                           [_line_name(edge) for edge in edges])
+    for edge, pos in zip(edges, positions):
+        edge['branch'].s_res = s_res[pos].tolist()
 
-    decimal_places = 6
-    for edge in edges:
-        s_res = [
-            round(sqrt(
-                max(abs(line_data.loc[repr(edge['branch']), 'p0'][0]),
-                    abs(line_data.loc[repr(edge['branch']), 'p1'][0])) ** 2 +
-                max(abs(line_data.loc[repr(edge['branch']), 'q0'][0]),
-                    abs(line_data.loc[repr(edge['branch']), 'q1'][0])) ** 2),
-                decimal_places),
-            round(sqrt(
-                max(abs(line_data.loc[repr(edge['branch']), 'p0'][1]),
-                    abs(line_data.loc[repr(edge['branch']), 'p1'][1])) ** 2 +
-                max(abs(line_data.loc[repr(edge['branch']), 'q0'][1]),
-                    abs(line_data.loc[repr(edge['branch']), 'q1'][1])) ** 2),
-                decimal_places)]
-
-        edge['branch'].s_res = s_res
+
+def _pf_bus_id(grid, node):
+    """
+    Returns name of bus of node in power flow problem
+
+    Loads and generators in buildings are not exported as buses, they share
+    the bus of the node they are connected to by a helper component.
+    """
+    if isinstance(node, (LoadDing0, GeneratorDing0)):
+        neighbors = list(grid.graph.neighbors(node))
+        if (len(neighbors) == 1 and
+                grid.graph[node][neighbors[0]]['branch'].helper_component):
+            return neighbors[0].pypsa_bus_id
+    return node.pypsa_bus_id
+
+
+def _positions(index, names):
+    """
+    Returns positions of `names` in `index`
+
+    Raises
+    ------
+    KeyError
+        If names are missing in index
+    """
+    positions = index.get_indexer(names)
+    if (positions < 0).any():
+        raise KeyError('{} not in index.'.format(
+            [name for name, pos in zip(names, positions) if pos < 0]))
+    return positions
 
 
 def init_pypsa_network(time_range_lim):
@@ -1816,6 +2233,7 @@ def init_pypsa_network(time_range_lim):
     snapshots: iterable
         Contains snapshots to be analyzed by powerplow calculation
     """
+    from pypsa import Network
     network = Network()
     network.set_snapshots(time_range_lim)
     snapshots = network.snapshots
@@ -1841,8 +2259,11 @@ def transform_timeseries4pypsa(timeseries, timerange, column=None):
         pypsa_timeseries = timeseries.apply(
             Series).transpose().set_index(timerange)
     else:
-        pypsa_timeseries = timeseries[column].apply(
-            Series).transpose().set_index(timerange)
+        # lists of values per component to one array, components in columns
+        values = np.array(timeseries[column].tolist(), dtype=float)
+        pypsa_timeseries = DataFrame(
+            values.reshape(len(timeseries), len(timerange)).T,
+            index=timerange, columns=timeseries.index)
 
     return pypsa_timeseries
 
@@ -19,11 +19,8 @@ import pandas as pd
 import time
 import os
 import re
+import warnings
 
-from matplotlib import pyplot as plt
-import seaborn as sns
-
-from egoio.tools import db
 from ding0.core import NetworkDing0
 from ding0.core import GeneratorDing0
 from ding0.core import LVCableDistributorDing0, MVCableDistributorDing0
@@ -35,7 +32,6 @@ from ding0.core import LVLoadAreaCentreDing0
 from pyproj import Transformer
 
 from geoalchemy2.shape import from_shape
-from sqlalchemy.orm import sessionmaker
 import multiprocessing as mp
 
 from math import floor, pi
@@ -52,7 +48,6 @@ if not 'READTHEDOCS' in os.environ:
     from shapely.wkt import dumps as wkt_dumps
 
 #############################################
-plt.close('all')
 cfg_ding0.load_config('config_db_tables.cfg')
 cfg_ding0.load_config('config_calc.cfg')
 cfg_ding0.load_config('config_files.cfg')
@@ -104,6 +99,10 @@ def save_nd_to_pickle(nd, path='', filename=None):
         Absolute or relative path where pickle should be saved. Default is ''
         which means pickle is save to PWD
 
+    See Also
+    --------
+    ding0.tools.network_store.write_network :
+        Columnar storage, grid districts are loaded separately
     """
 
     abs_path = os.path.abspath(path)
@@ -142,6 +141,11 @@ def load_nd_from_pickle(filename=None, path=''):
     -------
     nd : NetworkDing0
         Ding0 grid container object
+
+    See Also
+    --------
+    ding0.tools.network_store.read_network :
+        Loading of selected grid districts from columnar storage
     """
 
     abs_path = os.path.abspath(path)
@@ -156,6 +160,7 @@ def plot_cable_length(stats, plotpath):
     """
     Cable length per MV grid district
     """
+    from matplotlib import pyplot as plt
 
     # cable and line kilometer distribution
     f, axarr = plt.subplots(2, 2, sharex=True)
@@ -172,6 +177,8 @@ def plot_generation_over_load(stats, plotpath):
     """
     Plot of generation over load
     """
+    import seaborn as sns
+    from matplotlib import pyplot as plt
 
     # Generation capacity vs. peak load
     sns.set_context("paper", font_scale=1.1)
@@ -210,6 +217,8 @@ def plot_km_cable_vs_line(stats, plotpath):
     :param plotpath:
     :return:
     """
+    import seaborn as sns
+    from matplotlib import pyplot as plt
 
     # Cable vs. line kilometer scatter
     sns.lmplot('km_cable', 'km_line',
@@ -232,11 +241,20 @@ def concat_nd_pickles(self, mv_grid_districts):
     """
     Read multiple pickles, join nd objects and save to file
 
+    .. deprecated:: 0.2.1
+        Write networks to the same directory by
+        :func:`~.ding0.tools.network_store.write_network` instead, grid
+        districts of all networks are read from it by
+        :func:`~.ding0.tools.network_store.read_network`.
+
     Parameters
     ----------
     mv_grid_districts : :obj:`list`
         Ints describing MV grid districts
     """
+    warnings.warn('concat_nd_pickles is deprecated, write networks to the '
+                  'same directory by ding0.tools.network_store.write_network '
+                  'instead.', DeprecationWarning, stacklevel=2)
 
     pickle_name = cfg_ding0.get('output', 'nd_pickle')
     # self.nd = self.read_pickles_from_files(pickle_name)
@@ -461,6 +479,48 @@ def calculate_lvgd_stats(nw):
 
 
 ####################################################
+def _path_properties(graph, root, omega):
+    """
+    Properties of paths from `root` to all nodes reachable from it
+
+    Paths are taken from one breadth-first search tree, i.e. they have the
+    least number of branches like paths of :func:`networkx.shortest_path`.
+    Properties of a node's path are those of its parent's path plus the
+    branch between both, all nodes are handled in one pass.
+
+    Parameters
+    ----------
+    graph: :networkx:`NetworkX Graph Obj< >`
+        Graph of grid with branches as edge attribute 'branch'
+    root: |ding0_node_object_types|
+        Node paths start at, e.g. station
+    omega: :obj:`float`
+        Angular frequency
+
+    Returns
+    -------
+    :obj:`dict`
+        Complex impedance of path per node
+    :obj:`dict`
+        Length of path per node
+    :obj:`dict`
+        Thermal limit `I_max_th` of first branch of path per node, None
+        for `root`
+    """
+    impedances = {root: 0}
+    lengths = {root: 0}
+    thermal_limits = {root: None}
+    for parent, node in nx.bfs_edges(graph, root):
+        branch = graph.adj[parent][node]['branch']
+        impedances[node] = impedances[parent] + (
+            (branch.type['L_per_km'] * 1e-3 * omega * branch.length) * 1j +
+            (branch.type['R_per_km'] * branch.length))
+        lengths[node] = lengths[parent] + branch.length
+        thermal_limits[node] = branch.type['I_max_th'] if parent is root \
+            else thermal_limits[parent]
+    return impedances, lengths, thermal_limits
+
+
 def calculate_mvgd_stats(nw):
     """
     MV Statistics for an arbitrary network
@@ -527,34 +587,26 @@ def calculate_mvgd_stats(nw):
         n_outgoing_MV = 0
 
         G = district.mv_grid.graph
+        # properties of paths from MV station to all nodes at once
+        mv_path_impedances, mv_path_lengths_all, mv_path_thermal_limits = \
+            _path_properties(G, root, omega)
+        max_lv_path_lengths = {}  # length of longest path in LV grid of station
 
         for node in G.nodes():
             if isinstance(node, MVStationDing0):
                 n_outgoing_MV += len(list(G.neighbors(node)))
                 continue
-            mv_impedance = 0
-            mv_path_length = 0
             if not isinstance(node, MVCableDistributorDing0) and not isinstance(node, CircuitBreakerDing0):
-                if not nx.has_path(G, root, node):
+                if node not in mv_path_impedances:
                     continue
                     #print(node, node.lv_load_area.is_aggregated) # only debug
                 else:
-                    path = nx.shortest_path(G, root, node)
-                    for i in range(len(path) - 1):
-                        mv_impedance += (G.adj[path[i]][path[i + 1]]['branch'].type[
-                                 'L_per_km'] * 1e-3 * omega * \
-                             G.adj[path[i]][path[i + 1]][
-                                 'branch'].length) *1j  + \
-                            (G.adj[path[i]][path[i + 1]]['branch'].type[
-                                 'R_per_km'] * \
-                             G.adj[path[i]][path[i + 1]][
-                                 'branch'].length)
-                        mv_path_length += G.adj[path[i]][path[i + 1]][
-                            'branch'].length
+                    mv_impedance = mv_path_impedances[node]
+                    mv_path_length = mv_path_lengths_all[node]
 
                     mv_impedances[node] = abs(mv_impedance)
                     mv_path_lengths[node] = mv_path_length
-                    mv_thermal_limit = G.adj[path[0]][path[1]]['branch'].type['I_max_th']
+                    mv_thermal_limit = mv_path_thermal_limits[node]
                     mv_thermal_limits[node] = mv_thermal_limit
 
                     if isinstance(node, LVStationDing0):
@@ -569,19 +621,15 @@ def calculate_mvgd_stats(nw):
 
                         # identify LV nodes belonging to LV station
                         G_lv = node.grid._graph
+                        lv_path_impedances, lv_path_lengths, lv_path_thermal_limits = \
+                            _path_properties(G_lv, node, omega)
+                        max_lv_path_lengths[node] = max(lv_path_lengths.values())
                         # loop over all LV terminal nodes belonging to LV station
                         for lv_node in G_lv.nodes():
                             if isinstance(lv_node, GeneratorDing0) or isinstance(lv_node, LVLoadDing0):
-                                lv_path = nx.shortest_path(G_lv, node, lv_node)
-                                lv_impedance = lvstation_impedance
-                                lv_path_length = 0.
-                                for i in range(len(lv_path)-1):
-                                    lv_impedance += (G_lv.adj[lv_path[i]][lv_path[i+1]]['branch'].type['L_per_km'] * 1e-3 * omega * \
-                                                     G_lv.adj[lv_path[i]][lv_path[i+1]]['branch'].length) *1j + \
-                                                    (G_lv.adj[lv_path[i]][lv_path[i+1]]['branch'].type['R_per_km'] * \
-                                                     G_lv.adj[lv_path[i]][lv_path[i+1]]['branch'].length)
-                                    lv_path_length += G_lv.adj[lv_path[i]][lv_path[i+1]]['branch'].length
-                                lv_thermal_limit = G_lv.adj[lv_path[0]][lv_path[1]]['branch'].type['I_max_th']
+                                lv_impedance = lvstation_impedance + lv_path_impedances[lv_node]
+                                lv_path_length = lv_path_lengths[lv_node]
+                                lv_thermal_limit = lv_path_thermal_limits[lv_node]
 
                                 mvlv_impedances[lv_node] = abs( mv_impedance + lv_impedance )
                                 mvlv_path_lengths[lv_node] = mv_path_length + lv_path_length
@@ -695,9 +743,7 @@ def calculate_mvgd_stats(nw):
                     'v_level': node.v_level,
                     'isolation': isolation,
                 }
-                mv_path_length = district.mv_grid.graph_path_length(
-                    node_source=root,
-                    node_target=node)
+                mv_path_length = mv_path_lengths_all[node]
 
             elif isinstance(node, MVCableDistributorDing0):
                 cd_count += 1
@@ -707,19 +753,8 @@ def calculate_mvgd_stats(nw):
                 lv_trafo_cap += np.sum([trafo.s_max_a for trafo in node.transformers()])
 
                 if not node.lv_load_area.is_aggregated:
-                    mv_path_length = district.mv_grid.graph_path_length(
-                        node_source=root,
-                        node_target=node)
-                    max_lv_path = 0
-                    for lv_LA in district.lv_load_areas():
-                        for lv_dist in lv_LA.lv_grid_districts():
-                            if lv_dist.lv_grid._station == node:
-                                for lv_node in lv_dist.lv_grid.graph.nodes():
-                                    lv_path_length = lv_dist.lv_grid.graph_path_length(
-                                        node_source=node,
-                                        node_target=lv_node)
-                                    max_lv_path = max(max_lv_path, lv_path_length)
-                    mvlv_path_length = mv_path_length + max_lv_path
+                    mv_path_length = mv_path_lengths_all[node]
+                    mvlv_path_length = mv_path_length + max_lv_path_lengths[node]
 
             elif isinstance(node, CircuitBreakerDing0):
                 cb_count += 1
@@ -1219,6 +1254,8 @@ def init_mv_grid(mv_grid_districts=[3545], filename='ding0_tests_grids_1.pkl'):
         The created MV network.
 
     '''
+    from sqlalchemy.orm import sessionmaker
+    from egoio.tools import db
     print('\n########################################')
     print('  Running ding0 for district', mv_grid_districts)
     # database connection/ session
@@ -1296,6 +1333,8 @@ def process_stats(mv_districts,
           If mode=='MV', then DataFrame is empty.
           If critical==False, then DataFrame is empty.
     '''
+    from sqlalchemy.orm import sessionmaker
+    from egoio.tools import db
     #######################################################################
     # decide what exactly to do with MV LV
     if mode == 'MV':
@@ -2179,11 +2218,9 @@ def export_data_tocsv(path, run_id, lv_grid, lv_gen, lv_cd, lv_stations, mvlv_tr
 
 ########################################################
 
-from sqlalchemy import create_engine
-from egoio.db_tables import model_draft as md
-
-
 def export_network_to_oedb(session, table, tabletype, srid):
+    from egoio.db_tables import model_draft as md
+    from sqlalchemy import create_engine
     dataset = []
     engine = create_engine("sqlite:///myexample.db")
     print("Exporting table type : {}".format(tabletype))
@@ -2393,6 +2430,7 @@ def export_data_to_oedb(session, srid, lv_grid, lv_gen, lv_cd, mvlv_stations, mv
 
 
 def create_ding0_db_tables(engine):
+    from egoio.db_tables import model_draft as md
     tables = [md.EgoGridDing0Line,
               md.EgoGridDing0LvBranchtee,
               md.EgoGridDing0LvGenerator,
@@ -2413,6 +2451,7 @@ def create_ding0_db_tables(engine):
 
 
 def drop_ding0_db_tables(engine):
+    from egoio.db_tables import model_draft as md
     tables = [md.EgoGridDing0Line,
               md.EgoGridDing0LvBranchtee,
               md.EgoGridDing0LvGenerator,
@@ -13,8 +13,13 @@ __url__        = "https://github.com/openego/ding0/blob/master/LICENSE"
 __author__     = "nesnoj, gplssm"
 
 
+import sys
+
+import networkx as nx
+import pandas as pd
 from geopy import distance
 from shapely.geometry import Point, LineString, LinearRing, Polygon
+from shapely.geometry.base import BaseGeometry
 
 
 def merge_two_dicts(x, y):
@@ -56,13 +61,38 @@ def merge_two_dicts_of_dataframes(dict1, dict2):
     merged_dict={}
     for key in dict1:
         if key in dict2:
-            merged_dict[key] = dict1[key].append(dict2[key])
+            merged_dict[key] = pd.concat([dict1[key], dict2[key]], sort=False)
         else:
             merged_dict[key] = dict1[key]
     for key in dict2:
         if key not in merged_dict:
             merged_dict[key] = dict2[key]
     return merged_dict
+
+
+def concat_dicts_of_dataframes(dicts):
+    '''
+    Concatenate dicts of pandas.DataFrame key by key
+
+    Other than repeatedly calling :func:`merge_two_dicts_of_dataframes`,
+    each DataFrame is copied only once.
+
+    Parameters
+    ----------
+    dicts: list of dicts of dataframes
+
+    Returns
+    -------
+    :obj:`dict`
+        DataFrames of all dicts concatenated in order of `dicts`, keyed by
+        keys of all dicts
+    '''
+    frames = {}
+    for dict_of_dataframes in dicts:
+        for key, df in dict_of_dataframes.items():
+            frames.setdefault(key, []).append(df)
+    return {key: dfs[0] if len(dfs) == 1 else pd.concat(dfs, sort=False)
+            for key, dfs in frames.items()}
     
     
 def get_dest_point(source_point, distance_m, bearing_deg):
@@ -165,3 +195,55 @@ def create_poly_from_source(source_point, left_m, right_m, up_m, down_m):
                    get_cart_dest_point(source_point, right_m, -1*down_m),
                    get_cart_dest_point(source_point, -1*left_m, -1*down_m)]
     return Polygon(sum(map(list, (p.coords for p in poly_points)), []))
+
+
+def estimate_memory(obj, seen=None):
+    """
+    Estimates memory held by an object and the containers, frames, graphs
+    and geometries it holds
+
+    Objects referenced by other objects (e.g. ding0 objects in node data)
+    are counted by their own size only. Objects in `seen` are skipped, this
+    way objects shared by several structures are counted once.
+
+    Parameters
+    ----------
+    obj: :obj:`object`
+        Object, e.g. :networkx:`NetworkX Graph Obj< >` or
+        :pandas:`pandas.DataFrame<DataFrame>`
+    seen: :obj:`set`, optional
+        Ids of objects already counted, updated in place
+
+    Returns
+    -------
+    :obj:`int`
+        Estimated memory in bytes
+    """
+    if seen is None:
+        seen = set()
+
+    memory = 0
+    stack = [obj]
+    while stack:
+        obj = stack.pop()
+        if obj is None or id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        memory += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif isinstance(obj, nx.Graph):
+            # subgraph views only reference the data of their parent graph
+            stack.extend(value for value in vars(obj).values()
+                         if isinstance(value, dict))
+        elif isinstance(obj, (pd.DataFrame, pd.Series)):
+            memory += int(obj.memory_usage(deep=True, index=True).sum()
+                          if isinstance(obj, pd.DataFrame)
+                          else obj.memory_usage(deep=True, index=True))
+        elif isinstance(obj, BaseGeometry) and not obj.is_empty:
+            # coordinates are held by GEOS, estimated by size of WKB
+            memory += len(obj.wkb)
+    return memory
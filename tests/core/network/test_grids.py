@@ -381,6 +381,68 @@ class TestMVGridDing0(object):
         with pytest.raises(ValueError):
             nodes_out = grid.graph_nodes_from_subtree(generators[2])
 
+    def test_graph_branch_index(self, ring_mvgridding0):
+        """
+        Check that nodes of branches and sorted edges returned by
+        graph_nodes_from_branch and graph_edges follow changes of the
+        graph and match a search of the graph.
+        """
+        ring, grid = ring_mvgridding0
+
+        def check_index():
+            edges = nx.get_edge_attributes(grid.graph, 'branch')
+            for nodes, branch in edges.items():
+                assert grid.graph_nodes_from_branch(branch) == nodes
+            edges_expected = sorted(
+                edges.items(),
+                key=lambda _: ''.join(sorted([repr(_[0][0]),
+                                              repr(_[0][1])])))
+            assert [(edge['adj_nodes'], edge['branch'])
+                    for edge in grid.graph_edges()] == edges_expected
+
+        check_index()
+        generators = list(grid.generators())
+        branch = grid.graph[generators[2]][generators[1]]['branch']
+        grid.graph.remove_edge(generators[1], generators[2])
+        with pytest.raises(ValueError):
+            grid.graph_nodes_from_branch(branch)
+        check_index()
+        grid.graph.add_edge(grid.station(), generators[2], branch=branch)
+        check_index()
+        grid.graph.remove_node(generators[0])
+        check_index()
+        grid.graph.add_edges_from([(generators[0], generators[1],
+                                    {'branch': BranchDing0(grid=grid)})])
+        check_index()
+
+    def test_rings_cache_invalidation(self, ring_mvgridding0):
+        """
+        Check that rings and subtrees follow changes of the graph
+        although they are kept between calls.
+        """
+        ring, grid = ring_mvgridding0
+        generators = list(grid.generators())
+        assert grid.graph_nodes_from_subtree(generators[1]) == [
+            generators[2]]
+        rings = list(grid.rings_nodes())
+        assert list(grid.rings_nodes()) == rings
+
+        # add satellite to subtree
+        generator4 = GeneratorDing0(id_db=3, geo_data=Point(3, 3),
+                                    mv_grid=grid)
+        grid.add_generator(generator4)
+        grid.graph.add_edge(generators[2], generator4,
+                            branch=BranchDing0(id_db='3', grid=grid))
+        assert grid.graph_nodes_from_subtree(generators[1]) == [
+            generators[2], generator4]
+
+        # remove branch of ring
+        circuit_breaker = list(grid.circuit_breakers())[0]
+        grid.graph.remove_edge(circuit_breaker, generators[0])
+        assert list(grid.rings_nodes()) == []
+        with pytest.raises(ValueError):
+            grid.graph_nodes_from_subtree(generators[1])
+
     @pytest.fixture
     def oedb_session(self):
         """
@@ -15,6 +15,7 @@ from ding0.tools.results import (calculate_lvgd_stats,
 import pandas as pd
 from pandas.testing import assert_frame_equal
 import os
+import pickle
 import numpy as np
 
 
@@ -430,6 +431,34 @@ class TestStationDing0(object):
         assert transformer2_in_empty_stationding0.x_pu == 0.001
 
 
+class TestBranchDing0(object):
+
+    def test_pickle_slots(self):
+        """
+        Checks that attributes stored in slots are pickled and that
+        branches pickled with attributes in `__dict__` can be restored
+        """
+        branch = BranchDing0(id_db='1', length=100., kind='cable',
+                             type=pd.Series({'name': 'NA2XS2Y 3x1x185 RM/25',
+                                             'I_max_th': 0.357}))
+        assert branch.__dict__ == {}
+        branch.note = 'custom attribute'
+
+        branch_unpickled = pickle.loads(pickle.dumps(branch))
+        assert branch_unpickled.id_db == '1'
+        assert branch_unpickled.length == 100.
+        assert branch_unpickled.type is branch.type
+        assert branch_unpickled.note == 'custom attribute'
+
+        branch_old = BranchDing0.__new__(BranchDing0)
+        branch_old.__setstate__({'id_db': '2', 'kind': 'line',
+                                 'type': branch.type.to_series()})
+        assert branch_old.id_db == '2'
+        assert branch_old.kind == 'line'
+        assert branch_old.type is branch.type
+        assert branch_old.__dict__ == {}
+
+
 if __name__ == "__main__":
     pass
 
@@ -7,7 +7,12 @@ import pandas as pd
 import os
 from tests.core.network.test_grids import TestMVGridDing0
 from ding0.core import NetworkDing0
+from ding0.tools.equipment import sorted_equipment
+from ding0.tools import network_store
+from ding0.tools.pypsa_io import PowerFlowSession, powerflow_grids
 import shutil
+import networkx as nx
+from shapely.geometry import LineString, Point
 
 
 class TestNetworkDing0(object):
@@ -43,6 +48,23 @@ class TestNetworkDing0(object):
         empty_list = []
         assert mv_grid_districts == empty_list
 
+    def test_register_numpy_adapter(self, monkeypatch):
+        """
+        Checks that numpy.int64 can be adapted by psycopg2 after creating a
+        network from a session not created by ding0.tools.database
+        """
+        import numpy as np
+        import ding0
+        from psycopg2.extensions import adapt, adapters, ISQLQuote
+
+        monkeypatch.delitem(adapters, (np.int64, ISQLQuote), raising=False)
+        monkeypatch.setattr(ding0, '_numpy_adapter_registered', False)
+        monkeypatch.setattr(NetworkDing0, 'import_orm',
+                            lambda self, session: {})
+
+        NetworkDing0(name='network', session=sessionmaker()())
+        assert adapt(np.int64(5)).getquoted() == b'5'
+
     def test_import_mv_grid_districts(self, oedb_session):
         with pytest.raises(TypeError):
             NetworkDing0.import_mv_grid_districts(
@@ -166,6 +188,77 @@ class TestNetworkDing0(object):
         finally:
             shutil.rmtree(path, ignore_errors=True)
 
+    def test_to_dataframe(self, minimal_grid):
+        """
+        Checks that components of all grid districts are exported with one
+        row of network per grid district
+        """
+        components = minimal_grid.to_dataframe()
+        assert len(components['Network']) == 1
+
+        # export grid district twice, circuit breakers are closed by the
+        # first export, the second one has no virtual buses
+        minimal_grid._mv_grid_districts.append(
+            minimal_grid._mv_grid_districts[0])
+        components_twice = minimal_grid.to_dataframe()
+        assert len(components_twice['Network']) == 2
+        assert len(components_twice['Line']) == 2 * len(components['Line'])
+        for key, df in components.items():
+            assert set(components_twice[key].index) == set(df.index)
+
+    def test_write_read_network(self, minimal_grid, tmpdir):
+        """
+        Checks that grid districts read from columnar storage have the
+        topology and power flow results of the written ones
+        """
+        pytest.importorskip('pyarrow')
+        minimal_grid.control_circuit_breakers(mode='open')
+        minimal_grid.run_powerflow(method='radial')
+        path = str(tmpdir)
+        network_store.write_network(minimal_grid, path)
+
+        mv_grid_district = minimal_grid._mv_grid_districts[0]
+        assert network_store.stored_mv_grid_districts(path) == [
+            mv_grid_district.id_db]
+        nd = network_store.read_network(path)
+        mv_grid = nd._mv_grid_districts[0].mv_grid
+        assert mv_grid.network is nd
+        assert mv_grid.grid_district is nd._mv_grid_districts[0]
+        assert [repr(node) for node in mv_grid.graph.nodes()] == [
+            repr(node) for node in mv_grid_district.mv_grid.graph.nodes()]
+        assert [(edge['branch'].length, edge['branch'].s_res)
+                for edge in mv_grid.graph_edges()] == [
+            (edge['branch'].length, edge['branch'].s_res)
+            for edge in mv_grid_district.mv_grid.graph_edges()]
+        for edge in mv_grid.graph_edges():
+            assert edge['branch'] in mv_grid.graph.adj[
+                edge['adj_nodes'][0]][edge['adj_nodes'][1]].values()
+
+    def test_read_table(self, minimal_grid, tmpdir):
+        """
+        Checks that lengths of branches are read from columnar storage
+        without reading objects or copying the column into memory
+        """
+        pa = pytest.importorskip('pyarrow')
+        path = str(tmpdir)
+        network_store.write_network(minimal_grid, path)
+        mv_grid_district = minimal_grid._mv_grid_districts[0]
+        lengths = sorted(
+            edge['branch'].length
+            for grid in powerflow_grids(mv_grid_district.mv_grid,
+                                        only_calc_mv=False)
+            for edge in grid.graph_edges())
+
+        allocated_bytes = pa.total_allocated_bytes()
+        table = network_store.read_table(
+            path, mv_grid_district.id_db, 'BranchDing0', ['length'])
+        column = table['length'].to_numpy()
+        assert pa.total_allocated_bytes() == allocated_bytes
+        assert table.column_names == ['length']
+        assert network_store.table_encodings(table)['encodings'][
+            'length'] == 'float'
+        assert sorted(column) == pytest.approx(lengths)
+
     def test_run_powerflow(self, minimal_grid):
         """
         Checks if power flow on test grid provides the expected values. 
@@ -250,3 +343,194 @@ class TestNetworkDing0(object):
             print('Finished testing MV and LV grids')
         finally:
             shutil.rmtree(path, ignore_errors=True)
+
+    def test_powerflow_session(self, minimal_grid):
+        """
+        Checks that updating the power flow problem of a reinforced grid
+        gives the results of a newly created one
+        """
+        mv_grid = minimal_grid._mv_grid_districts[0].mv_grid
+        pf_session = PowerFlowSession(mv_grid)
+        pf_session.run()
+        network = pf_session.network
+
+        # reinforce all lines with the largest cable
+        cable = sorted_equipment(minimal_grid.static_data['MV_cables'],
+                                 'I_max_th', U_n=mv_grid.v_level).largest()
+        for edge in mv_grid.graph_edges():
+            edge['branch'].type = cable
+        pf_session.run()
+        assert pf_session.network is network
+        voltages = {node: node.voltage_res for node in mv_grid.graph.nodes()
+                    if hasattr(node, 'voltage_res')}
+        s_res = {edge['branch']: edge['branch'].s_res
+                 for edge in mv_grid.graph_edges()}
+
+        PowerFlowSession(mv_grid).run()
+        for node, voltage in voltages.items():
+            assert node.voltage_res == pytest.approx(voltage, abs=1e-8)
+        for branch, s in s_res.items():
+            assert branch.s_res == pytest.approx(s, abs=1e-6)
+
+    def test_run_powerflow_radial(self, minimal_grid):
+        """
+        Checks that radial power flow provides the results of PyPSA
+        """
+        mv_grid = minimal_grid._mv_grid_districts[0].mv_grid
+        minimal_grid.set_circuit_breakers()
+        results = {}
+        for method in ['onthefly', 'radial']:
+            # export of grid closes circuit breakers
+            minimal_grid.control_circuit_breakers(mode='open')
+            minimal_grid.run_powerflow(method=method)
+            results[method] = (
+                {node: node.voltage_res for node in mv_grid.graph.nodes()
+                 if hasattr(node, 'voltage_res')},
+                {edge['branch']: edge['branch'].s_res
+                 for edge in mv_grid.graph_edges()})
+
+        voltages, s_res = results['onthefly']
+        voltages_radial, s_res_radial = results['radial']
+        assert voltages_radial.keys() == voltages.keys()
+        for node, voltage in voltages.items():
+            assert voltages_radial[node] == pytest.approx(voltage, abs=1e-6)
+        for branch, s in s_res.items():
+            assert s_res_radial[branch] == pytest.approx(s, abs=1e-6)
+
+    def test_run_powerflow_lv(self, minimal_grid):
+        """
+        Checks that results of power flow of mv and lv grids are assigned to
+        all nodes and branches of the lv grids and that radial power flow
+        provides the results of PyPSA
+        """
+        mv_grid = minimal_grid._mv_grid_districts[0].mv_grid
+        lv_grids = powerflow_grids(mv_grid, only_calc_mv=False)[1:]
+        assert lv_grids
+        minimal_grid.set_circuit_breakers()
+        results = {}
+        for method in ['onthefly', 'radial']:
+            minimal_grid.control_circuit_breakers(mode='open')
+            minimal_grid.run_powerflow(method=method, only_calc_mv=False)
+            results[method] = (
+                {node: node.voltage_res for lv_grid in lv_grids
+                 for node in lv_grid.graph.nodes()
+                 if lv_grid.graph.degree(node)},
+                {edge['branch']: edge['branch'].s_res for lv_grid in lv_grids
+                 for edge in lv_grid.graph_edges()})
+
+        voltages, s_res = results['onthefly']
+        voltages_radial, s_res_radial = results['radial']
+        for node, voltage in voltages.items():
+            assert voltages_radial[node] == pytest.approx(voltage, abs=1e-6)
+        for branch, s in s_res.items():
+            assert s_res_radial[branch] == pytest.approx(s, abs=1e-6)
+
+    def test_run_powerflow_batch(self, minimal_grid):
+        """
+        Checks that power flow of grid districts in batches provides the
+        results of power flow per grid district
+        """
+        mv_grid = minimal_grid._mv_grid_districts[0].mv_grid
+        minimal_grid.set_circuit_breakers()
+        results = []
+        for batch_size in [None, 10]:
+            minimal_grid.control_circuit_breakers(mode='open')
+            minimal_grid.run_powerflow(batch_size=batch_size)
+            results.append((
+                {node: node.voltage_res for node in mv_grid.graph.nodes()
+                 if hasattr(node, 'voltage_res')},
+                {edge['branch']: edge['branch'].s_res
+                 for edge in mv_grid.graph_edges()}))
+        assert results[0] == results[1]
+
+        with pytest.raises(ValueError):
+            minimal_grid.run_powerflow(batch_size=10, export_pypsa=True)
+
+    def test_run_powerflow_batch_districts(self, minimal_grid):
+        """
+        Checks that results of several grid districts solved in one batch
+        are assigned to the districts they belong to
+        """
+        import copy
+        minimal_grid.set_circuit_breakers()
+        mv_grid_district = minimal_grid._mv_grid_districts[0]
+        # same district under different ids, with halved generation
+        copied = copy.deepcopy(mv_grid_district,
+                               {id(minimal_grid): minimal_grid})
+        minimal_grid.add_mv_grid_district(copied)
+        with pytest.raises(ValueError):
+            minimal_grid.run_powerflow(batch_size=10)
+
+        copied.id_db += 1
+        copied.mv_grid.id_db += 1
+        for load_area in copied.lv_load_areas():
+            load_area.id_db += 100000
+            for lv_grid_district in load_area.lv_grid_districts():
+                lv_grid_district.id_db += 100000
+                lv_grid_district.lv_grid.id_db += 100000
+        for generator in copied.mv_grid.generators():
+            generator.capacity /= 2
+
+        results = []
+        for batch_size in [None, 10]:
+            minimal_grid.control_circuit_breakers(mode='open')
+            minimal_grid.run_powerflow(batch_size=batch_size)
+            results.append([
+                ({repr(node): node.voltage_res
+                  for node in grid_district.mv_grid.graph.nodes()
+                  if hasattr(node, 'voltage_res')},
+                 {repr(edge['branch']): edge['branch'].s_res
+                  for edge in grid_district.mv_grid.graph_edges()})
+                for grid_district in minimal_grid.mv_grid_districts()])
+        assert results[0] == results[1]
+        # districts differ in their results
+        (voltages, _), (voltages_copied, _) = results[0]
+        assert len(voltages) == len(voltages_copied) > 0
+        assert list(voltages.values()) != list(voltages_copied.values())
+
+    def test_release_osm_data(self, minimal_grid):
+        """
+        Checks that memory held by OSM graphs and buildings is reported
+        and that they are released per level
+        """
+        mv_grid_district = minimal_grid._mv_grid_districts[0]
+        load_area = list(mv_grid_district.lv_load_areas())[0]
+        lv_grid_district = list(load_area.lv_grid_districts())[0]
+        load_area.load_area_graph = nx.MultiDiGraph()
+        load_area.load_area_graph.add_edge(
+            1, 2, geometry=LineString([(0, 0), (0, 1)]), length=1.)
+        load_area.load_area_graph.add_edge(
+            2, 3, geometry=LineString([(0, 1), (1, 1)]), length=1.)
+        lv_grid_district.graph_district = \
+            load_area.load_area_graph.subgraph([1, 2])
+        lv_grid_district.buildings = pd.DataFrame(
+            {'capacity': [10., 20.],
+             'footprint': [Point(0, 0).buffer(1), Point(1, 1).buffer(1)]})
+
+        memory = minimal_grid.osm_data_memory()
+        assert list(memory.index) == [mv_grid_district.id_db]
+        assert (memory.loc[mv_grid_district.id_db] > 0).all()
+        # views only reference data of their parent graph
+        assert memory.at[mv_grid_district.id_db, 'graph_district'] < \
+            memory.at[mv_grid_district.id_db, 'load_area_graph']
+
+        with pytest.raises(ValueError):
+            minimal_grid.release_osm_data(level='hv')
+        assert minimal_grid.release_osm_data(level='lv').equals(memory)
+        assert lv_grid_district.graph_district is None
+        assert list(lv_grid_district.buildings.columns) == ['capacity']
+        assert load_area.load_area_graph is not None
+
+        minimal_grid.release_osm_data(level='mv')
+        assert nx.is_empty(load_area.load_area_graph)
+        assert load_area.load_area_graph.graph['released']
+        assert (minimal_grid.osm_data_memory()[
+            ['load_area_graph', 'graph_district']] == 0).all(axis=None)
+
+        # isolation of load areas is unknown without their graphs
+        from ding0.grid.mv_grid.analysis import get_load_specific_results
+        results = get_load_specific_results(minimal_grid)[0]
+        assert pd.isna(results['la_urban_isolated_tot_rate [%]'])
+        assert pd.isna(results['la_rural_isolated_tot_rate [%]'])
+        assert results['la_no_total [km]'] == len(
+            list(mv_grid_district.lv_load_areas()))
@@ -1,6 +1,12 @@
+import os
+
+import numpy as np
+import pandas as pd
 import pytest
 
 from ding0.core.powerflow import q_sign
+from ding0.core.powerflow.radial import RadialPowerFlowProblem
+from ding0.core.powerflow.timeseries import run_timeseries_powerflow
 
 
 def test_q_sign():
@@ -15,3 +21,164 @@ def test_q_sign():
     assert q_sign('capacitive', 'generator') == 1
     assert q_sign('inductive', 'load') == 1
     assert q_sign('capacitive', 'load') == -1
+
+
+@pytest.fixture
+def feeder():
+    """
+    Returns components of a MV feeder with slack bus, generator at the
+    end of a line and a transformer to a LV bus with load
+    """
+    components = {
+        'Bus': pd.DataFrame({'v_nom': [20., 20., 0.4]},
+                            index=['slack', 'mv', 'lv']),
+        'Line': pd.DataFrame({'bus0': ['mv'], 'bus1': ['slack'],
+                              'r': [1.2], 'x': [0.8], 's_nom': [2.]},
+                             index=['line']),
+        'Transformer': pd.DataFrame({'bus0': ['mv'], 'bus1': ['lv'],
+                                     'r': [0.01], 'x': [0.04],
+                                     's_nom': [0.63]}, index=['trafo']),
+        'Generator': pd.DataFrame({'bus': ['slack', 'mv'],
+                                   'control': ['Slack', 'PQ'],
+                                   'p_nom': [0., 2.]},
+                                  index=['slack_gen', 'gen']),
+        'Load': pd.DataFrame({'bus': ['lv'], 'p_set': [0.5]},
+                             index=['load'])}
+    components_data = {
+        'Bus': pd.DataFrame({'v_mag_pu_set': [[1.02, 1.]]},
+                            index=['slack']),
+        'Generator': pd.DataFrame({'p_set': [[0.1, 2.]],
+                                   'q_set': [[0., -0.4]]},
+                                  index=['gen']),
+        'Load': pd.DataFrame({'p_set': [[0.5, 0.05]],
+                              'q_set': [[0.1, 0.01]]},
+                             index=['load'])}
+    return components, components_data
+
+
+class TestRadialPowerFlowProblem(object):
+
+    def test_solve(self, feeder):
+        """
+        Checks that the power injected at every bus is balanced by the
+        branch flows obtained from the voltages
+        """
+        components, components_data = feeder
+        problem = RadialPowerFlowProblem(components, components_data)
+        v, _ = problem.solve()
+        assert np.abs(v[0]) == pytest.approx([1.02, 1.])
+
+        # branch flows in p.u. of 1 MVA from voltages
+        z_line = (1.2 + 0.8j) / 20. ** 2
+        z_trafo = (0.01 + 0.04j) / 0.63
+        i_line = (v[1] - v[0]) / z_line
+        i_trafo = (v[1] - v[2]) / z_trafo
+        s_mv = v[1] * np.conj(i_line + i_trafo)
+        s_lv = v[2] * np.conj(-i_trafo)
+        assert s_mv == pytest.approx(np.array([0.1, 2. - 0.4j]), abs=1e-8)
+        assert s_lv == pytest.approx(-np.array([0.5 + 0.1j, 0.05 + 0.01j]),
+                                     abs=1e-8)
+
+        bus_data, line_data = problem.results(*problem.solve())
+        assert bus_data.loc['lv', 'v_mag_pu'] == pytest.approx(
+            np.abs(v[2]).tolist())
+        s0 = v[1] * np.conj(i_line)
+        assert line_data.loc['line', 'p0'] == pytest.approx(s0.real.tolist())
+        assert line_data.loc['line', 'q0'] == pytest.approx(s0.imag.tolist())
+        # feed-in case: active power flows from generator towards slack
+        assert line_data.loc['line', 'p0'][1] > 0
+        assert line_data.loc['line', 'p1'][1] < 0
+
+    def test_meshed_grid(self, feeder):
+        components, components_data = feeder
+        components['Line'] = pd.DataFrame(
+            {'bus0': ['mv', 'slack'], 'bus1': ['slack', 'mv'],
+             'r': [1.2, 1.2], 'x': [0.8, 0.8]}, index=['line', 'line_2'])
+        with pytest.raises(ValueError):
+            RadialPowerFlowProblem(components, components_data)
+
+
+class TestTimeSeriesPowerFlow(object):
+
+    def test_aggregated_results(self, feeder):
+        """
+        Checks that profiles of load case and feed-in case provide the
+        extreme values of both cases, independent of chunk size and type of
+        profiles
+        """
+        components, components_data = feeder
+        # same slack voltage and power factor of generator in both cases
+        components_data['Bus']['v_mag_pu_set'] = [[1.02, 1.02]]
+        components_data['Generator']['q_set'] = [[-0.02, -0.4]]
+        problem = RadialPowerFlowProblem(components, components_data)
+        v, j = problem.solve()
+        s0, s1 = problem.line_power(v, j)
+        s_line = np.maximum(np.abs(s0), np.abs(s1))
+
+        load_profiles = np.array([[1.], [0.1]])
+        generator_profiles = pd.DataFrame({'gen': [0.05, 1.]})
+        for chunk_size in [1, 2]:
+            results = run_timeseries_powerflow(
+                components, components_data, load_profiles,
+                generator_profiles, chunk_size=chunk_size,
+                v_limits=(0.95, 1.01))
+            assert results.n_snapshots == 2
+            bus_data = results.bus_data()
+            assert bus_data['v_mag_pu_min'].to_numpy() == pytest.approx(
+                np.abs(v).min(axis=1))
+            assert bus_data['v_mag_pu_max'].to_numpy() == pytest.approx(
+                np.abs(v).max(axis=1))
+            # slack bus is above 1.01 p.u. in both cases
+            assert bus_data.loc['slack', 'voltage_violations'] == 2
+            line_data = results.line_data()
+            assert line_data.loc['line', 's_max'] == pytest.approx(
+                s_line.max())
+            assert line_data.loc['line', 'loading_max'] == pytest.approx(
+                s_line.max() / 2.)
+            assert line_data.loc['line', 'overloading'] == 0
+
+        with pytest.raises(ValueError):
+            run_timeseries_powerflow(components, components_data,
+                                     load_profiles, generator_profiles[:1])
+
+    def test_profile_files(self, feeder, tmpdir):
+        """
+        Checks that profiles read from a memory-mapped '.npy' file and from
+        a Parquet file with columns in a different order than the loads give
+        the same results as profiles passed as DataFrames
+        """
+        pytest.importorskip('pyarrow')
+        components, components_data = feeder
+        components['Load'] = pd.DataFrame(
+            {'bus': ['lv', 'mv'], 'p_set': [0.5, 1.5]},
+            index=['load', 'load_2'])
+        components_data['Load'] = pd.DataFrame(
+            {'p_set': [[0.5, 0.05], [1.5, 0.1]],
+             'q_set': [[0.1, 0.01], [0.5, 0.]]},
+            index=['load', 'load_2'])
+        load_profiles = pd.DataFrame({'load': [1., 0.1, 0.5],
+                                      'load_2': [0.2, 0.05, 1.]})
+        generator_profiles = pd.DataFrame({'gen': [0.05, 1., 0.3]})
+        expected = run_timeseries_powerflow(
+            components, components_data, load_profiles, generator_profiles,
+            chunk_size=2)
+
+        path = str(tmpdir)
+        np.save(os.path.join(path, 'loads.npy'), load_profiles.to_numpy())
+        np.save(os.path.join(path, 'generators.npy'),
+                generator_profiles.to_numpy())
+        load_profiles[['load_2', 'load']].to_parquet(
+            os.path.join(path, 'loads.parquet'))
+        generator_profiles.to_parquet(
+            os.path.join(path, 'generators.parquet'))
+
+        for extension in ['npy', 'parquet']:
+            results = run_timeseries_powerflow(
+                components, components_data,
+                os.path.join(path, 'loads.' + extension),
+                os.path.join(path, 'generators.' + extension), chunk_size=2)
+            assert results.n_snapshots == 3
+            pd.testing.assert_frame_equal(results.bus_data(),
+                                          expected.bus_data())
+            pd.testing.assert_frame_equal(results.line_data(),
+                                          expected.line_data())
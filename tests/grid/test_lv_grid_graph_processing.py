@@ -0,0 +1,134 @@
+import pytest
+import numpy as np
+import networkx as nx
+import pandas as pd
+from shapely.geometry import LineString, Point
+
+from ding0.config.config_lv_grids_osm import get_config_osm
+from ding0.grid.lv_grid.graph_processing import (
+    build_graph_from_ways, buffer_poly_index, create_buffer_polygons,
+    graph_nodes_outside_buffer_polys, interpolate_segments,
+    subdivide_graph_edges, truncate_graph_nodes)
+
+
+class TestBuildGraphFromWays(object):
+
+    def test_build_graph_from_ways(self):
+        """
+        Checks graph against undirected graph built segment by segment and
+        converted to a directed graph
+        """
+        ways = pd.DataFrame(
+            [(11, [1, 2, 3], np.array([[0., 0.], [1., 0.], [1., 1.]]), 'a',
+              [1., 1.]),
+             (12, [3, 2, 4, 4], np.array([[1., 1.], [1., 0.], [2., 0.],
+                                          [2., 0.]]), 'b', [2., 1., 0.]),
+             (13, [5, 1], np.array([[0., 5.], [0., 0.]]), 'c', [5.])],
+            columns=['osm_id', 'nodes', 'geometry', 'highway',
+                     'length_segments'])
+        graph = build_graph_from_ways(ways)
+
+        expected = nx.MultiGraph()
+        for osm_id, nodes, geometry, highway, length_segments \
+                in ways.itertuples(index=False):
+            for u, v, length in zip(nodes[:-1], nodes[1:], length_segments):
+                expected.add_edge(u, v, length=length, osmid=osm_id,
+                                  highway=highway)
+            for node, (x, y) in zip(nodes, geometry):
+                expected.add_node(node, x=x, y=y, node_type='non_synthetic')
+        expected = expected.to_directed()
+
+        assert graph.graph['source'] == 'osm'
+        assert list(graph.nodes(data=True)) == list(
+            expected.nodes(data=True))
+        assert list(graph.edges(keys=True, data=True)) == list(
+            expected.edges(keys=True, data=True))
+        # parallel segments between 2 and 3, self loop of 4 added once
+        assert graph.number_of_edges(2, 3) == 2
+        assert graph.number_of_edges(4, 4) == 1
+
+
+class TestBufferPolygons(object):
+
+    def test_graph_nodes_outside_buffer_polys(self):
+        """
+        Checks classification of way nodes against containment in every
+        buffer polygon and truncation of the graph
+        """
+        buffer_poly_list = create_buffer_polygons(Point(0., 0.).buffer(100.))
+        x = np.linspace(0., 250., 26)
+        index = buffer_poly_index(x, np.zeros(len(x)), buffer_poly_list)
+        assert index.tolist() == [
+            min([poly_idx for poly_idx, poly in enumerate(buffer_poly_list)
+                 if poly.contains(Point(x_i, 0.))] + [len(buffer_poly_list)])
+            for x_i in x]
+
+        ways = pd.DataFrame(
+            [(1, [1, 2, 3], np.array([[0., 0.], [120., 0.], [180., 0.]]), 'a',
+              [120., 60.]),
+             (2, [3, 4], np.array([[180., 0.], [180., 500.]]), 'a', [500.])],
+            columns=['osm_id', 'nodes', 'geometry', 'highway',
+                     'length_segments'])
+        graph = build_graph_from_ways(ways)
+        nested_node_list = graph_nodes_outside_buffer_polys(
+            graph, ways, buffer_poly_list)
+        assert nested_node_list == [[2, 3, 4], [2, 3, 4], [3, 4], [3, 4],
+                                    [4]]
+
+        truncated = truncate_graph_nodes(graph, nested_node_list, 2)
+        assert list(truncated.nodes) == [1, 2]
+        assert nx.is_frozen(truncated)
+        graph.add_edge(1, 2, key=1)
+        assert truncated.number_of_edges(1, 2) == 2
+
+
+class TestSubdivideGraphEdges(object):
+
+    def test_interpolate_segments(self):
+        """
+        Checks points interpolated at once against interpolation of every
+        segment by osmnx
+        """
+        ox = pytest.importorskip('osmnx')
+        rng = np.random.default_rng(0)
+        start = rng.random((100, 2)) * 1000. + [4321000., 3210000.]
+        end = start + (rng.random((100, 2)) - 0.5) * 200.
+        end[0] = start[0]
+        points, parts = interpolate_segments(start, end, 20.)
+
+        assert len(points) == (parts + 1).sum()
+        position = 0
+        for p0, p1, n_parts in zip(start, end, parts):
+            expected = list(ox.utils_geo.interpolate_points(
+                LineString([p0, p1]), 20.))
+            assert len(expected) == n_parts + 1
+            assert points[position:position + n_parts + 1].tolist() == [
+                list(point) for point in expected]
+            position += n_parts + 1
+
+    def test_subdivide_graph_edges(self):
+        dist = get_config_osm('dist_edge_segments')
+        graph = nx.MultiDiGraph(crs='epsg:3035')
+        graph.add_node(1, x=0., y=0.)
+        graph.add_node(2, x=3.2 * dist, y=0.)
+        graph.add_node(3, x=0., y=0.5 * dist)
+        for u, v in [(1, 2), (2, 1), (1, 3)]:
+            graph.add_edge(u, v, highway='residential', osmid=u * 10 + v)
+
+        graph_subdiv = subdivide_graph_edges(graph)
+
+        # 1-2 is split into 3 parts, 1-3 is kept, both in both directions
+        synthetic_nodes = [301, 302]
+        assert list(graph_subdiv.nodes) == [1, 2, 3] + synthetic_nodes
+        assert [graph_subdiv.nodes[node]['x'] for node in synthetic_nodes] \
+            == pytest.approx([3.2 * dist / 3, 3.2 * dist * 2 / 3])
+        assert all(graph_subdiv.nodes[node]['node_type'] == 'synthetic'
+                   for node in synthetic_nodes)
+        assert sorted(graph_subdiv.edges()) == sorted(
+            [(1, 301), (301, 1), (301, 302), (302, 301), (302, 2), (2, 302),
+             (1, 3), (3, 1)])
+        for u, v, data in graph_subdiv.edges(data=True):
+            assert data['length'] == pytest.approx(data['geometry'].length)
+            assert data['osmid'] == (12 if 3 not in (u, v) else 13)
+
+        assert len(subdivide_graph_edges(nx.MultiDiGraph())) == 0
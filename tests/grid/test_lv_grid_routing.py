@@ -0,0 +1,82 @@
+import pytest
+import numpy as np
+import networkx as nx
+import pandas as pd
+from shapely.geometry import Point
+
+from ding0.grid.lv_grid.routing import (assign_nearest_nodes_to_buildings,
+                                        node_tree, NodeTree)
+
+
+class TestNodeTree(object):
+
+    @pytest.fixture
+    def street_graph(self):
+        """
+        Returns a projected street graph with nodes on a 10 m grid
+        """
+        graph = nx.MultiDiGraph(crs='epsg:3035')
+        for i in range(5):
+            for j in range(4):
+                graph.add_node(100 * i + j, x=10. * i, y=10. * j)
+        return graph
+
+    def test_nearest_nodes(self, street_graph):
+        """
+        Checks nearest nodes against brute force search, also excluding
+        nodes and within a subset of nodes
+        """
+        pytest.importorskip('scipy')
+        tree = node_tree(street_graph)
+        assert node_tree(street_graph) is tree
+
+        rng = np.random.default_rng(0)
+        xy = rng.random((50, 2)) * 45.
+        exclude = {0, 101, 202, 303}
+        nodes = list(street_graph.nodes)
+        coords = np.array([(street_graph.nodes[node]['x'],
+                            street_graph.nodes[node]['y'])
+                           for node in nodes])
+        for x, y in xy:
+            dist = np.hypot(coords[:, 0] - x, coords[:, 1] - y)
+            assert tree.nearest_nodes(x, y) == nodes[dist.argmin()]
+            dist_excluded = np.where(
+                [node in exclude for node in nodes], np.inf, dist)
+            nn, nn_dist = tree.nearest_nodes(x, y, exclude=exclude,
+                                             return_dist=True)
+            assert nn == nodes[dist_excluded.argmin()]
+            assert nn_dist == pytest.approx(dist_excluded.min())
+
+        # nodes (0, 0) and (40, 30) are searched only
+        subset_tree = NodeTree(street_graph, nodes=[0, 403])
+        assert subset_tree.nearest_nodes(xy[:, 0], xy[:, 1]) == [
+            0 if np.hypot(x, y) < np.hypot(x - 40., y - 30.) else 403
+            for x, y in xy]
+        with pytest.raises(ValueError):
+            subset_tree.nearest_nodes(0., 0., exclude={0, 403})
+
+        # tree follows added nodes
+        street_graph.add_node(1000, x=100., y=100.)
+        assert node_tree(street_graph).nearest_nodes(99., 99.) == 1000
+
+        # tree follows replaced nodes of the same number
+        tree = node_tree(street_graph)
+        street_graph.remove_node(1000)
+        street_graph.add_node(1001, x=-100., y=-100.)
+        assert node_tree(street_graph) is not tree
+        assert node_tree(street_graph).nearest_nodes(99., 99.) == 403
+        assert node_tree(street_graph).nearest_nodes(-99., -99.) == 1001
+        assert node_tree(street_graph) is node_tree(street_graph)
+
+    def test_assign_nearest_nodes_to_buildings(self, street_graph):
+        pytest.importorskip('scipy')
+        buildings = pd.DataFrame(
+            {'geometry': [Point(1., 2.), Point(38., 29.), Point(21., 12.)]},
+            index=[7, 8, 9])
+        buildings = assign_nearest_nodes_to_buildings(street_graph, buildings)
+
+        assert buildings.nn.tolist() == [0, 403, 201]
+        assert buildings.nn_dist.tolist() == pytest.approx(
+            [np.hypot(1., 2.), np.hypot(2., 1.), np.hypot(1., 2.)])
+        assert [point.coords[0] for point in buildings.nn_coords] == [
+            (0., 0.), (40., 30.), (20., 10.)]
@@ -0,0 +1,21 @@
+import pytest
+
+from ding0.grid.mv_grid.util.util import calc_half_ring_differences
+
+
+class TestCircuitBreakerPosition(object):
+
+    def test_calc_half_ring_differences(self):
+        """
+        Checks differences of half-rings derived from prefix sums against
+        sums of both half-rings at every position
+        """
+        node_data = [120., 0., 35.5, 410., 0., 77.25, 3.]
+        diffs = calc_half_ring_differences(node_data)
+
+        assert len(diffs) == len(node_data) + 1
+        for position, diff in enumerate(diffs):
+            assert diff == pytest.approx(
+                abs(sum(node_data[0:position]) -
+                    sum(node_data[position:len(node_data)])))
+        assert calc_half_ring_differences([]) == [0]
@@ -0,0 +1,67 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+# budget for the cumulative import time of a module in seconds, may be
+# raised on slow CI runners via DING0_IMPORT_TIME_BUDGET
+IMPORT_TIME_BUDGET = float(os.environ.get('DING0_IMPORT_TIME_BUDGET', 5.))
+
+# heavy dependencies that are loaded on first use only
+DEFERRED_PACKAGES = {'psycopg2', 'pypsa', 'matplotlib', 'seaborn',
+                     'contextily', 'osmnx', 'geopandas', 'sklearn',
+                     'pymetis', 'egoio', 'requests'}
+
+
+def import_time(module):
+    """
+    Imports `module` in a fresh interpreter with ``-X importtime``
+
+    Returns
+    -------
+    :obj:`dict`
+        Cumulative import time in seconds keyed by the names of all
+        modules that were imported
+    """
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import ' + module],
+        stderr=subprocess.PIPE, universal_newlines=True, check=True)
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative) / 1e6
+    return times
+
+
+@pytest.mark.parametrize('module', [
+    'ding0',
+    'ding0.core',
+    'ding0.tools.results',
+])
+def test_import_time(module):
+    """
+    Checks that importing ding0 does not load heavy dependencies and stays
+    within the import time budget
+    """
+    times = import_time(module)
+    loaded = {name.split('.')[0] for name in times}
+    assert not loaded & DEFERRED_PACKAGES
+    assert times[module] < IMPORT_TIME_BUDGET
+
+
+@pytest.mark.parametrize('module', [
+    'ding0.grid.lv_grid.graph_processing',
+    'ding0.grid.lv_grid.routing',
+    'ding0.grid.lv_grid.clustering',
+])
+def test_lv_graph_processing_imports(module):
+    """
+    Checks that a worker running the LV graph processing only does not
+    import the power flow and plotting stack
+    """
+    loaded = {name.split('.')[0] for name in import_time(module)}
+    assert not loaded & {'pypsa', 'matplotlib', 'seaborn', 'psycopg2'}
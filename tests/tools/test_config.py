@@ -0,0 +1,66 @@
+import configparser as cp
+
+import pytest
+
+from ding0.tools import config as cfg_ding0
+
+
+class TestConfigSnapshot(object):
+
+    @pytest.fixture
+    def config(self):
+        """
+        Loads the calculation config and restores the modified option
+        after the test
+        """
+        cfg_ding0.load_config('config_calc.cfg')
+        cos_phi_load = cfg_ding0.cfg.get('assumptions', 'cos_phi_load')
+        yield cfg_ding0
+        cfg_ding0.set('assumptions', 'cos_phi_load', cos_phi_load)
+
+    def test_snapshot_matches_get(self, config):
+        """
+        Checks that every value of the snapshot equals the value returned
+        by :func:`get` including its type
+        """
+        snapshot = config.snapshot()
+        for section in config.cfg.sections():
+            for key in config.cfg.options(section):
+                value = config._cast(section, key)
+                assert snapshot[section][key] == value
+                assert type(snapshot[section][key]) is type(value)
+                assert type(config.get(section, key)) is type(value)
+
+    def test_snapshot_attribute_access(self, config):
+        snapshot = config.snapshot()
+        assert snapshot.assumptions.cos_phi_load == 0.97
+        assert snapshot.mv_routing.conn_diff_tolerance == 0.0001
+        assert 'assumptions' in snapshot
+        assert 'cos_phi_load' in snapshot.assumptions
+
+    def test_snapshot_is_cached(self, config):
+        assert config.snapshot() is config.snapshot()
+
+    def test_snapshot_is_read_only(self, config):
+        snapshot = config.snapshot()
+        with pytest.raises(AttributeError):
+            snapshot.assumptions.cos_phi_load = 1.
+        with pytest.raises(AttributeError):
+            snapshot.assumptions = None
+
+    def test_set_invalidates_snapshot(self, config):
+        snapshot = config.snapshot()
+        config.set('assumptions', 'cos_phi_load', '0.9')
+        assert config.snapshot() is not snapshot
+        assert config.snapshot().assumptions.cos_phi_load == 0.9
+        assert config.get('assumptions', 'cos_phi_load') == 0.9
+
+    def test_unknown_keys_raise_configparser_errors(self, config):
+        with pytest.raises(cp.NoSectionError):
+            config.get('not_a_section', 'cos_phi_load')
+        with pytest.raises(cp.NoOptionError):
+            config.get('assumptions', 'not_an_option')
+        with pytest.raises(cp.NoSectionError):
+            config.snapshot()['not_a_section']
+        with pytest.raises(cp.NoOptionError):
+            config.snapshot().assumptions['not_an_option']
@@ -0,0 +1,101 @@
+import pickle
+
+import pandas as pd
+import pytest
+
+from ding0.core.network import BranchDing0
+from ding0.tools import config as cfg_ding0
+from ding0.tools.equipment import (EquipmentType, equipment_type,
+                                   load_static_data, sorted_equipment)
+
+
+class TestEquipment(object):
+
+    @pytest.fixture
+    def static_data(self):
+        cfg_ding0.load_config('config_files.cfg')
+        return load_static_data()
+
+    def test_static_data_is_cached(self, static_data):
+        static_data_2 = load_static_data()
+        assert static_data is not static_data_2
+        for name, table in static_data.items():
+            assert static_data_2[name] is table
+
+    def test_static_data_types(self, static_data):
+        assert static_data['LV_cables'].index.name == 'name'
+        assert static_data['LV_cables']['I_max_th'].dtype == int
+        assert static_data['MV_cables']['U_n'].dtype == int
+        assert static_data['MV_trafos']['S_nom'].dtype == int
+        assert static_data['LV_model_grids_strings_per_grid'].index.dtype == int
+        assert {'r_pu', 'x_pu'} <= set(static_data['LV_trafos'].columns)
+
+    @pytest.mark.parametrize('name, rating, filters', [
+        ('LV_cables', 'I_max_th', {}),
+        ('LV_trafos', 'S_nom', {}),
+        ('MV_trafos', 'S_nom', {}),
+        ('MV_cables', 'I_max_th', {'U_n': 10}),
+        ('MV_cables', 'I_max_th', {'U_n': 20}),
+    ])
+    def test_select(self, static_data, name, rating, filters):
+        """
+        Checks that binary search selects the same equipment as filtering
+        the table
+        """
+        table = static_data[name]
+        for column, value in filters.items():
+            table = table[table[column] == value]
+        equipment = sorted_equipment(static_data[name], rating, **filters)
+        assert sorted_equipment(static_data[name], rating, **filters) is \
+            equipment
+
+        factor = 0.7
+        values = sorted(set(table[rating] * factor))
+        values = values + [v - 1 for v in values] + [v + 1 for v in values]
+        for value in values:
+            suitable = table[table[rating] * factor > value]
+            selected = equipment.select(value, factor=factor)
+            if len(suitable):
+                pd.testing.assert_series_equal(
+                    selected, table.loc[suitable[rating].idxmin()])
+            else:
+                assert selected is None
+
+            suitable = table[table[rating] >= value]
+            selected = equipment.select(value, inclusive=True)
+            if len(suitable):
+                pd.testing.assert_series_equal(
+                    selected, table.loc[suitable[rating].idxmin()])
+            else:
+                assert selected is None
+
+        assert equipment.largest()[rating] == table[rating].max()
+        assert equipment.smallest()[rating] == table[rating].min()
+
+    def test_equipment_type(self, static_data):
+        """
+        Checks that equipment types are shared by branches and read like
+        rows of the equipment tables
+        """
+        for name in ['LV_cables', 'MV_cables']:
+            row = static_data[name].iloc[2]
+            branch1 = BranchDing0(type=row)
+            branch2 = BranchDing0()
+            branch2.type = static_data[name].iloc[2]
+
+            assert isinstance(branch1.type, EquipmentType)
+            assert branch2.type is branch1.type
+            assert equipment_type(branch1.type) is branch1.type
+            assert branch1.type.name == row.name
+            assert ('name' in branch1.type) == ('name' in row)
+            for column, value in row.items():
+                assert branch1.type[column] == value
+            assert branch1.type.I_max_th == row.I_max_th
+            pd.testing.assert_series_equal(branch1.type.to_series(), row,
+                                           check_dtype=False)
+            assert branch1.type.to_frame().columns[0] == row.name
+            assert pickle.loads(pickle.dumps(branch1.type)) is branch1.type
+            with pytest.raises(AttributeError):
+                branch1.type.I_max_th = 0
+
+        assert BranchDing0().type is None
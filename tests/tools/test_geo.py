@@ -0,0 +1,42 @@
+import numpy as np
+from shapely.geometry import LineString, Point, Polygon
+from shapely.ops import transform
+
+from ding0.tools.geo import get_crs_transformer, transform_geometries
+
+
+class TestTransformGeometries(object):
+
+    def test_transform_geometries(self):
+        """
+        Checks that geometries transformed at once equal geometries
+        transformed one by one
+        """
+        transformer = get_crs_transformer('EPSG:3035', 'EPSG:4326')
+        assert transformer is get_crs_transformer('EPSG:3035', 'EPSG:4326')
+
+        geometries = [LineString([(4321000, 3210000), (4322000, 3211000),
+                                  (4323000, 3210500)]),
+                      None,
+                      Point(4321500, 3210200),
+                      LineString(),
+                      Polygon([(4321000, 3210000), (4322000, 3210000),
+                               (4322000, 3211000)]),
+                      LineString([(4320000, 3200000), (4321000, 3201000)])]
+        transformed = transform_geometries(geometries, transformer)
+
+        assert len(transformed) == len(geometries)
+        assert transformed[1] is None
+        assert transformed[3].is_empty
+        for geom, geom_transformed in zip(geometries, transformed):
+            if geom is None or geom.is_empty:
+                continue
+            expected = transform(transformer.transform, geom)
+            assert type(geom_transformed) is type(expected)
+            np.testing.assert_allclose(
+                np.asarray(geom_transformed.exterior.coords
+                           if isinstance(geom, Polygon)
+                           else geom_transformed.coords),
+                np.asarray(expected.exterior.coords
+                           if isinstance(geom, Polygon)
+                           else expected.coords))
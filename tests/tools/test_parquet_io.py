@@ -0,0 +1,86 @@
+import os
+
+import pandas as pd
+import pytest
+from shapely.geometry import LineString, Polygon
+
+from ding0.tools import parquet_io
+
+pytest.importorskip('pyarrow')
+
+
+def components(mv_grid_district):
+    """
+    Returns components of a grid district as exported by
+    :func:`~.ding0.tools.pypsa_io.fill_mvgd_component_dataframes`
+    """
+    empty = pd.DataFrame(columns=['bus0', 'bus1']).rename_axis('name')
+    line = LineString([(mv_grid_district, 0), (mv_grid_district, 1)])
+    return {
+        'Network': pd.DataFrame(
+            {'srid': ['3035'],
+             'mv_grid_district_geom': [Polygon([(0, 0), (1, 0), (1, 1)])]},
+            index=pd.Index([mv_grid_district], name='name')),
+        'Grids': pd.DataFrame({'area': [1.]},
+                              index=pd.Index(['mvgd_1'], name='name')),
+        'HVMV_Transformer': empty,
+        'Transformer': empty,
+        'Bus': pd.DataFrame({'x': [0., 1.], 'v_nom': [20, 20],
+                             'in_building': [False, True]},
+                            index=['bus_1', 'bus_2']),
+        'Line': pd.DataFrame({'bus0': ['bus_1'], 'bus1': ['bus_2'],
+                              'num_parallel': [1], 'geometry': [line]},
+                             index=pd.Index(['line_1'], name='name')),
+        'Load': pd.DataFrame(
+            {'bus': ['bus_2'], 'p_set': [0.1], 'building_id': [None]},
+            index=pd.Index(['load_1'], name='name')),
+        'Generator': pd.DataFrame(
+            {'bus': ['bus_1', 'bus_2'], 'weather_cell_id': [7, None]},
+            index=pd.Index(['gen_1', 'gen_2'], name='name')),
+        'Switch': empty}
+
+
+class TestParquetIO(object):
+
+    def test_write_read(self, tmpdir):
+        """
+        Checks that grid districts are appended to the datasets and that
+        values and geometries of a single district are read back
+        """
+        path = str(tmpdir)
+        for mv_grid_district in [1, 2]:
+            parquet_io.write_mv_grid_district(path, mv_grid_district,
+                                              components(mv_grid_district))
+        assert os.path.exists(os.path.join(
+            path, 'lines', 'mv_grid_district=2', 'part-0.parquet'))
+
+        data = parquet_io.read_mv_grid_district(path, 2)
+        assert set(data) == set(parquet_io.DATASETS)
+        line = data['lines'].loc['line_1']
+        assert line['geometry'].equals(components(2)['Line'].at['line_1',
+                                                               'geometry'])
+        assert line['num_parallel'] == 1
+        assert list(data['buses'].index) == ['bus_1', 'bus_2']
+        assert list(data['buses']['in_building']) == [False, True]
+        assert data['generators'].at['gen_1', 'weather_cell_id'] == 7
+        assert data['switches'].empty
+
+        # all districts as one dataset, also if columns hold no values in
+        # the district read first
+        without_values = components(0)
+        without_values['Generator']['weather_cell_id'] = [None, None]
+        without_values['Line']['geometry'] = [None]
+        parquet_io.write_mv_grid_district(path, 0, without_values)
+        lines = pd.read_parquet(os.path.join(path, 'lines'))
+        lines = lines.sort_values(parquet_io.PARTITION_COLUMN)
+        assert lines[parquet_io.PARTITION_COLUMN].astype(int).tolist() == [
+            0, 1, 2]
+        assert lines['geometry'].isna().tolist() == [True, False, False]
+        generators = pd.read_parquet(os.path.join(path, 'generators'))
+        assert generators['weather_cell_id'].dtype == float
+        assert generators['weather_cell_id'].isna().sum() == 4
+        assert parquet_io.read_mv_grid_district(path, 0)['lines'].at[
+            'line_1', 'geometry'] is None
+
+        with pytest.raises(FileNotFoundError):
+            parquet_io.read_mv_grid_district(path, 3)
@@ -0,0 +1,70 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+from shapely.geometry import LineString
+
+from ding0.tools.pypsa_io import ComponentTable, process_pf_results
+
+
+class TestComponentTable(object):
+
+    def test_to_dataframe(self):
+        """
+        Checks columns, values and types of the created DataFrame
+        """
+        table = ComponentTable(pd.DataFrame(columns=['name', 'bus', 'p_set']))
+        table.append({'name': 'load_1', 'bus': 'bus_1', 'p_set': 0.1})
+        table.append({'name': 'load_2', 'bus': 'bus_1', 'p_set': 0.2,
+                      'building_id': 7})
+        assert len(table) == 2
+        assert 'load_2' in table
+        assert 'bus_1' not in table
+
+        df = table.to_dataframe()
+        assert list(df.columns) == ['name', 'bus', 'p_set', 'building_id']
+        assert list(df['p_set']) == [0.1, 0.2]
+        assert np.isnan(df.at[0, 'building_id'])
+        assert df.at[1, 'building_id'] == 7
+
+    def test_list_like_values(self):
+        """
+        Checks that lists and geometries are kept as single values
+        """
+        table = ComponentTable(pd.DataFrame(columns=['name', 'p_set',
+                                                     'geometry']))
+        lines = [LineString([(0, 0), (1, 1)]), LineString([(1, 1), (2, 2)])]
+        for i, line in enumerate(lines):
+            table.append({'name': i, 'p_set': [0.1, 0.2], 'geometry': line})
+
+        df = table.to_dataframe()
+        assert df.shape == (2, 3)
+        assert df.at[1, 'p_set'] == [0.1, 0.2]
+        assert df.at[1, 'geometry'].equals(lines[1])
+
+    def test_empty(self):
+        columns = ['name', 'bus0', 'bus1']
+        df = ComponentTable(pd.DataFrame(columns=columns)).to_dataframe()
+        assert df.empty
+        assert list(df.columns) == columns
+
+
+def test_process_pf_results():
+    """
+    Checks that results of all snapshots are collected per bus and line
+    """
+    snapshots = pd.date_range('1970-01-01', periods=2, freq='H')
+    v_mag_pu = pd.DataFrame({'bus_1': [1., 0.98], 'bus_2': [1.01, 0.97]},
+                            index=snapshots)
+    lines_t = {attr: pd.DataFrame({'line_1': [value, -value]},
+                                  index=snapshots)
+               for value, attr in enumerate(['p0', 'p1', 'q0', 'q1'])}
+    network = SimpleNamespace(buses_t=SimpleNamespace(v_mag_pu=v_mag_pu),
+                              lines_t=SimpleNamespace(**lines_t))
+
+    bus_data, line_data = process_pf_results(network)
+    assert bus_data.index.name == 'bus_id'
+    assert bus_data.loc['bus_2', 'v_mag_pu'] == [1.01, 0.97]
+    assert line_data.index.name == 'line_id'
+    assert list(line_data.columns) == ['p0', 'p1', 'q0', 'q1']
+    assert line_data.loc['line_1', 'q1'] == [3., -3.]